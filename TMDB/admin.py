@@ -1,10 +1,14 @@
 from django.contrib import admin
-from TMDB.models import Movie, TMDBSyncQueue
+from TMDB.models import Language, Movie, TMDBSyncQueue
 
 
 @admin.register(Movie)
 class MovieAdmin(admin.ModelAdmin[Movie]):
+    # icontains, also behind the subtitle admin's movie autocomplete. Its
+    # UPPER() LIKE is served by movie_orig_title_upper_trgm_idx
     search_fields = ["original_title"]
+    list_select_related = ["language"]
 
 
+admin.site.register(Language)
 admin.site.register(TMDBSyncQueue)
@@ -18,6 +18,11 @@ class Command(BaseCommand):
             default=100,
             help="Maximum movies to sync (0 for unlimited)",
         )
+        parser.add_argument(
+            "--bulk-copy",
+            action="store_true",
+            help="Load movies in COPY batches (for large backfills)",
+        )
 
     def handle(self, *args, **options) -> None:  # type: ignore
         year: Optional[int] = options["year"]
@@ -25,6 +30,7 @@ class Command(BaseCommand):
         end_year: Optional[int] = options["end_year"]
         language: str = options["language"]
         max_results: int = options["max_results"]
+        bulk_copy: bool = options["bulk_copy"]
 
         def sync_command(max_results: Optional[int]) -> None:
             # hack to make mypy happy
@@ -35,7 +41,10 @@ class Command(BaseCommand):
 
         if year:
             job_id = enqueue_year_sync(
-                year=year, language=language, max_results=max_results
+                year=year,
+                language=language,
+                max_results=max_results,
+                bulk_copy=bulk_copy,
             )
             self.stdout.write(
                 self.style.SUCCESS(f"Queued sync job {job_id} for year {year}")
@@ -47,6 +56,7 @@ class Command(BaseCommand):
                 end_year=end_year,
                 language=language,
                 max_results=max_results,
+                bulk_copy=bulk_copy,
             )
             self.stdout.write(
                 self.style.SUCCESS(
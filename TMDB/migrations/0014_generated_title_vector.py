@@ -0,0 +1,61 @@
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """
+    Replace the PL/pgSQL trigger maintaining title_vector with a STORED
+    generated column, so writes no longer pay a trigger call per row.
+    """
+
+    dependencies = [
+        ("TMDB", "0013_alter_movie_author"),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql="""
+               DROP TRIGGER IF EXISTS title_vector_update ON "TMDB_movie";
+               DROP FUNCTION IF EXISTS update_title_vector_trigger();
+               """,
+            reverse_sql="""
+               CREATE OR REPLACE FUNCTION update_title_vector_trigger() RETURNS trigger AS $$
+               BEGIN
+                   NEW.title_vector := to_tsvector('english', NEW.title);
+                   RETURN NEW;
+               END;
+               $$ LANGUAGE plpgsql;
+
+               CREATE TRIGGER title_vector_update
+                   BEFORE INSERT OR UPDATE ON "TMDB_movie"
+                   FOR EACH ROW
+                   EXECUTE FUNCTION update_title_vector_trigger();
+
+               UPDATE "TMDB_movie" SET title_vector = to_tsvector('english', title);
+               CREATE INDEX IF NOT EXISTS title_vector_idx ON "TMDB_movie" USING gin(title_vector);
+               """,
+        ),
+        # Dropping the column also drops the GIN index created in 0011
+        migrations.RemoveField(
+            model_name="movie",
+            name="title_vector",
+        ),
+        migrations.AddField(
+            model_name="movie",
+            name="title_vector",
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=django.contrib.postgres.search.SearchVector(
+                    "title", config="english"
+                ),
+                output_field=django.contrib.postgres.search.SearchVectorField(),
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="movie",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["title_vector"], name="title_vector_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,22 @@
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations
+from django.db.models.functions import Lower
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("TMDB", "0014_generated_title_vector"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="movie",
+            index=GinIndex(
+                OpClass(Lower("title"), name="gin_trgm_ops"),
+                name="movie_title_lower_trgm_idx",
+            ),
+        ),
+    ]
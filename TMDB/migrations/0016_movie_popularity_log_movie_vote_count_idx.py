@@ -0,0 +1,31 @@
+import django.db.models.functions.comparison
+import django.db.models.functions.math
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("TMDB", "0015_movie_title_lower_trgm_idx"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="movie",
+            name="popularity_log",
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=django.db.models.functions.math.Ln(
+                    django.db.models.functions.comparison.Greatest(
+                        "vote_count", models.Value(1)
+                    )
+                    + models.Value(1.0)
+                ),
+                output_field=models.FloatField(),
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="movie",
+            index=models.Index(fields=["-vote_count"], name="movie_vote_count_idx"),
+        ),
+    ]
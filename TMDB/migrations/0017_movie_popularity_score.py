@@ -0,0 +1,39 @@
+import django.db.models.functions.comparison
+import django.db.models.functions.math
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("TMDB", "0016_movie_popularity_log_movie_vote_count_idx"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="movie",
+            name="popularity_score",
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=django.db.models.functions.math.Ln(
+                    django.db.models.functions.comparison.Greatest(
+                        "vote_count", models.Value(1)
+                    )
+                    + models.Value(1.0)
+                )
+                / django.db.models.functions.math.Ln(models.Value(100000.0)),
+                output_field=models.FloatField(),
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="movie",
+            index=models.Index(
+                fields=["-popularity_score"], name="movie_popularity_idx"
+            ),
+        ),
+        # Superseded by popularity_score, which only differs by a constant factor
+        migrations.RemoveField(
+            model_name="movie",
+            name="popularity_log",
+        ),
+    ]
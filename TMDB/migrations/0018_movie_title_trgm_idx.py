@@ -0,0 +1,22 @@
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("TMDB", "0017_movie_popularity_score"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="movie",
+            index=GinIndex(
+                fields=["title"],
+                name="movie_title_trgm_idx",
+                opclasses=["gin_trgm_ops"],
+            ),
+        ),
+    ]
@@ -0,0 +1,29 @@
+import django.db.models.functions.comparison
+import django.db.models.functions.datetime
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("TMDB", "0018_movie_title_trgm_idx"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="movie",
+            name="release_year",
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=django.db.models.functions.comparison.Cast(
+                    django.db.models.functions.datetime.ExtractYear("release_date"),
+                    models.SmallIntegerField(),
+                ),
+                output_field=models.SmallIntegerField(),
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="movie",
+            index=models.Index(fields=["release_year"], name="movie_release_year_idx"),
+        ),
+    ]
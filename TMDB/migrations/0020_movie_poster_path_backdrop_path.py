@@ -0,0 +1,44 @@
+from django.db import migrations, models
+
+IMAGE_BASE_URL = "https://image.tmdb.org/t/p/original"
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("TMDB", "0019_movie_release_year"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="movie",
+            name="poster_path",
+            field=models.CharField(max_length=64, null=True),
+        ),
+        migrations.AddField(
+            model_name="movie",
+            name="backdrop_path",
+            field=models.CharField(max_length=64, null=True),
+        ),
+        # Keep only the part after the TMDB image base URL
+        migrations.RunSQL(
+            sql=f"""
+                UPDATE "TMDB_movie" SET
+                    poster_path = substr(poster_url, length('{IMAGE_BASE_URL}') + 1),
+                    backdrop_path = substr(backdrop_url, length('{IMAGE_BASE_URL}') + 1);
+            """,
+            reverse_sql=f"""
+                UPDATE "TMDB_movie" SET
+                    poster_url = '{IMAGE_BASE_URL}' || poster_path,
+                    backdrop_url = '{IMAGE_BASE_URL}' || backdrop_path;
+            """,
+        ),
+        migrations.RemoveField(
+            model_name="movie",
+            name="poster_url",
+        ),
+        migrations.RemoveField(
+            model_name="movie",
+            name="backdrop_url",
+        ),
+    ]
@@ -0,0 +1,104 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("TMDB", "0020_movie_poster_path_backdrop_path"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Language",
+            fields=[
+                ("id", models.SmallAutoField(primary_key=True, serialize=False)),
+                ("code", models.CharField(max_length=10, unique=True)),
+            ],
+        ),
+        migrations.RenameField(
+            model_name="movie",
+            old_name="language",
+            new_name="language_code",
+        ),
+        migrations.RenameField(
+            model_name="movie",
+            old_name="original_language",
+            new_name="original_language_code",
+        ),
+        migrations.AddField(
+            model_name="movie",
+            name="language",
+            field=models.ForeignKey(
+                null=True,
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name="+",
+                to="TMDB.language",
+            ),
+        ),
+        migrations.AddField(
+            model_name="movie",
+            name="original_language",
+            field=models.ForeignKey(
+                null=True,
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name="+",
+                to="TMDB.language",
+            ),
+        ),
+        migrations.RunSQL(
+            sql="""
+                INSERT INTO "TMDB_language" (code)
+                SELECT language_code FROM "TMDB_movie"
+                UNION
+                SELECT original_language_code FROM "TMDB_movie";
+
+                UPDATE "TMDB_movie" m SET
+                    language_id = l.id
+                FROM "TMDB_language" l
+                WHERE l.code = m.language_code;
+
+                UPDATE "TMDB_movie" m SET
+                    original_language_id = l.id
+                FROM "TMDB_language" l
+                WHERE l.code = m.original_language_code;
+            """,
+            reverse_sql="""
+                UPDATE "TMDB_movie" m SET
+                    language_code = l.code
+                FROM "TMDB_language" l
+                WHERE l.id = m.language_id;
+
+                UPDATE "TMDB_movie" m SET
+                    original_language_code = l.code
+                FROM "TMDB_language" l
+                WHERE l.id = m.original_language_id;
+            """,
+        ),
+        migrations.AlterField(
+            model_name="movie",
+            name="language",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name="+",
+                to="TMDB.language",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="movie",
+            name="original_language",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name="+",
+                to="TMDB.language",
+            ),
+        ),
+        migrations.RemoveField(
+            model_name="movie",
+            name="language_code",
+        ),
+        migrations.RemoveField(
+            model_name="movie",
+            name="original_language_code",
+        ),
+    ]
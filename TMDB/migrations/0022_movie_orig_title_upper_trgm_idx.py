@@ -0,0 +1,25 @@
+import django.db.models.functions.text
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("TMDB", "0021_language_movie_language_fk"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="movie",
+            index=GinIndex(
+                OpClass(
+                    django.db.models.functions.text.Upper("original_title"),
+                    name="gin_trgm_ops",
+                ),
+                name="movie_orig_title_upper_trgm_idx",
+            ),
+        ),
+    ]
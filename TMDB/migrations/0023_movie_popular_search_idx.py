@@ -0,0 +1,40 @@
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+from django.db.models.functions import Lower
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("TMDB", "0022_movie_orig_title_upper_trgm_idx"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="movie",
+            index=GinIndex(
+                condition=models.Q(vote_count__gte=50),
+                fields=["title_vector"],
+                name="movie_title_vector_popular_idx",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="movie",
+            index=GinIndex(
+                condition=models.Q(vote_count__gte=50),
+                fields=["title"],
+                name="movie_title_trgm_popular_idx",
+                opclasses=["gin_trgm_ops"],
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="movie",
+            index=GinIndex(
+                OpClass(Lower("title"), name="gin_trgm_ops"),
+                condition=models.Q(vote_count__gte=50),
+                name="movie_title_lower_trgm_popular_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,66 @@
+import TMDB.models
+import django.db.models.functions.text
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.operations import (
+    AddIndexConcurrently,
+    RemoveIndexConcurrently,
+)
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("TMDB", "0023_movie_popular_search_idx"),
+    ]
+
+    operations = [
+        # unaccent() is STABLE because its dictionary is looked up through
+        # search_path. Pinning the dictionary makes it safe to declare IMMUTABLE.
+        migrations.RunSQL(
+            sql="""
+                CREATE OR REPLACE FUNCTION immutable_unaccent(text) RETURNS text
+                AS $$ SELECT public.unaccent('public.unaccent'::regdictionary, $1) $$
+                LANGUAGE sql IMMUTABLE PARALLEL SAFE STRICT;
+            """,
+            reverse_sql="DROP FUNCTION IF EXISTS immutable_unaccent(text);",
+        ),
+        migrations.AddField(
+            model_name="movie",
+            name="title_norm",
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=TMDB.models.ImmutableUnaccent(
+                    django.db.models.functions.text.Lower("title")
+                ),
+                output_field=models.TextField(),
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="movie",
+            index=GinIndex(
+                fields=["title_norm"],
+                name="movie_title_norm_trgm_idx",
+                opclasses=["gin_trgm_ops"],
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="movie",
+            index=GinIndex(
+                condition=models.Q(vote_count__gte=50),
+                fields=["title_norm"],
+                name="movie_title_norm_trgm_popular_idx",
+                opclasses=["gin_trgm_ops"],
+            ),
+        ),
+        # Superseded by the title_norm indexes
+        RemoveIndexConcurrently(
+            model_name="movie",
+            name="movie_title_lower_trgm_idx",
+        ),
+        RemoveIndexConcurrently(
+            model_name="movie",
+            name="movie_title_lower_trgm_popular_idx",
+        ),
+    ]
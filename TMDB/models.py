@@ -1,8 +1,40 @@
 from django.contrib.postgres.fields import ArrayField
-from django.contrib.postgres.search import SearchVectorField
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.search import SearchVector, SearchVectorField
 from django.db import models
+from django.db.models.functions import Cast, ExtractYear, Greatest, Ln, Lower, Upper
 
 from media_index.base_model import TimeStampedUUIDModel
+from TMDB.schema import TMDB_IMAGE_BASE_URL
+
+# Titles with at least this many votes get their own small search indexes
+POPULAR_VOTE_COUNT = 50
+
+
+class ImmutableUnaccent(models.Func):
+    """
+    unaccent() is only STABLE, so generated columns go through the IMMUTABLE
+    wrapper created in migration 0024.
+    """
+
+    function = "immutable_unaccent"
+    output_field = models.TextField()
+
+
+class Language(models.Model):
+    """ISO language code lookup, keeps movie rows to a smallint per language."""
+
+    id = models.SmallAutoField(primary_key=True)
+    code = models.CharField(max_length=10, unique=True)
+
+    @classmethod
+    def get_id(cls, code: str) -> int:
+        """Return the id for a language code, creating the row on first use."""
+        language, _ = cls.objects.get_or_create(code=code)
+        return language.id
+
+    def __str__(self) -> str:
+        return self.code
 
 
 class Movie(TimeStampedUUIDModel):
@@ -10,9 +42,18 @@ class Movie(TimeStampedUUIDModel):
     latest_analysis_id = models.IntegerField(unique=True, null=True)
     title = models.CharField(max_length=255)
     original_title = models.CharField(max_length=255)
-    language = models.CharField(max_length=10)
-    original_language = models.CharField(max_length=10)
+    language = models.ForeignKey(
+        Language, on_delete=models.PROTECT, related_name="+"
+    )
+    original_language = models.ForeignKey(
+        Language, on_delete=models.PROTECT, related_name="+"
+    )
     release_date = models.DateField()
+    release_year = models.GeneratedField(
+        expression=Cast(ExtractYear("release_date"), models.SmallIntegerField()),
+        output_field=models.SmallIntegerField(),
+        db_persist=True,
+    )
     genres = ArrayField(
         models.CharField(max_length=50),
         default=list,
@@ -20,19 +61,86 @@ class Movie(TimeStampedUUIDModel):
     )
     runtime = models.IntegerField(null=True)
     overview = models.TextField()
-    poster_url = models.URLField(max_length=500, null=True)
-    backdrop_url = models.URLField(max_length=500, null=True)
+    # Image paths relative to TMDB_IMAGE_BASE_URL
+    poster_path = models.CharField(max_length=64, null=True)
+    backdrop_path = models.CharField(max_length=64, null=True)
     vote_average = models.DecimalField(max_digits=3, decimal_places=1)
     vote_count = models.IntegerField()
+    # Vote count log-normalized to roughly 0-1 for ranking
+    popularity_score = models.GeneratedField(
+        expression=Ln(Greatest("vote_count", models.Value(1)) + models.Value(1.0))
+        / Ln(models.Value(100000.0)),
+        output_field=models.FloatField(),
+        db_persist=True,
+    )
     difficulty = models.FloatField(default=0.0, null=True)
     author = models.CharField(max_length=500, blank=True)
-    title_vector = SearchVectorField(null=True, editable=False)
+    # Lowercased, unaccented title for diacritic-insensitive trigram matching
+    title_norm = models.GeneratedField(
+        expression=ImmutableUnaccent(Lower("title")),
+        output_field=models.TextField(),
+        db_persist=True,
+    )
+    title_vector = models.GeneratedField(
+        expression=SearchVector("title", config="english"),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
 
     class Meta:
         indexes = [
             models.Index(fields=["tmdb_id"]),
+            models.Index(fields=["-vote_count"], name="movie_vote_count_idx"),
+            models.Index(fields=["-popularity_score"], name="movie_popularity_idx"),
+            models.Index(fields=["release_year"], name="movie_release_year_idx"),
+            GinIndex(fields=["title_vector"], name="title_vector_idx"),
+            GinIndex(
+                fields=["title"],
+                name="movie_title_trgm_idx",
+                opclasses=["gin_trgm_ops"],
+            ),
+            # Serves the admin's icontains, UPPER(original_title) LIKE UPPER(%s)
+            GinIndex(
+                OpClass(Upper("original_title"), name="gin_trgm_ops"),
+                name="movie_orig_title_upper_trgm_idx",
+            ),
+            GinIndex(
+                fields=["title_norm"],
+                name="movie_title_norm_trgm_idx",
+                opclasses=["gin_trgm_ops"],
+            ),
+            # Partial copies covering popular titles, small enough to stay cached
+            GinIndex(
+                fields=["title_vector"],
+                name="movie_title_vector_popular_idx",
+                condition=models.Q(vote_count__gte=POPULAR_VOTE_COUNT),
+            ),
+            GinIndex(
+                fields=["title"],
+                name="movie_title_trgm_popular_idx",
+                opclasses=["gin_trgm_ops"],
+                condition=models.Q(vote_count__gte=POPULAR_VOTE_COUNT),
+            ),
+            GinIndex(
+                fields=["title_norm"],
+                name="movie_title_norm_trgm_popular_idx",
+                opclasses=["gin_trgm_ops"],
+                condition=models.Q(vote_count__gte=POPULAR_VOTE_COUNT),
+            ),
         ]
 
+    @property
+    def poster_url(self) -> str | None:
+        if self.poster_path:
+            return f"{TMDB_IMAGE_BASE_URL}{self.poster_path}"
+        return None
+
+    @property
+    def backdrop_url(self) -> str | None:
+        if self.backdrop_path:
+            return f"{TMDB_IMAGE_BASE_URL}{self.backdrop_path}"
+        return None
+
     def __str__(self) -> str:
         return f"{self.title} - {self.language} ({self.tmdb_id})"
 
@@ -1,10 +1,13 @@
 from ninja import Schema
 from pydantic import BaseModel, Field, ConfigDict, field_validator, model_validator
 from datetime import date, datetime
-from typing import Optional, Any, Self
+from typing import Optional, Any, Self, TypedDict
+
+TMDB_IMAGE_BASE_URL = "https://image.tmdb.org/t/p/original"
 
 
 class TMDBMovieResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
 
     tmdb_id: int = Field(..., alias="id")  # Maps TMDB 'id' to our 'tmdb_id'
     title: str
@@ -23,13 +26,13 @@ class TMDBMovieResponse(BaseModel):
     @property
     def poster_url(self) -> Optional[str]:
         if self.poster_path:
-            return f"https://image.tmdb.org/t/p/original{self.poster_path}"
+            return f"{TMDB_IMAGE_BASE_URL}{self.poster_path}"
         return None
 
     @property
     def backdrop_url(self) -> Optional[str]:
         if self.backdrop_path:
-            return f"https://image.tmdb.org/t/p/original{self.backdrop_path}"
+            return f"{TMDB_IMAGE_BASE_URL}{self.backdrop_path}"
         return None
 
     @field_validator("genres", mode="before")
@@ -62,6 +65,12 @@ class MovieResponse(BaseModel):
     vote_count: int
     original_language: str
 
+    @field_validator("original_language", mode="before")
+    @classmethod
+    def language_code(cls, v: Any) -> Any:
+        """Movies reference a Language row, respond with its code."""
+        return getattr(v, "code", v)
+
 
 class SyncYearRequest(BaseModel):
     """Schema for single year sync request."""
@@ -138,3 +147,14 @@ class SearchResult(BaseModel):
 
     media: list[dict[str, Any]]
     request_timestamp: datetime | None = None
+
+
+class SearchPayload(TypedDict):
+    """
+    Unvalidated search response returned on the hot path. Rows are already
+    shaped by Postgres, so running them through SearchResult only re-checks
+    them.
+    """
+
+    media: list[dict[str, Any]]
+    request_timestamp: datetime | None
@@ -1,19 +1,122 @@
 from datetime import datetime
+import math
+import orjson
 import structlog
-from django.contrib.postgres.search import TrigramDistance, TrigramSimilarity
-from django.db import connection
+from cachetools import TTLCache
+from django.db import connection, transaction
+from django.db.backends.utils import CursorWrapper
+from threading import Lock
 from typing import TypeVar, Any
-from django.db.models.functions import Cast, Ln, Greatest
+from weakref import WeakKeyDictionary
 
-from django.db.models import Value, F, FloatField
-
-from TMDB.models import Movie
-from TMDB.schema import SearchResult
+from TMDB.models import POPULAR_VOTE_COUNT
+from TMDB.schema import TMDB_IMAGE_BASE_URL, SearchPayload
 
 log: structlog.BoundLogger = structlog.get_logger(__name__)
 
 T = TypeVar("T")
 
+# Server-side prepared statements, tracked per raw DB connection
+_prepared_statements: WeakKeyDictionary[Any, set[str]] = WeakKeyDictionary()
+
+# Typeahead repeats the same prefixes, keep results per normalized query
+_search_cache: TTLCache[str, list[dict[str, Any]]] = TTLCache(maxsize=4096, ttl=60)
+_search_cache_lock = Lock()
+
+# Search result object in the shape returned to clients
+MEDIA_JSON = f"""
+           jsonb_build_object(
+               'kind', 'movie'::text,
+               'id', id::text,
+               'title', title,
+               'year', release_year,
+               'difficulty', difficulty,
+               'author', author,
+               'thumbnail_url', '{TMDB_IMAGE_BASE_URL}' || poster_path,
+               'image_url', '{TMDB_IMAGE_BASE_URL}' || poster_path,
+               'tags', COALESCE(genres, ARRAY[]::varchar[])
+           )
+"""
+
+
+def _search_sql(popular_only: bool) -> str:
+    # The cutoff is inlined rather than a parameter so the planner can prove
+    # the partial indexes' predicate even for a generic plan
+    popular = f"AND m.vote_count >= {POPULAR_VOTE_COUNT}" if popular_only else ""
+    return f"""
+   WITH q AS (
+       SELECT
+           websearch_to_tsquery('english', $1) AS tsq,
+           lower($1) AS lq,
+           immutable_unaccent(lower($1)) AS nq,
+           length($1) > $2 AS use_fts
+   ),
+   SearchResults AS NOT MATERIALIZED (
+       SELECT 
+           m.id, m.title, m.release_year, m.vote_count, m.difficulty,
+           m.author, m.poster_path, m.genres, m.popularity_score, q.use_fts,
+           /* long queries rank by full-text and word similarity weighted by
+              popularity, short ones by plain trigram similarity */
+           CASE WHEN q.use_fts THEN
+               ts_rank(m.title_vector, q.tsq, 32 /* rank normalization */)
+           END as fts_rank,
+           CASE WHEN q.use_fts THEN
+               word_similarity(q.nq, m.title_norm)
+           END as title_sim,
+           CASE WHEN NOT q.use_fts THEN
+               similarity(m.title, q.lq)
+           END as trigram_sim
+       FROM "TMDB_movie" m, q
+       /* each branch is backed by its own GIN index, Postgres BitmapOrs them */
+       WHERE 
+           (
+               (m.title_vector @@ q.tsq AND m.vote_count > $3)
+               /* the low trigram threshold is only for short queries, long
+                  ones would match any title sharing a few trigrams */
+               OR (NOT q.use_fts AND m.title % q.lq)
+               /* word matches only rank long queries, short ones keep plain
+                  trigram matching */
+               OR (q.use_fts AND q.nq <% m.title_norm)
+           )
+           {popular}
+   ),
+   RankedResults AS NOT MATERIALIZED (
+       SELECT *,
+           CASE WHEN use_fts THEN
+               GREATEST(fts_rank, title_sim) * popularity_score
+           ELSE
+               trigram_sim
+           END as final_score
+       FROM SearchResults
+       /* long queries keep full-text matches and titles that closely
+          contain the query */
+       WHERE NOT use_fts OR fts_rank > 0 OR title_sim > $5
+   )
+   SELECT
+       COALESCE(
+           jsonb_agg({MEDIA_JSON} ORDER BY final_score DESC, vote_count DESC),
+           '[]'::jsonb
+       ),
+       min(final_score)
+   FROM (
+       SELECT * FROM RankedResults
+       ORDER BY final_score DESC, vote_count DESC
+       LIMIT $4
+   ) top
+"""
+
+
+SEARCH_PARAM_TYPES = "text, int, int, int, float8"
+# Best long-query score a title below the popular cutoff can reach: match
+# scores are at most 1, times Movie.popularity_score at POPULAR_VOTE_COUNT - 1
+UNPOPULAR_SCORE_CEILING = math.log(POPULAR_VOTE_COUNT) / math.log(100000)
+# Popular titles only, served by the small partial indexes
+SEARCH_POPULAR_STATEMENT = "movie_search_popular_q"
+SEARCH_POPULAR_SQL = _search_sql(popular_only=True)
+# Whole table, used when popular titles don't fill a page
+SEARCH_STATEMENT = "movie_search_q"
+SEARCH_SQL = _search_sql(popular_only=False)
+
 
 class HybridMovieSearch:
     """
@@ -24,125 +127,112 @@ class HybridMovieSearch:
     MIN_SEARCH_LENGTH = 3  # Min search query length
     MAX_SEARCH_LENGTH = 50  # Max search query length
     MAX_RESULTS = 10
+    SIMILARITY_THRESHOLD = 0.1  # Trigram match cutoff
     DISTANCE_THRESHOLD = 0.7
-    FTS_THRESHOLD = 8  # Query length for FTS
+    FTS_THRESHOLD = 8  # Query length for FTS ranking
+    MIN_VOTE_COUNT = 10  # FTS ignores titles nobody has voted on
 
     # Ranking weights
     WEIGHTS = {"fts_rank": 0.4, "trigram": 0.3, "popularity": 0.3}
 
     @classmethod
-    def search(cls, query: str) -> SearchResult:
+    def search(cls, query: str) -> SearchPayload:
         try:
             if not query or len(query) < cls.MIN_SEARCH_LENGTH:
-                return SearchResult(media=[], request_timestamp=datetime.now())
+                return {"media": [], "request_timestamp": datetime.now()}
 
             query = query[: cls.MAX_SEARCH_LENGTH].strip().lower()
 
-            # Decide search strategy based on query length
-            if len(query) > cls.FTS_THRESHOLD:
-                results = cls._full_text_search(query)
-            else:
-                results = cls._trigram_search(query)
-
-            # Convert to response format the old way(Pydantic introduced a 25ms delay)
-            movies = [
-                {
-                    "kind": "movie",
-                    "id": str(row[0]),
-                    "title": row[1],
-                    "year": row[2].year if row[2] else None,
-                    "difficulty": row[4],
-                    "author": row[5],
-                    "thumbnail_url": row[6],
-                    "image_url": row[6],
-                    "tags": row[7] or [],
-                }
-                for row in results
-            ]
+            with _search_cache_lock:
+                movies = _search_cache.get(query)
+            cached = movies is not None
+
+            if movies is None:
+                # Postgres weights FTS vs trigram by query length and returns
+                # rows already shaped into the response format
+                movies = cls._run_search(query)
+                with _search_cache_lock:
+                    _search_cache[query] = movies
 
             log.info(
                 "Search completed",
                 query=query,
                 results_count=len(movies),
                 search_type="fts" if len(query) > cls.FTS_THRESHOLD else "trigram",
+                cached=cached,
             )
 
-            return SearchResult(media=movies, request_timestamp=datetime.now())
+            return {"media": movies, "request_timestamp": datetime.now()}
 
         except Exception as e:
             log.error("Search failed", query=query, error=str(e), exc_info=True)
             raise
 
     @classmethod
-    def _trigram_search(cls, query: str) -> list:  # type: ignore
-
-        return list(
-            Movie.objects.annotate(distance=TrigramDistance("title", str(Value(query))))
-            .annotate(
-                similarity=TrigramSimilarity("title", query),
-                popularity_score=cls._normalize_popularity(),
-            )
-            .filter(similarity__gte=0.1)
-            .order_by("distance", "-vote_count")
-            .values_list(
-                "id",
-                "title",
-                "release_date",
-                "vote_count",
-                "difficulty",
-                "author",
-                "poster_url",
-                "genres",
-            )[: cls.MAX_RESULTS]
+    def _run_search(cls, query: str) -> list[dict[str, Any]]:
+        params = (
+            query,  # $1 search query
+            cls.FTS_THRESHOLD,  # $2 length that switches to FTS ranking
+            cls.MIN_VOTE_COUNT,  # $3 popularity cutoff for FTS matches
+            cls.MAX_RESULTS,  # $4 result limit
+            cls.DISTANCE_THRESHOLD,  # $5 word similarity cutoff for long queries
         )
 
-    @classmethod
-    def _full_text_search(cls, query: str) -> Any:
-        sql = """
-           WITH SearchResults AS (
-               SELECT 
-                   id, title, release_date, vote_count, difficulty,
-                   author, poster_url, genres,
-                   ts_rank(
-                       title_vector, 
-                       websearch_to_tsquery('english', %s),
-                       32 /* rank normalization */
-                   ) * ln(GREATEST(vote_count, 1) + 1.0) as rank_score,
-                   word_similarity(lower(title), lower(%s)) as title_sim
-               FROM "TMDB_movie" m
-               WHERE 
-                   title_vector @@ websearch_to_tsquery('english', %s)
-                   OR word_similarity(lower(title), lower(%s)) > %s
-           ),
-           RankedResults AS (
-               SELECT *,
-                   GREATEST(
-                       rank_score,
-                       title_sim * ln(GREATEST(vote_count, 1) + 1.0)
-                   ) as final_score
-               FROM SearchResults
-               WHERE rank_score > 0 OR title_sim > %s
-           )
-           SELECT * FROM RankedResults
-           ORDER BY final_score DESC, vote_count DESC
-           LIMIT %s;
-           """
+        with transaction.atomic(), connection.cursor() as cursor:
+            # Thresholds used by the similarity operators in the search SQL,
+            # scoped to this transaction (SET LOCAL) so they don't leak to
+            # other queries on the connection
+            cursor.execute(
+                "SELECT set_config('pg_trgm.similarity_threshold', %s, true), "
+                "set_config('pg_trgm.word_similarity_threshold', %s, true)",
+                (str(cls.SIMILARITY_THRESHOLD), str(cls.DISTANCE_THRESHOLD)),
+            )
 
-        params = (
-            query,  # For ts_rank
-            query,  # For word_similarity
-            query,  # For websearch_to_tsquery
-            query,  # For word_similarity threshold
-            cls.DISTANCE_THRESHOLD,  # Similarity threshold
-            cls.DISTANCE_THRESHOLD,  # Final threshold
-            cls.MAX_RESULTS,  # Result limit
-        )
+            # Short queries rank by similarity alone, so popularity can't
+            # rule out the rest of the table for them
+            if len(query) > cls.FTS_THRESHOLD:
+                movies, lowest_score = cls._execute_statement(
+                    cursor, SEARCH_POPULAR_STATEMENT, SEARCH_POPULAR_SQL, params
+                )
+                # A full page that no unpopular title could break into
+                if (
+                    len(movies) == cls.MAX_RESULTS
+                    and lowest_score >= UNPOPULAR_SCORE_CEILING
+                ):
+                    return movies
+
+            movies, _ = cls._execute_statement(
+                cursor, SEARCH_STATEMENT, SEARCH_SQL, params
+            )
+            return movies
 
-        with connection.cursor() as cursor:
-            cursor.execute(sql, params)
-            return cursor.fetchall()
+    @classmethod
+    def _execute_statement(
+        cls, cursor: CursorWrapper, name: str, sql: str, params: tuple[Any, ...]
+    ) -> tuple[list[dict[str, Any]], float | None]:
+        """The statement's results, and the lowest score among them."""
+        # Prepared on first use, a page filled by popular titles never
+        # prepares the whole-table statement
+        cls._prepare_statement(cursor, name, SEARCH_PARAM_TYPES, sql)
+        placeholders = ", ".join(["%s"] * len(params))
+        cursor.execute(f"EXECUTE {name}({placeholders})", params)
+        movies, lowest_score = cursor.fetchone()  # type: ignore
+        # Django hands jsonb back undecoded
+        return orjson.loads(movies), lowest_score
 
     @staticmethod
-    def _normalize_popularity() -> Cast:
-        """Normalize vote count to 0-1 range."""
-        return Cast(Ln(Greatest(1, F("vote_count") + 1)) / Ln(100000), FloatField())
+    def _prepare_statement(
+        cursor: CursorWrapper, name: str, param_types: str, sql: str
+    ) -> None:
+        """
+        PREPARE a statement once per database connection so later searches
+        skip parsing and planning.
+        """
+        raw_connection = connection.connection
+        prepared = _prepared_statements.setdefault(raw_connection, set())
+        if name in prepared:
+            return
+
+        cursor.execute(f"PREPARE {name}({param_types}) AS {sql}")
+        prepared.add(name)
+        log.debug("Prepared search statement", statement=name)
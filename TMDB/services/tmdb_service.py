@@ -1,15 +1,39 @@
-from dataclasses import dataclass, field, asdict
-from datetime import datetime, timedelta
-from typing import AsyncIterator, Any, Callable
+from contextlib import aclosing
+from dataclasses import dataclass, field
+from datetime import datetime
+from types import TracebackType
+from typing import AsyncIterator, Any, Awaitable, Callable, Self
 import structlog
+from asgiref.sync import sync_to_async
+from cachetools import TTLCache
+from redis import Redis, RedisError
 from themoviedb import aioTMDb
 import aiohttp
 import asyncio
+import random
+import time
 
 from TMDB.schema import TMDBMovieResponse
 
 log: structlog.BoundLogger = structlog.get_logger(__name__)
 
+# Crew jobs credited as the movie's author, TMDB spells them canonically
+DIRECTOR_JOBS = frozenset({"Director"})
+
+# TMBD API throws an error from page 500 hence I split the year in ranges,
+# as (start, end) month-day suffixes of each quarter
+_QUARTERS = (
+    ("01-01", "03-31"),
+    ("04-01", "06-30"),
+    ("07-01", "09-30"),
+    ("10-01", "12-31"),
+)
+
+# Fetched movie details shared by every service in the process
+_details_cache: TTLCache[int, TMDBMovieResponse] = TTLCache(
+    maxsize=10_000, ttl=86400
+)
+
 
 class TMDBConfigError(Exception):
     """Raised when TMDB configuration is invalid or missing."""
@@ -45,16 +69,20 @@ class RateLimiter:
 
     # https://developer.themoviedb.org/docs/rate-limiting
     # Default to 40 requests/sec (below 50 for safety margin)
-    requests_per_second: int = 40
+    requests_per_second: float = 40
 
-    # Track request timestamps for rolling window
-    _request_timestamps: list[datetime] = field(default_factory=list)
+    # Bucket holds up to one second of requests and refills continuously
+    _tokens: float = field(init=False)
+    _last_refill: float = field(default_factory=time.monotonic)
 
-    # Backoff tracking
-    _backoff_until: datetime | None = None
+    # Backoff tracking, as a monotonic deadline
+    _backoff_until: float | None = None
     _consecutive_429s: int = 0
     _base_backoff: float = 2.0  # seconds
 
+    def __post_init__(self) -> None:
+        self._tokens = float(self.requests_per_second)
+
     async def acquire(self) -> None:
         """
         Acquire a rate limit token, waiting if necessary.
@@ -62,56 +90,55 @@ class RateLimiter:
         Implements:
         1. Token bucket rate limiting
         2. Exponential backoff on 429s
-        3. Rolling window request tracking
         """
-        now = datetime.now()
+        now = time.monotonic()
         # Check if we're in backoff period
         if self._backoff_until and now < self._backoff_until:
-            sleep_time = (self._backoff_until - now).total_seconds()
-            log.info("In backoff period, waiting", sleep_seconds=sleep_time)
+            sleep_time = self._backoff_until - now
+            if sleep_time > 1.0:
+                log.info("In backoff period, waiting", sleep_seconds=sleep_time)
             await asyncio.sleep(sleep_time)
+            now = time.monotonic()
 
-        # Clean old timestamps outside rolling window
-        window_start = now - timedelta(seconds=1)
-        self._request_timestamps = [
-            ts for ts in self._request_timestamps if ts > window_start
-        ]
+        rate = self.requests_per_second
+        self._tokens = min(rate, self._tokens + (now - self._last_refill) * rate)
+        self._last_refill = now
 
-        # If at rate limit, wait until oldest request expires
-        while len(self._request_timestamps) >= self.requests_per_second:
-            sleep_time = (self._request_timestamps[0] - window_start).total_seconds()
+        # Take the token up front, going into debt if the bucket is empty, so
+        # concurrent callers queue behind each other instead of waking together
+        self._tokens -= 1
+        if self._tokens < 0:
+            sleep_time = -self._tokens / rate
             log.debug("Rate limit reached, waiting", sleep_seconds=sleep_time)
             await asyncio.sleep(sleep_time)
 
-            # Update window after waiting
-            now = datetime.now()
-            window_start = now - timedelta(seconds=1)
-            self._request_timestamps = [
-                ts for ts in self._request_timestamps if ts > window_start
-            ]
-
-        # Add current request
-        self._request_timestamps.append(now)
-
-    def handle_429(self) -> Any:
+    def handle_429(self, retry_after: float | None = None) -> Any:
         """
-        Handle a 429 response with exponential backoff.
+        Handle a 429 response with exponential backoff and full jitter.
+
+        Args:
+            retry_after: Seconds from the response's Retry-After header, if any
 
         Returns:
             float: Number of seconds to back off
         """
         self._consecutive_429s += 1
-        backoff_seconds = self._base_backoff * (2 ** (self._consecutive_429s - 1))
-
         # Cap maximum backoff at 5 minutes
-        backoff_seconds = min(backoff_seconds, 300)
+        max_backoff = min(
+            self._base_backoff * (2 ** (self._consecutive_429s - 1)), 300.0
+        )
+        # Jitter spreads out concurrent requests that were throttled together
+        backoff_seconds = random.uniform(0, max_backoff)
+        if retry_after is not None:
+            backoff_seconds = max(backoff_seconds, retry_after)
 
-        self._backoff_until = datetime.now() + timedelta(seconds=backoff_seconds)
+        self._backoff_until = time.monotonic() + backoff_seconds
 
         log.warning(
             "Received 429, implementing backoff",
             consecutive_429s=self._consecutive_429s,
             backoff_seconds=backoff_seconds,
+            retry_after=retry_after,
         )
 
         return backoff_seconds
@@ -122,6 +149,28 @@ class RateLimiter:
         self._backoff_until = None
 
 
+@dataclass
+class _ResultBudget:
+    """Movie slots shared by concurrent fetches, None limit means unbounded."""
+
+    limit: int | None
+    reserved: int = 0
+
+    @property
+    def exhausted(self) -> bool:
+        return self.limit is not None and self.reserved >= self.limit
+
+    def reserve(self, wanted: int) -> int:
+        """Claim up to `wanted` slots, returning how many were granted."""
+        if self.limit is not None:
+            wanted = max(0, min(wanted, self.limit - self.reserved))
+        self.reserved += wanted
+        return wanted
+
+    def release(self, count: int = 1) -> None:
+        self.reserved -= count
+
+
 @dataclass
 class TMDBStats:
     """Statistics for TMDB API usage and results."""
@@ -143,8 +192,22 @@ class TMDBStats:
 class TMDBService:
     """Client for fetching movie data from TMDB API by year."""
 
-    def __init__(self, api_key: str | None = None) -> None:
-        """Initialize TMDB client with optional API key."""
+    def __init__(
+        self,
+        api_key: str | None = None,
+        redis: Redis | None = None,
+        cache_ttl: int = 86400,
+        max_concurrency: int = 20,
+    ) -> None:
+        """
+        Initialize TMDB client with optional API key.
+
+        Args:
+            api_key: TMDB API key
+            redis: Connection used to share fetched movie details across workers
+            cache_ttl: Seconds movie details stay in the shared cache
+            max_concurrency: Requests allowed in flight at once
+        """
         self.api_key = api_key
         if not self.api_key:
             raise TMDBConfigError("TMDB API key not provided")
@@ -152,14 +215,70 @@ class TMDBService:
         self.tmdb = aioTMDb(key=self.api_key)
         self.stats = TMDBStats()
         self.rate_limiter = RateLimiter()
+        # Caps in-flight requests independently of the rate, so a large
+        # fan-out waits here instead of piling up sleepers in the limiter
+        self._max_concurrency = max_concurrency
+        self._request_slots = asyncio.Semaphore(max_concurrency)
+        # Created on first request, it must belong to the running event loop
+        self._session: aiohttp.ClientSession | None = None
+        # Stateless discover client, reused for every page of every range
+        self._discover = self.tmdb.discover()
+        self.redis = redis
+        self.cache_ttl = cache_ttl
 
         log.debug("Initialized TMDB client")
 
-    async def _make_request(self, request_func: Callable[[], Any]) -> Any:
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        await self.close()
+
+    def _ensure_session(self) -> None:
+        """
+        Share one keep-alive connection pool across every request made by
+        this service instead of aioTMDb opening a session per call.
+        """
+        if self._session is not None and not self._session.closed:
+            return
+
+        self._session = aiohttp.ClientSession(
+            # Every request goes to one host, so size the pool to the
+            # requests allowed in flight and keep those connections alive
+            connector=aiohttp.TCPConnector(
+                limit=self._max_concurrency,
+                limit_per_host=self._max_concurrency,
+                ttl_dns_cache=300,
+                keepalive_timeout=75,
+                enable_cleanup_closed=True,
+            ),
+            timeout=aiohttp.ClientTimeout(total=30),
+            # aioTMDb relies on this to surface 429s as ClientResponseError
+            raise_for_status=True,
+        )
+        self.tmdb.session = self._session
+        # Sub-clients copy the session when created
+        self._discover.session = self._session
+
+    async def close(self) -> None:
+        """Close the shared HTTP session."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def _make_request(
+        self, fn: Callable[..., Awaitable[Any]], *args: Any, **kwargs: Any
+    ) -> Any:
         """
         Make a rate-limited API request with retry logic.
         Args:
-            request_func: Async function that makes the actual API request
+            fn: Async API method that makes the actual request
+            *args, **kwargs: Arguments passed to fn on every attempt
         Returns:
             API response
         Raises:
@@ -167,20 +286,24 @@ class TMDBService:
         """
         max_retries = 5
         attempt = 0
+        self._ensure_session()
 
         while attempt < max_retries:
             try:
-                # Wait for rate limit token
-                await self.rate_limiter.acquire()
+                async with self._request_slots:
+                    # Wait for rate limit token
+                    await self.rate_limiter.acquire()
 
-                response = await request_func()
+                    response = await fn(*args, **kwargs)
                 self.rate_limiter.handle_success()
 
                 return response
 
             except aiohttp.ClientResponseError as e:
                 if e.status == 429:
-                    backoff = self.rate_limiter.handle_429()
+                    backoff = self.rate_limiter.handle_429(
+                        retry_after=self._retry_after(e)
+                    )
                     if attempt < max_retries - 1:
                         await asyncio.sleep(backoff)
                         attempt += 1
@@ -202,6 +325,15 @@ class TMDBService:
                     log_context={"attempt": attempt + 1},
                 ) from e
 
+    @staticmethod
+    def _retry_after(error: aiohttp.ClientResponseError) -> float | None:
+        """Seconds requested by a Retry-After header, ignoring HTTP-date values."""
+        value = error.headers.get("Retry-After") if error.headers else None
+        try:
+            return float(value) if value is not None else None
+        except ValueError:
+            return None
+
     async def get_movies_by_year(
         self,
         year: int,
@@ -213,13 +345,15 @@ class TMDBService:
         if not isinstance(year, int) or year < 1900 or year > datetime.now().year:
             raise ValueError(f"Invalid year: {year}")
 
+        # Sub-clients copy the session when created, so set it up front
+        self._ensure_session()
+
         processed_count = 0
-        # TMBD API throws an error from page 500 hence I split the year in ranges
+        # Shared by the quarters so they dispatch max_results detail fetches
+        # between them, not each
+        budget = _ResultBudget(max_results)
         date_ranges = [
-            (f"{year}-01-01", f"{year}-03-31"),
-            (f"{year}-04-01", f"{year}-06-30"),
-            (f"{year}-07-01", f"{year}-09-30"),
-            (f"{year}-10-01", f"{year}-12-31"),
+            (f"{year:04d}-{start}", f"{year:04d}-{end}") for start, end in _QUARTERS
         ]
 
         log.info(
@@ -229,114 +363,234 @@ class TMDBService:
             max_results=max_results,
         )
 
-        for start_date, end_date in date_ranges:
-            log.info("Processing date range", start_date=start_date, end_date=end_date)
-            page = 1
-            total_pages = 1
+        # Bounded so producers don't run far ahead of a slow consumer;
+        # None marks a quarter that has finished
+        queue: asyncio.Queue[TMDBMovieResponse | None] = asyncio.Queue(maxsize=100)
 
-            while page <= total_pages:
-                log.info(
-                    "Fetching page",
-                    page=page,
-                    total_pages=total_pages,
-                    period=f"{start_date} to {end_date}",
-                )
-                try:
-                    discover_response = await self._make_request(
-                        lambda: self.tmdb.discover().movie(
-                            primary_release_year=year,
-                            release_date__gte=start_date,
-                            release_date__lte=end_date,
-                            include_adult=include_adult,
-                            with_original_language=language,
-                            page=page,
-                        )
-                    )
+        async def produce(start_date: str, end_date: str) -> None:
+            movies = self._fetch_date_range(
+                year, start_date, end_date, include_adult, language, budget
+            )
+            try:
+                async with aclosing(movies):
+                    async for movie in movies:
+                        await queue.put(movie)
+            finally:
+                # Once cancelled nobody is reading the queue anymore
+                task = asyncio.current_task()
+                if task is None or not task.cancelling():
+                    await queue.put(None)
+
+        # Quarters are fetched concurrently, the rate limiter still gates
+        # every request they make
+        producers = [
+            asyncio.create_task(produce(start_date, end_date))
+            for start_date, end_date in date_ranges
+        ]
+        try:
+            finished = 0
+            while finished < len(producers):
+                movie = await queue.get()
+                if movie is None:
+                    finished += 1
+                    continue
 
-                    if page == 1:
-                        total_pages = discover_response.total_pages
-                        log.info(
-                            "Discovered movies for period",
-                            year=year,
-                            start_date=start_date,
-                            end_date=end_date,
-                            total_pages=total_pages,
-                            total_movies=discover_response.total_results,
-                            language=language,
-                        )
-
-                    for movie_data in discover_response.results:
-                        try:
-                            if (
-                                max_results is not None
-                                and processed_count >= max_results
-                            ):
-                                log.info(
-                                    "Reached max results limit",
-                                    processed_count=processed_count,
-                                    max_results=max_results,
-                                )
-                                return
-
-                            details = await self._make_request(
-                                lambda: self.tmdb.movie(movie_data.id).details(
-                                    append_to_response="credits"
-                                )
-                            )
-
-                            directors = [
-                                member.name
-                                for member in details.credits.crew
-                                if member.job.lower() == "director"
-                            ]
-
-                            movie_dict = asdict(details)
-                            movie_dict["author"] = (
-                                ", ".join(directors) if directors else ""
-                            )
-
-                            movie = TMDBMovieResponse.model_validate(movie_dict)
-                            self.stats.processed_movies += 1
-                            processed_count += 1
-                            yield movie
-
-                            log.debug(
-                                "Fetched movie",
-                                movie_id=movie_data.id,
-                                title=movie.title,
-                                processed_count=processed_count,
-                            )
-
-                        except Exception as e:
-                            self.stats.failed_movies += 1
-                            log.error(
-                                "Failed to process movie",
-                                movie_id=movie_data.id,
-                                error=str(e),
-                                exc_info=True,
-                            )
-                            continue
+                processed_count += 1
+                yield movie
 
+                log.debug(
+                    "Fetched movie",
+                    movie_id=movie.tmdb_id,
+                    title=movie.title,
+                    processed_count=processed_count,
+                )
+
+                if max_results is not None and processed_count >= max_results:
                     log.info(
-                        "Completed page",
-                        page=page,
-                        total_pages=total_pages,
-                        processed_this_page=len(discover_response.results),
+                        "Reached max results limit",
+                        processed_count=processed_count,
+                        max_results=max_results,
                     )
-                    page += 1
+                    return
+
+            # Surface anything a quarter raised outside its page handling
+            await asyncio.gather(*producers)
+        finally:
+            # The consumer may stop iterating before the quarters finish
+            for producer in producers:
+                producer.cancel()
+
+    async def _fetch_date_range(
+        self,
+        year: int,
+        start_date: str,
+        end_date: str,
+        include_adult: bool,
+        language: str,
+        budget: _ResultBudget,
+    ) -> AsyncIterator[TMDBMovieResponse]:
+        """
+        Fetch every discover page for one date range, yielding movies as
+        their details arrive.
 
-                except Exception as e:
-                    log.error(
-                        "Failed to fetch page",
+        Args:
+            budget: Movies still wanted across all ranges, reserved before
+                their details are fetched
+        """
+        log.info("Processing date range", start_date=start_date, end_date=end_date)
+        page = 1
+        total_pages = 1
+
+        while page <= total_pages:
+            # Skip the discover call entirely once other pages took the quota
+            if budget.exhausted:
+                return
+
+            log.debug(
+                "Fetching page",
+                page=page,
+                total_pages=total_pages,
+                period=f"{start_date} to {end_date}",
+            )
+            try:
+                discover_response = await self._make_request(
+                    self._discover.movie,
+                    primary_release_year=year,
+                    release_date__gte=start_date,
+                    release_date__lte=end_date,
+                    include_adult=include_adult,
+                    with_original_language=language,
+                    page=page,
+                )
+
+                if page == 1:
+                    total_pages = discover_response.total_pages
+                    log.info(
+                        "Discovered movies for period",
                         year=year,
-                        page=page,
                         start_date=start_date,
                         end_date=end_date,
-                        error=str(e),
-                        exc_info=True,
+                        total_pages=total_pages,
+                        total_movies=discover_response.total_results,
+                        language=language,
                     )
-                    page += 1
-                    continue
+
+                page_results = discover_response.results
+                page_results = page_results[: budget.reserve(len(page_results))]
+
+                # Fetch the page's details concurrently, the rate limiter
+                # still gates admission of each request
+                tasks = [
+                    asyncio.create_task(self._fetch_movie(movie_data.id))
+                    for movie_data in page_results
+                ]
+                try:
+                    for next_movie in asyncio.as_completed(tasks):
+                        movie = await next_movie
+                        if movie is None:
+                            # Let a later page fill the failed movie's slot
+                            budget.release()
+                            continue
+                        yield movie
+                finally:
+                    # The consumer may stop iterating mid-page
+                    for task in tasks:
+                        task.cancel()
+
+                log.debug(
+                    "Completed page",
+                    page=page,
+                    total_pages=total_pages,
+                    processed_this_page=len(discover_response.results),
+                )
+                page += 1
+
+            except Exception as e:
+                log.error(
+                    "Failed to fetch page",
+                    year=year,
+                    page=page,
+                    start_date=start_date,
+                    end_date=end_date,
+                    error=str(e),
+                    exc_info=True,
+                )
+                page += 1
+                continue
+
+    async def _fetch_movie(self, movie_id: int) -> TMDBMovieResponse | None:
+        """Fetch one movie with its director credits, None if it fails."""
+        try:
+            cached = await self._get_cached_movie(movie_id)
+            if cached is not None:
+                self.stats.processed_movies += 1
+                return cached
+
+            details = await self._make_request(
+                self.tmdb.movie(movie_id).details, append_to_response="credits"
+            )
+
+            directors = [
+                member.name
+                for member in details.credits.crew
+                if member.job in DIRECTOR_JOBS
+            ]
+
+            # Read the fields straight off the response dataclass rather than
+            # deep-copying it (credits included) into a dict first
+            movie = TMDBMovieResponse.model_validate(details, from_attributes=True)
+            movie.author = ", ".join(directors) if directors else ""
+            await self._cache_movie(movie)
+            self.stats.processed_movies += 1
+            return movie
+
+        except Exception as e:
+            self.stats.failed_movies += 1
+            log.error(
+                "Failed to process movie",
+                movie_id=movie_id,
+                error=str(e),
+                exc_info=True,
+            )
+            return None
+
+    @staticmethod
+    def _cache_key(movie_id: int) -> str:
+        return f"tmdb:movie:{movie_id}"
+
+    async def _get_cached_movie(self, movie_id: int) -> TMDBMovieResponse | None:
+        """Look up movie details in the process cache, then in Redis."""
+        movie = _details_cache.get(movie_id)
+        if movie is not None or self.redis is None:
+            return movie
+
+        try:
+            raw = await sync_to_async(self.redis.get)(self._cache_key(movie_id))
+        except RedisError as e:
+            log.warning("Movie cache lookup failed", movie_id=movie_id, error=str(e))
+            return None
+
+        if raw is None:
+            return None
+        movie = TMDBMovieResponse.model_validate_json(raw)
+        _details_cache[movie_id] = movie
+        return movie
+
+    async def _cache_movie(self, movie: TMDBMovieResponse) -> None:
+        _details_cache[movie.tmdb_id] = movie
+        if self.redis is None:
+            return
+
+        try:
+            await sync_to_async(self.redis.setex)(
+                self._cache_key(movie.tmdb_id),
+                self.cache_ttl,
+                movie.model_dump_json(by_alias=True),
+            )
+        except RedisError as e:
+            log.warning(
+                "Movie cache store failed", movie_id=movie.tmdb_id, error=str(e)
+            )
 
     async def get_movie_details(self, movie_id: int) -> TMDBMovieResponse:
         """
@@ -352,6 +606,7 @@ class TMDBService:
             TMDBRequestError: If API request fails
         """
         try:
+            self._ensure_session()
             details = await self.tmdb.movie(movie_id).details()
             return TMDBMovieResponse.model_validate(details.__dict__)
 
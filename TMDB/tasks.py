@@ -1,17 +1,67 @@
 import django_rq
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import List, Any
 import structlog
+import time
 from asgiref.sync import sync_to_async
 from django.conf import settings
-from rq import get_current_job
+from django.db import connection, transaction
+from django.utils import timezone
+from rq import Queue, get_current_job
 
-from .models import Movie, TMDBSyncQueue
+from .models import Language, Movie, TMDBSyncQueue
+from TMDB.schema import TMDBMovieResponse
 from TMDB.services.tmdb_service import TMDBService
 
 log: structlog.BoundLogger = structlog.get_logger(__name__)
 
+UPSERT_BATCH_SIZE = 50  # Movies buffered per bulk upsert
+COPY_BATCH_SIZE = 1000  # Movies buffered per COPY when bulk loading
+PROGRESS_UPDATE_INTERVAL = 5.0  # Min seconds between sync progress writes
+
+# Movie fields refreshed when a synced movie already exists
+_UPSERT_FIELDS = [
+    "title",
+    "original_title",
+    "overview",
+    "release_date",
+    "runtime",
+    "poster_path",
+    "backdrop_path",
+    "vote_average",
+    "vote_count",
+    "genres",
+    "original_language",
+    "language",
+    "author",
+    "updated_at",
+]
+
+# Movie columns written by the COPY path, in row order
+_COPY_COLUMNS = (
+    "tmdb_id",
+    "title",
+    "original_title",
+    "overview",
+    "release_date",
+    "runtime",
+    "poster_path",
+    "backdrop_path",
+    "vote_average",
+    "vote_count",
+    "genres",
+    "original_language_id",
+    "language_id",
+    "author",
+    "difficulty",
+    "created_at",
+    "updated_at",
+)
+# Set on insert only, like fields missing from _UPSERT_FIELDS on the ORM path
+_COPY_INSERT_ONLY_COLUMNS = ("tmdb_id", "difficulty", "created_at")
+
 
 @dataclass
 class SyncResult:
@@ -25,13 +75,190 @@ class SyncResult:
     language: str
 
 
+def _language_ids(
+    movies: list[TMDBMovieResponse],
+    language: str,
+    language_ids: dict[str, int] | None = None,
+) -> dict[str, int]:
+    """
+    Resolve every language code used by a batch to its Language id.
+
+    Codes already in ``language_ids`` are not looked up again, and new ones
+    are added to it, so a sync job only resolves each code once.
+    """
+    if language_ids is None:
+        language_ids = {}
+    for code in {language, *(movie.original_language for movie in movies)}:
+        if code not in language_ids:
+            language_ids[code] = Language.get_id(code)
+    return language_ids
+
+
+def upsert_movies(
+    movies: list[TMDBMovieResponse],
+    language: str,
+    language_ids: dict[str, int] | None = None,
+) -> None:
+    """Insert or update a batch of movies with a single bulk statement."""
+    language_ids = _language_ids(movies, language, language_ids)
+    # Pages can overlap, keep one row per movie so the upsert never hits the
+    # same target twice
+    unique_movies = {movie.tmdb_id: movie for movie in movies}
+
+    Movie.objects.bulk_create(
+        [
+            Movie(
+                tmdb_id=movie.tmdb_id,
+                title=movie.title,
+                original_title=movie.original_title,
+                overview=movie.overview,
+                release_date=movie.release_date,
+                runtime=movie.runtime,
+                poster_path=movie.poster_path,
+                backdrop_path=movie.backdrop_path,
+                vote_average=movie.vote_average,
+                vote_count=movie.vote_count,
+                genres=movie.genres,
+                original_language_id=language_ids[movie.original_language],
+                language_id=language_ids[language],
+                author=movie.author or "",
+            )
+            for movie in unique_movies.values()
+        ],
+        update_conflicts=True,
+        unique_fields=["tmdb_id"],
+        update_fields=_UPSERT_FIELDS,
+    )
+
+
+def copy_movies(
+    movies: list[TMDBMovieResponse],
+    language: str,
+    language_ids: dict[str, int] | None = None,
+) -> None:
+    """
+    Upsert a batch of movies with COPY into a staging table, then a single
+    INSERT ... ON CONFLICT into the movie table.
+    """
+    columns = ", ".join(_COPY_COLUMNS)
+    updates = ", ".join(
+        f"{column} = EXCLUDED.{column}"
+        for column in _COPY_COLUMNS
+        if column not in _COPY_INSERT_ONLY_COLUMNS
+    )
+    now = timezone.now()
+    # Pages can overlap, keep the last row per movie, like upsert_movies, so
+    # the upsert never hits the same target twice
+    unique_movies = {movie.tmdb_id: movie for movie in movies}
+    # Resolved outside the transaction, a failed COPY must not roll back
+    # Language rows the job has already memoised
+    language_ids = _language_ids(movies, language, language_ids)
+
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(
+            f"CREATE TEMP TABLE movie_copy_stage ON COMMIT DROP AS "
+            f'SELECT {columns} FROM "TMDB_movie" WITH NO DATA'
+        )
+        with cursor.copy(f"COPY movie_copy_stage ({columns}) FROM STDIN") as copy:
+            for movie in unique_movies.values():
+                copy.write_row(
+                    (
+                        movie.tmdb_id,
+                        movie.title,
+                        movie.original_title,
+                        movie.overview,
+                        movie.release_date,
+                        movie.runtime,
+                        movie.poster_path,
+                        movie.backdrop_path,
+                        movie.vote_average,
+                        movie.vote_count,
+                        movie.genres,
+                        language_ids[movie.original_language],
+                        language_ids[language],
+                        movie.author or "",
+                        0.0,  # Movie.difficulty default, until analysed
+                        now,
+                        now,
+                    )
+                )
+        cursor.execute(
+            f'INSERT INTO "TMDB_movie" ({columns}) '
+            f"SELECT {columns} FROM movie_copy_stage "
+            f"ON CONFLICT (tmdb_id) DO UPDATE SET {updates}"
+        )
+
+
 async def sync_year(
-    year: int, language: str = "en", max_results: int | None = 100
+    year: int,
+    language: str = "en",
+    max_results: int | None = 100,
+    bulk_copy: bool = False,
 ) -> None:
     """Sync movies for a specific year."""
     job = get_current_job()
     processed_count = 0
     failed_count = 0
+    batch: list[TMDBMovieResponse] = []
+    # Language ids resolved so far, shared by every batch of the job
+    language_ids: dict[str, int] = {}
+    # Wrapped once per job rather than on every flush
+    upsert_batch = sync_to_async(upsert_movies)
+    save_batch = sync_to_async(copy_movies) if bulk_copy else upsert_batch
+    batch_size = COPY_BATCH_SIZE if bulk_copy else UPSERT_BATCH_SIZE
+    last_progress_update = time.monotonic()
+
+    async def save(
+        movies: list[TMDBMovieResponse],
+        save_movies: Callable[
+            [list[TMDBMovieResponse], str, dict[str, int]], Awaitable[None]
+        ],
+    ) -> bool:
+        nonlocal processed_count
+        try:
+            await save_movies(movies, language, language_ids)
+        except Exception as e:
+            log.error(
+                "Failed to save movie batch",
+                year=year,
+                movie_ids=[movie.tmdb_id for movie in movies],
+                error=str(e),
+                exc_info=True,
+            )
+            return False
+
+        processed_count += len(movies)
+        log.info(
+            "Saved movie batch",
+            year=year,
+            batch_size=len(movies),
+            processed_so_far=processed_count,
+        )
+        return True
+
+    async def flush_batch() -> None:
+        nonlocal failed_count, last_progress_update
+        if not await save(batch, save_batch):
+            if bulk_copy:
+                # One bad row fails the whole COPY, upsert the batch in the
+                # usual smaller batches so only the one holding it fails
+                for start in range(0, len(batch), UPSERT_BATCH_SIZE):
+                    movies = batch[start : start + UPSERT_BATCH_SIZE]
+                    if not await save(movies, upsert_batch):
+                        failed_count += len(movies)
+            else:
+                failed_count += len(batch)
+        batch.clear()
+
+        # Running stats are only polled, the completion update always lands
+        now = time.monotonic()
+        if now - last_progress_update < PROGRESS_UPDATE_INTERVAL:
+            return
+        last_progress_update = now
+        await update_queue_entry(
+            movies_processed=processed_count,
+            movies_failed=failed_count,
+        )
 
     # Create sync log
     queue_entry = await sync_to_async(TMDBSyncQueue.objects.create)(
@@ -40,65 +267,30 @@ async def sync_year(
         job_id=job.id if job else None,
         status="IN_PROGRESS",
     )
+    update_queue_entry = sync_to_async(
+        TMDBSyncQueue.objects.filter(id=queue_entry.id).update
+    )
 
+    client: TMDBService | None = None
     try:
-        client = TMDBService(api_key=settings.TMDB_API_KEY)
+        client = TMDBService(
+            api_key=settings.TMDB_API_KEY,
+            redis=django_rq.get_connection("tmdb_sync"),
+            cache_ttl=int(timedelta(days=settings.TMDB_CACHE_TTL).total_seconds()),
+        )
         movies_iterator = client.get_movies_by_year(
             year=year, language=language, max_results=max_results
         )
 
         async for movie in movies_iterator:
-            try:
-                # Use get_or_create with direct field assignment
-                log.info(
-                    "Save movie",
-                    movie_id=movie.tmdb_id,
-                    title=movie.title,
-                    year=year,
-                    processed_so_far=processed_count,
-                )
-                await sync_to_async(Movie.objects.update_or_create)(
-                    tmdb_id=movie.tmdb_id,
-                    defaults={
-                        "title": movie.title,
-                        "original_title": movie.original_title,
-                        "overview": movie.overview,
-                        "release_date": movie.release_date,
-                        "runtime": movie.runtime,
-                        "poster_url": movie.poster_url,
-                        "backdrop_url": movie.backdrop_url,
-                        "vote_average": movie.vote_average,
-                        "vote_count": movie.vote_count,
-                        "genres": movie.genres,
-                        "original_language": movie.original_language,
-                        "language": language,
-                        "author": movie.author,
-                    },
-                )
-                processed_count += 1
-
-                # Update running stats
-                await sync_to_async(
-                    TMDBSyncQueue.objects.filter(id=queue_entry.id).update
-                )(
-                    movies_processed=processed_count,
-                    movies_failed=failed_count,
-                )
+            batch.append(movie)
+            if len(batch) >= batch_size:
+                await flush_batch()
 
-            except Exception as e:
-                failed_count += 1
-                log.error(
-                    "Failed to save movie",
-                    movie_id=movie.tmdb_id if hasattr(movie, "tmdb_id") else "unknown",
-                    title=movie.title if hasattr(movie, "title") else "unknown",
-                    error=str(e),
-                    processed_count=processed_count,
-                    failed_count=failed_count,
-                    exc_info=True,
-                )
-                continue
+        if batch:
+            await flush_batch()
 
-        await sync_to_async(TMDBSyncQueue.objects.filter(id=queue_entry.id).update)(
+        await update_queue_entry(
             status="COMPLETED",
             movies_processed=processed_count,
             movies_failed=failed_count,
@@ -115,7 +307,7 @@ async def sync_year(
 
     except Exception as e:
         # Only mark as failed for non-movie specific errors
-        await sync_to_async(TMDBSyncQueue.objects.filter(id=queue_entry.id).update)(
+        await update_queue_entry(
             status="FAILED",
             error_message=str(e),
             movies_processed=processed_count,
@@ -134,12 +326,18 @@ async def sync_year(
         )
         raise
 
+    finally:
+        # Release the client's pooled connections before the job's loop closes
+        if client is not None:
+            await client.close()
+
 
 def enqueue_year_sync(
     year: int,
     language: str = "en-US",
     priority: int = 0,
     max_results: int | None = 100,
+    bulk_copy: bool = False,
 ) -> str:
     """
     Enqueue a year for syncing.
@@ -148,6 +346,7 @@ def enqueue_year_sync(
         year: Year to sync
         language: Language code to fetch
         priority: Queue priority (higher = more important)
+        bulk_copy: Load movies through COPY instead of bulk upserts
 
     Returns:
         str: Job ID
@@ -157,7 +356,7 @@ def enqueue_year_sync(
     job = queue.enqueue(
         sync_year,
         args=(year, language),
-        kwargs={"max_results": max_results},
+        kwargs={"max_results": max_results, "bulk_copy": bulk_copy},
         job_id=f"year_sync_{year}_{language}",
         job_timeout=28800,
         meta={"year": year, "language": language, "type": "year_sync"},
@@ -177,6 +376,7 @@ def enqueue_year_range(
     language: str = "en",
     priority: int = 0,
     max_results: int | None = 100,
+    bulk_copy: bool = False,
 ) -> List[str]:
     """
     Enqueue a range of years for syncing.
@@ -187,12 +387,14 @@ def enqueue_year_range(
         language: Language code to fetch
         priority: Base priority (will be adjusted by year)
         max_results: Total maximum results across all years
+        bulk_copy: Load movies through COPY instead of bulk upserts
 
     Returns:
         List[str]: List of job IDs
     """
-    job_ids = []
     current_year = datetime.now().year
+    job_datas = []
+    entries = []
 
     # Calculate movies per year if max_results is set
     total_years = end_year - start_year + 1
@@ -223,15 +425,34 @@ def enqueue_year_range(
         else:
             year_max_results = movies_per_year  # type: ignore
 
-        job_id = enqueue_year_sync(
-            year=year,
-            language=language,
-            priority=year_priority,
-            max_results=year_max_results,
+        job_datas.append(
+            Queue.prepare_data(
+                sync_year,
+                args=(year, language),
+                kwargs={"max_results": year_max_results, "bulk_copy": bulk_copy},
+                job_id=f"year_sync_{year}_{language}",
+                timeout=28800,
+                meta={"year": year, "language": language, "type": "year_sync"},
+            )
         )
-        job_ids.append(job_id)
+        entries.append(
+            TMDBSyncQueue(
+                year=year,
+                language=language,
+                priority=year_priority,
+                status="PENDING",
+            )
+        )
+
+    # One Redis pipeline and one INSERT for the whole range
+    queue = django_rq.get_queue("tmdb_sync", default_timeout=28800)
+    jobs = queue.enqueue_many(job_datas)
+
+    for entry, job in zip(entries, jobs):
+        entry.job_id = job.id
+    TMDBSyncQueue.objects.bulk_create(entries)
 
-    return job_ids
+    return [job.id for job in jobs]
 
 
 # Scheduled task to handle retries
@@ -1,7 +1,6 @@
 from http import HTTPStatus
 from typing import Any, Annotated
 from urllib.request import Request
-from asyncio import Task
 
 import structlog
 from django.http import HttpRequest
@@ -15,7 +14,6 @@ from TMDB.schema import (
     SyncResponse,
     SyncYearRequest,
     SyncYearRangeRequest,
-    SearchResult,
 )
 from media_index.errors import RESTError
 from TMDB.tasks import enqueue_year_sync, enqueue_year_range
@@ -25,21 +23,32 @@ log: structlog.BoundLogger = structlog.get_logger(__name__)
 router = Router(tags=["Media"])
 
 
-# Track active searches by client and session
-_active_searches: dict[tuple[str, str], Task[SearchResult]] = {}
+# Columns MovieResponse is built from, the language code is read through the FK
+_MOVIE_DETAIL_FIELDS = tuple(
+    name for name in MovieResponse.model_fields if name != "original_language"
+)
 
 
 @router.get("/get/{movie_id}", response=MovieResponse)
 def get_movie_details(request: Request, movie_id: str) -> MovieResponse:
     """Get detailed information about a specific movie."""
-    log.info("Movie details requested", movie_id=movie_id)
+    log.debug("Movie details requested", movie_id=movie_id)
     try:
-        movie = Movie.objects.get(tmdb_id=movie_id)
-        movie_data = MovieResponse.model_validate(movie)
-        log.info("Movie details retrieved", movie_id=movie_id, title=movie.title)
+        # Plain dict of just the response columns, no model instance
+        row = (
+            Movie.objects.filter(tmdb_id=movie_id)
+            .values(*_MOVIE_DETAIL_FIELDS, "original_language__code")
+            .first()
+        )
+        if row is None:
+            raise RESTError("Movie not found", status_code=HTTPStatus.NOT_FOUND)
+
+        row["original_language"] = row.pop("original_language__code")
+        movie_data = MovieResponse.model_validate(row)
+        log.debug("Movie details retrieved", movie_id=movie_id)
         return movie_data
-    except Movie.DoesNotExist:
-        raise RESTError("Movie not found", status_code=HTTPStatus.NOT_FOUND)
+    except RESTError:
+        raise
     except Exception as e:
         log.error("Failed to fetch movie details", movie_id=movie_id, error=str(e))
         raise RESTError(
@@ -1,10 +1,16 @@
-import gc
+from threading import Lock
+from typing import Any
+
 import structlog
 from django.db import transaction
+from django.utils.timezone import now
 
 from TMDB.models import Movie
 from language_analysis.models import MediaAnalysisResult
-from language_analysis.processor.processor import LinguisticProcessor
+from language_analysis.processor.processor import (
+    ANALYSIS_VERSION,
+    LinguisticProcessor,
+)
 from language_analysis.processor.schema import (
     LinguisticProfile,
 )
@@ -14,21 +20,30 @@ log: structlog.BoundLogger = structlog.get_logger(__name__)
 
 
 class LinguisticProcessorSingleton:
+    """One processor per worker process, reused by every analysis."""
+
     _instance: LinguisticProcessor | None = None
+    # API requests analyse in worker threads, only the first one loads
+    _lock = Lock()
 
     @classmethod
     def get_instance(cls) -> LinguisticProcessor:
         if not cls._instance:
-            log.info("Initializing new LinguisticProcessor instance")
-            cls._instance = LinguisticProcessor()
+            with cls._lock:
+                if not cls._instance:
+                    log.info("Initializing new LinguisticProcessor instance")
+                    cls._instance = LinguisticProcessor()
         return cls._instance
 
     @classmethod
     def cleanup(cls) -> None:
+        """
+        Drop the shared processor. Loading the pipeline takes seconds, so this
+        is for shutdown or freeing memory, not for calling between texts.
+        """
         if cls._instance:
             log.info("Cleaning up LinguisticProcessor instance")
             cls._instance = None
-            gc.collect()
 
 
 class LanguageAnalysisService:
@@ -59,17 +74,64 @@ class LanguageAnalysisService:
             log.error("Error during linguistic analysis", error=str(e))
             raise
 
-        finally:
-            LinguisticProcessorSingleton.cleanup()
+    def process_texts(
+        self,
+        texts: list[str],
+        media_type: str,
+    ) -> list[LinguisticProfile]:
+        """
+        Process several texts in one pipeline call, in the order given.
+        """
+        log.info(
+            "Starting batch text analysis",
+            text_count=len(texts),
+            total_length=sum(len(text) for text in texts),
+            media_type=media_type,
+        )
+
+        try:
+            processor = LinguisticProcessorSingleton.get_instance()
+            return processor.process_batch(texts)
+
+        except Exception as e:
+            log.error("Error during batch linguistic analysis", error=str(e))
+            raise
+
+    def find_stored_analyses(
+        self, content_hashes: list[str]
+    ) -> dict[str, LinguisticProfile]:
+        """
+        Analyses of the current version already stored for subtitle content,
+        by content hash. The same text analyses the same, so these can be
+        stored again instead of running the pipeline.
+        """
+        # Each reuse stores another row with the same hash, take the newest
+        stored = (
+            MediaAnalysisResult.objects.filter(
+                content_hash__in=content_hashes, version=ANALYSIS_VERSION
+            )
+            .order_by("content_hash", "-created_at")
+            .distinct("content_hash")
+            .values_list("content_hash", "lexical_analysis")
+        )
+
+        return {
+            content_hash: LinguisticProfile.model_validate(
+                {**lexical_analysis, "analysis_version": ANALYSIS_VERSION}
+            )
+            for content_hash, lexical_analysis in stored
+        }
 
     def store_analysis_result(
         self,
         movie: Movie,
         linguistic_analysis: LinguisticProfile,
         subtitle: MovieSubtitle,
+        mark_processed: bool = False,
     ) -> MediaAnalysisResult:
         """
-        Store analysis results in the database.
+        Store analysis results in the database. With mark_processed the
+        subtitle is marked processed in the same transaction.
         """
         log.info(
             "Storing analysis result",
@@ -80,23 +142,12 @@ class LanguageAnalysisService:
 
         @transaction.atomic
         def create_analysis_result() -> MediaAnalysisResult:
-            # Convert Pydantic models to dict format for JSON storage
-            concepts_dict = {}
-            for concept_type, concepts in linguistic_analysis.concepts.items():
-                concepts_dict[concept_type] = [
-                    {
-                        "concept": c.concept,
-                        "num_occurrences": c.num_occurrences,
-                        "examples": [e.model_dump() for e in c.examples],
-                        "difficulty": c.difficulty,
-                    }
-                    for c in concepts
-                ]
-
-            pos_stats_dict = {
-                pos: {"number": stats.number, "ratio": stats.ratio}
-                for pos, stats in linguistic_analysis.pos_stats.items()
-            }
+            # Mark previous analyses as not latest before inserting, so the
+            # new row never has to be filtered back out
+            MediaAnalysisResult.objects.filter(movie=movie, is_latest=True).update(
+                is_latest=False
+            )
+
             # Create analysis result record
             result = MediaAnalysisResult.objects.create(
                 movie=movie,
@@ -104,30 +155,18 @@ class LanguageAnalysisService:
                 kind=MediaAnalysisResult.MediaType.MOVIE,
                 subtitle_id=subtitle.id,
                 subtitle_version=subtitle.version,
+                content_hash=subtitle.content_hash,
                 is_latest=True,
-                lexical_analysis={
-                    "concepts": concepts_dict,
-                    "pos_stats": pos_stats_dict,
-                    "sentences_count": linguistic_analysis.sentences_count,
-                    "sentences_avg_length": linguistic_analysis.sentences_avg_length,
-                    "difficulty": linguistic_analysis.difficulty,
-                    "duration": linguistic_analysis.duration,
-                    "time_ranges": (
-                        [tr.model_dump() for tr in linguistic_analysis.time_ranges]
-                        if linguistic_analysis.time_ranges
-                        else None
-                    ),
-                },
+                lexical_analysis=self._lexical_analysis(linguistic_analysis),
             )
             # Save movie difficulty score
             movie.difficulty = linguistic_analysis.difficulty
-            movie.save()
+            movie.save(update_fields=["difficulty", "updated_at"])
 
-
-            # Mark previous analyses as not latest
-            MediaAnalysisResult.objects.filter(movie=movie, is_latest=True).exclude(
-                id=result.id
-            ).update(is_latest=False)
+            if mark_processed:
+                subtitle.processing_status = MovieSubtitle.ProcessingStatus.PROCESSED
+                subtitle.processed_at = now()
+                subtitle.save(update_fields=["processing_status", "processed_at"])
 
             return result
 
@@ -139,3 +178,88 @@ class LanguageAnalysisService:
             movie_id=movie.id,
         )
         return result
+
+    def store_analysis_results(
+        self,
+        items: list[tuple[Movie, LinguisticProfile, MovieSubtitle]],
+        mark_processed: bool = False,
+    ) -> list[MediaAnalysisResult]:
+        """
+        Store the analysis results of a batch in a fixed number of queries,
+        instead of three per result. With mark_processed the subtitles are
+        marked processed in the same transaction.
+        """
+        log.info("Storing analysis results", count=len(items))
+
+        results: list[MediaAnalysisResult] = []
+        latest_by_movie: dict[int, MediaAnalysisResult] = {}
+        movies: dict[int, Movie] = {}
+        updated_at = now()
+
+        for movie, linguistic_analysis, subtitle in items:
+            result = MediaAnalysisResult(
+                movie=movie,
+                version=str(linguistic_analysis.analysis_version),
+                kind=MediaAnalysisResult.MediaType.MOVIE,
+                subtitle_id=subtitle.id,
+                subtitle_version=subtitle.version,
+                content_hash=subtitle.content_hash,
+                is_latest=True,
+                lexical_analysis=self._lexical_analysis(linguistic_analysis),
+            )
+            # A later result for the same movie in this batch supersedes it
+            previous = latest_by_movie.get(movie.id)
+            if previous is not None:
+                previous.is_latest = False
+            latest_by_movie[movie.id] = result
+            results.append(result)
+
+            # Save movie difficulty score
+            movie.difficulty = linguistic_analysis.difficulty
+            movie.updated_at = updated_at
+            movies[movie.id] = movie
+
+        with transaction.atomic():
+            # Mark previous analyses as not latest
+            MediaAnalysisResult.objects.filter(
+                movie_id__in=list(movies), is_latest=True
+            ).update(is_latest=False)
+
+            MediaAnalysisResult.objects.bulk_create(results)
+            Movie.objects.bulk_update(
+                list(movies.values()), ["difficulty", "updated_at"]
+            )
+
+            if mark_processed:
+                processed = MovieSubtitle.ProcessingStatus.PROCESSED
+                MovieSubtitle.objects.filter(
+                    id__in=[subtitle.id for _, _, subtitle in items]
+                ).update(processing_status=processed, processed_at=updated_at)
+                for _, _, subtitle in items:
+                    subtitle.processing_status = processed
+                    subtitle.processed_at = updated_at
+
+        log.info(
+            "Stored analysis results",
+            media_analysis_result_ids=[result.id for result in results],
+        )
+        return results
+
+    @staticmethod
+    def _lexical_analysis(linguistic_analysis: LinguisticProfile) -> dict[str, Any]:
+        """The profile as stored in MediaAnalysisResult.lexical_analysis."""
+        # One dump of the whole profile into the JSON stored for it
+        lexical_analysis = linguistic_analysis.model_dump(
+            mode="json",
+            include={
+                "concepts",
+                "pos_stats",
+                "sentences_count",
+                "sentences_avg_length",
+                "difficulty",
+                "duration",
+                "time_ranges",
+            },
+        )
+        lexical_analysis["time_ranges"] = lexical_analysis["time_ranges"] or None
+        return lexical_analysis
@@ -0,0 +1,22 @@
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("language_analysis", "0006_alter_mediaanalysisresult_kind"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="mediaanalysisresult",
+            index=models.Index(
+                condition=models.Q(is_latest=True),
+                fields=["movie", "kind"],
+                include=["version"],
+                name="idx_latest_analysis",
+            ),
+        ),
+    ]
@@ -0,0 +1,43 @@
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+def copy_subtitle_content_hash(apps, schema_editor):  # type: ignore
+    MediaAnalysisResult = apps.get_model("language_analysis", "MediaAnalysisResult")
+    MovieSubtitle = apps.get_model("subtitles", "MovieSubtitle")
+    MediaAnalysisResult.objects.filter(subtitle__isnull=False).update(
+        content_hash=models.Subquery(
+            MovieSubtitle.objects.filter(pk=models.OuterRef("subtitle_id")).values(
+                "content_hash"
+            )[:1]
+        )
+    )
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("language_analysis", "0007_mediaanalysisresult_idx_latest_analysis"),
+        ("subtitles", "0008_alter_moviesubtitle_metadata"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="mediaanalysisresult",
+            name="content_hash",
+            field=models.CharField(
+                help_text="Content hash of the analyzed subtitle, to reuse the analysis",
+                max_length=64,
+                null=True,
+            ),
+        ),
+        migrations.RunPython(copy_subtitle_content_hash, migrations.RunPython.noop),
+        AddIndexConcurrently(
+            model_name="mediaanalysisresult",
+            index=models.Index(
+                fields=["content_hash", "version"],
+                name="analysis_content_hash_idx",
+            ),
+        ),
+    ]
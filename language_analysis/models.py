@@ -1,6 +1,6 @@
 from django.contrib.postgres.indexes import GinIndex
 from django.db import models
-from django.db.models import JSONField
+from django.db.models import JSONField, Q
 
 from TMDB.models import Movie
 from media_index.base_model import TimeStampedUUIDModel
@@ -32,6 +32,11 @@ class MediaAnalysisResult(TimeStampedUUIDModel):
     subtitle_version = models.CharField(
         max_length=50, help_text="Track which subtitle version was analyzed"
     )
+    content_hash = models.CharField(
+        max_length=64,
+        null=True,
+        help_text="Content hash of the analyzed subtitle, to reuse the analysis",
+    )
     lexical_analysis = JSONField(
         help_text="JSON containing concepts, pos_stats, sentences_count, sentences_avg_length, and difficulty"
     )
@@ -41,6 +46,17 @@ class MediaAnalysisResult(TimeStampedUUIDModel):
         indexes = [
             models.Index(fields=["movie", "version"]),
             GinIndex(fields=["lexical_analysis"]),
+            # Reads and the is_latest reset only ever look at latest rows
+            models.Index(
+                fields=["movie", "kind"],
+                condition=Q(is_latest=True),
+                include=["version"],
+                name="idx_latest_analysis",
+            ),
+            models.Index(
+                fields=["content_hash", "version"],
+                name="analysis_content_hash_idx",
+            ),
         ]
 
     def __str__(self) -> str:
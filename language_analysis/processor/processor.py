@@ -1,18 +1,19 @@
 from __future__ import annotations
 
 import collections
+import csv
+import functools
 import random
+import sys
 from typing import Any
 import warnings
-from collections.abc import Iterator
+from dataclasses import dataclass, field
 from pathlib import Path
 
-import pandas as pd
+import numpy as np
 import stanza
 
 from .schema import (
-    ConceptOccurrence,
-    ConceptProfile,
     ConceptType,
     LinguisticProfile,
     NumberAndRatio,
@@ -22,54 +23,57 @@ from .schema import (
 )
 
 
-def extract_lemmas(
-    doc: stanza.Document,
-) -> Iterator[tuple[str, ConceptOccurrence]]:
-    for sentence in doc.sentences:
-        for word in sentence.words:
-            # Skip punctuation, pronouns and other non-content words
-            if (
-                word.upos in {"PUNCT", "PRON", "DET", "ADP", "CCONJ", "SCONJ", "AUX"}
-                or word.start_char is None
-            ):
-                continue
-
-            concept = word.lemma
-            example = ConceptOccurrence(
-                context=sentence.text,
-                start_char=word.start_char - sentence.tokens[0].start_char,
-                end_char=word.end_char - sentence.tokens[0].start_char,
-            )
-            yield concept, example
+# Version of the analysis, stored with every result
+ANALYSIS_VERSION = "0.1"
 
+# Punctuation, pronouns and other non-content words aren't concepts
+SKIP_UPOS = frozenset({"PUNCT", "PRON", "DET", "ADP", "CCONJ", "SCONJ", "AUX"})
 
-def extract_phrasal_verbs(
-    doc: stanza.Document,
-) -> Iterator[tuple[str, ConceptOccurrence]]:
-    for sentence in doc.sentences:
-        words_by_id = {word.id: word for word in sentence.words}
-        for word in sentence.words:
-            if word.deprel == "compound:prt":
-                if word.start_char is None:
-                    continue
-
-                parts = [words_by_id[word.head], word]
-                parts.sort(key=lambda x: x.start_char)
-
-                concept = " ".join(part.lemma for part in parts)
-
-                example = ConceptOccurrence(
-                    context=sentence.text,
-                    start_char=parts[0].start_char - sentence.tokens[0].start_char,
-                    end_char=parts[-1].end_char - sentence.tokens[0].start_char,
-                )
-                yield concept, example
 
+@dataclass(slots=True)
+class _ConceptTable:
+    """
+    Concepts of one type, held as a column per ConceptProfile field keyed by
+    concept rather than a record per concept, and assembled into profile
+    dicts only once the document is done.
+    """
 
-CONCEPT_EXTRACTORS = [
-    (ConceptType.WORD, extract_lemmas),
-    (ConceptType.PHRASAL_VERB, extract_phrasal_verbs),
-]
+    max_examples: int
+    rng: random.Random
+    occurrences: dict[str, int] = field(default_factory=dict)
+    examples: dict[str, list[dict[str, Any]]] = field(default_factory=dict)
+
+    def add(self, concept: str, example: dict[str, Any]) -> None:
+        n = self.occurrences.get(concept, 0) + 1
+        self.occurrences[concept] = n
+        if n == 1:
+            self.examples[concept] = [example]
+            return
+
+        # Keep a limited number of examples
+        examples = self.examples[concept]
+        if len(examples) < self.max_examples:
+            examples.append(example)
+        # Randomly replace an existing example with probability 1/n
+        # where n is the number of occurrences seen so far
+        elif self.rng.random() < 1 / n:
+            examples[self.rng.randrange(self.max_examples)] = example
+
+    def profiles(
+        self, concept_difficulties: dict[str, float] | None
+    ) -> list[dict[str, Any]]:
+        # In ConceptProfile's shape, validated once with the whole profile
+        return [
+            {
+                "concept": concept,
+                "num_occurrences": n,
+                "examples": self.examples[concept],
+                "difficulty": (
+                    concept_difficulties.get(concept) if concept_difficulties else None
+                ),
+            }
+            for concept, n in self.occurrences.items()
+        ]
 
 
 def analyse_parsed_text(
@@ -78,82 +82,100 @@ def analyse_parsed_text(
     concept_difficulties: dict[str, float] | None = None,
 ) -> LinguisticProfile:
     sentences_count = len(doc.sentences)
-    sentences_avg_length = (
-        sum(len(sentence.words) for sentence in doc.sentences) / sentences_count
-        if sentences_count > 0
-        else 0
-    )
+    pos_counts: collections.Counter[str] = collections.Counter()
+    # Seeded from the text so the same document keeps the same examples
+    rng = random.Random(doc.sentences[0].text if doc.sentences else None)
+    words = _ConceptTable(max_examples_per_concept, rng)
+    phrasal_verbs = _ConceptTable(max_examples_per_concept, rng)
 
-    pos_counts = collections.Counter(
-        word.upos for sentence in doc.sentences for word in sentence.words
-    )
+    # A single walk over the words feeds the POS counts and every concept type
+    for sentence in doc.sentences:
+        sentence_words = sentence.words
+        sentence_start = sentence.tokens[0].start_char
+        # Only sentences with a verb particle need to look up heads
+        words_by_id = None
 
-    # Convert pos_counts to NumberAndRatio format
+        # A list avoids resuming a generator frame for every word
+        pos_counts.update([word.upos for word in sentence_words])
+
+        for word in sentence_words:
+            if word.start_char is None:
+                continue
+
+            if word.upos not in SKIP_UPOS and word.lemma is not None:
+                # ConceptOccurrence fields, validated once with the whole profile
+                example = {
+                    "context": sentence.text,
+                    "start_char": word.start_char - sentence_start,
+                    "end_char": word.end_char - sentence_start,
+                }
+                # Lemmas repeat heavily, keep one shared string per concept
+                words.add(sys.intern(word.lemma), example)
+
+            if word.deprel == "compound:prt":
+                if words_by_id is None:
+                    words_by_id = {w.id: w for w in sentence_words}
+
+                parts = [words_by_id[word.head], word]
+                parts.sort(key=lambda x: x.start_char)
+
+                example = {
+                    "context": sentence.text,
+                    "start_char": parts[0].start_char - sentence_start,
+                    "end_char": parts[-1].end_char - sentence_start,
+                }
+                concept = sys.intern(" ".join(part.lemma for part in parts))
+                phrasal_verbs.add(concept, example)
+
+    # Every word has a POS tag, so the tag total is also the word count and
+    # the average needs no second walk over the words
     total_pos = sum(pos_counts.values())
+    sentences_avg_length = total_pos / sentences_count if sentences_count > 0 else 0
+
+    # Convert pos_counts to NumberAndRatio format
     pos_stats = {
-        pos: NumberAndRatio(number=count, ratio=count / total_pos)
+        pos: {"number": count, "ratio": count / total_pos}
         for pos, count in pos_counts.items()
     }
 
-    concepts = {}
-
-    for concept_type, extractor in CONCEPT_EXTRACTORS:
-        concept_entries: list[Any] = []
-        concept_dict = {}
-
-        for concept, example in extractor(doc):
-            new_concept_difficulty = (
-                concept_difficulties.get(concept) if concept_difficulties else None
-            )
+    concepts = {
+        ConceptType.WORD: words.profiles(concept_difficulties),
+        ConceptType.PHRASAL_VERB: phrasal_verbs.profiles(concept_difficulties),
+    }
 
-            if concept not in concept_dict:
-                concept_dict[concept] = ConceptProfile(
-                    concept=concept,
-                    num_occurrences=1,
-                    examples=[example],
-                    difficulty=new_concept_difficulty,
-                )
-            else:
-                concept_dict[concept].num_occurrences += 1
-
-                # Keep a limited number of examples
-                if len(concept_dict[concept].examples) < max_examples_per_concept:
-                    concept_dict[concept].examples.append(example)
-                else:
-                    # Randomly replace an existing example with probability 1/n
-                    # where n is the number of occurrences seen so far
-                    import random
-
-                    n = concept_dict[concept].num_occurrences
-                    if random.random() < 1 / n:
-                        replace_idx = random.randrange(max_examples_per_concept)
-                        concept_dict[concept].examples[replace_idx] = example
-
-        concept_entries.extend(concept_dict.values())
-        concepts[concept_type] = concept_entries
-
-    unique_concept_difficulties = [
-        entry.difficulty
-        for entries in concepts.values()
-        for entry in entries
-        if entry.difficulty is not None
-    ]
+    # Unrated concepts become NaN and are left out of the mean
+    unique_concept_difficulties = np.array(
+        [entry["difficulty"] for entries in concepts.values() for entry in entries],
+        dtype=np.float64,
+    )
     overall_difficulty = (
-        sum(unique_concept_difficulties) / len(unique_concept_difficulties)
-        if len(unique_concept_difficulties) > 0
-        else None
+        None
+        if np.isnan(unique_concept_difficulties).all()
+        else float(np.nanmean(unique_concept_difficulties))
     )
 
-    return LinguisticProfile(
-        analysis_version="0.1",
-        concepts=concepts,
-        pos_stats=pos_stats,
-        sentences_count=sentences_count,
-        sentences_avg_length=sentences_avg_length,
-        difficulty=overall_difficulty,
+    return LinguisticProfile.model_validate(
+        {
+            "analysis_version": ANALYSIS_VERSION,
+            "concepts": concepts,
+            "pos_stats": pos_stats,
+            "sentences_count": sentences_count,
+            "sentences_avg_length": sentences_avg_length,
+            "difficulty": overall_difficulty,
+        }
     )
 
 
+@functools.cache
+def load_concept_difficulties(csv_path: str) -> dict[str, float]:
+    """
+    Read the word difficulty ratings, once per process for each path.
+    Callers share the returned dict and must not modify it.
+    """
+    with open(csv_path, newline="", encoding="utf-8") as f:
+        return {row["word"]: float(row["rating"]) for row in csv.DictReader(f)}
+
+
 class LinguisticProcessor:
     def __init__(
         self,
@@ -166,11 +188,17 @@ class LinguisticProcessor:
                 lang="en",
                 processors="tokenize,mwt,pos,lemma,depparse",
                 verbose=False,
+                # Only download models that are missing, instead of fetching
+                # resources.json again every time a pipeline is built
+                download_method=stanza.DownloadMethod.REUSE_RESOURCES,
+                # Subtitles are many short lines, larger batches keep the
+                # tokenizer and taggers busy per forward pass
+                tokenize_batch_size=64,
+                pos_batch_size=5000,
+                depparse_batch_size=5000,
             )
 
-        df_difficulty = pd.read_csv(difficulty_csv_path)
-
-        self.concept_difficulties = df_difficulty.set_index("word")["rating"].to_dict()
+        self.concept_difficulties = load_concept_difficulties(difficulty_csv_path)
         self.max_examples_per_concept = max_examples_per_concept
 
     def process(self, text: str) -> LinguisticProfile:
@@ -181,6 +209,19 @@ class LinguisticProcessor:
             max_examples_per_concept=self.max_examples_per_concept,
         )
 
+    def process_batch(self, texts: list[str]) -> list[LinguisticProfile]:
+        # Stanza's bulk mode runs every document through each processor
+        # together, filling its batches across texts instead of per text
+        docs = self.nlp([stanza.Document([], text=text) for text in texts])
+        return [
+            analyse_parsed_text(
+                doc,
+                concept_difficulties=self.concept_difficulties,
+                max_examples_per_concept=self.max_examples_per_concept,
+            )
+            for doc in docs
+        ]
+
 
 def mock_personal_analysis(
     user_id: str, media_profile: LinguisticProfile
@@ -188,54 +229,68 @@ def mock_personal_analysis(
     """
     This function simulates behaviour of the API endpoint that will be provided by the Glite backend.
     """
-    # Create a local random number generator seeded with user_id
-    rng = random.Random(hash(user_id))
+    # Create a local random number generator seeded with user_id, values are
+    # drawn as whole arrays per field instead of one call per concept
+    rng = np.random.default_rng(hash(user_id) & 0xFFFF_FFFF)
 
     # Convert concepts to personal concepts
     personal_concepts: dict[ConceptType, list[PersonalConceptProfile]] = {}
     for concept_type, concepts in media_profile.concepts.items():
-        personal_concepts[concept_type] = []
-        for concept in concepts:
-            # Generate random personal data
-            in_learning = rng.random() < 0.3
-            prob_known = rng.random() if not in_learning else rng.random() * 0.5
-
-            personal_difficulty = None
-            if concept.difficulty is not None:
-                # Randomly adjust difficulty by ±10%
-                personal_difficulty = concept.difficulty * (0.9 + 0.2 * rng.random())
-
-            personal_concepts[concept_type].append(
-                PersonalConceptProfile(
-                    **concept.model_dump(),
-                    personal_difficulty=personal_difficulty,
-                    in_learning=in_learning,
-                    prob_known=prob_known,
-                )
+        count = len(concepts)
+        # Generate random personal data
+        in_learning = rng.random(count) < 0.3
+        prob_known = rng.random(count) * np.where(in_learning, 0.5, 1.0)
+        # Randomly adjust difficulty by ±10%
+        difficulty_factor = 0.9 + 0.2 * rng.random(count)
+
+        # The concepts were validated with the profile and the added values
+        # are plain Python types, build without dumping and re-validating
+        personal_concepts[concept_type] = [
+            PersonalConceptProfile.model_construct(
+                **concept.__dict__,
+                personal_difficulty=(
+                    concept.difficulty * factor
+                    if concept.difficulty is not None
+                    else None
+                ),
+                in_learning=learning,
+                prob_known=known,
             )
+            for concept, learning, known, factor in zip(
+                concepts,
+                in_learning.tolist(),
+                prob_known.tolist(),
+                difficulty_factor.tolist(),
+            )
+        ]
 
     # Generate personal time range stats if original has time ranges
     personal_time_ranges = None
     if media_profile.time_ranges:
+        count = len(media_profile.time_ranges)
+        # Generate random number of unknown concepts (0-5)
+        unknown_counts = np.rint(rng.random(count) * 5).astype(int).tolist()
+        difficulty_factors = (0.9 + 0.2 * rng.random(count)).tolist()
+        # Calculate ratio based on total concepts in this range
+        total_concepts = sum(
+            len(concepts) for concepts in media_profile.concepts.values()
+        )
+
         personal_time_ranges = []
-        for tr in media_profile.time_ranges:
-            # Generate random number of unknown concepts (0-5)
-            num_unknown = round(rng.random() * 5)
-            # Calculate ratio based on total concepts in this range
-            total_concepts = sum(
-                len(concepts) for concepts in media_profile.concepts.values()
-            )
+        for tr, num_unknown, factor in zip(
+            media_profile.time_ranges, unknown_counts, difficulty_factors
+        ):
             ratio = num_unknown / total_concepts if total_concepts > 0 else 0
             est_unknown = NumberAndRatio(number=num_unknown, ratio=ratio)
 
             personal_difficulty = None
             if tr.difficulty is not None:
                 # Randomly adjust difficulty by ±10%
-                personal_difficulty = tr.difficulty * (0.9 + 0.2 * rng.random())
+                personal_difficulty = tr.difficulty * factor
 
             personal_time_ranges.append(
-                PersonalTimeRangeStats(
-                    **tr.model_dump(),
+                PersonalTimeRangeStats.model_construct(
+                    **tr.__dict__,
                     personal_difficulty=personal_difficulty,
                     estimated_unknown_concepts=est_unknown,
                 )
@@ -255,7 +310,14 @@ def mock_personal_analysis(
         for concept in concepts
     ]
     recommended = (
-        rng.sample(all_concepts, min(5, len(all_concepts))) if all_concepts else None
+        [
+            all_concepts[i]
+            for i in rng.choice(
+                len(all_concepts), size=min(5, len(all_concepts)), replace=False
+            ).tolist()
+        ]
+        if all_concepts
+        else None
     )
 
     # Generate personal difficulty by adjusting media difficulty by ±10%
@@ -36,6 +36,7 @@ class MediaAnalysisStatsResponse(Schema):
 
 
 class JobResponse(Schema):
+    status: str
     job_id: str
 
 
@@ -3,6 +3,7 @@ from datetime import datetime
 import structlog
 from subtitles.models import MovieSubtitle
 from subtitles.services.subtitle_processor import SubtitleProcessor
+from subtitles.utils import fetch_subtitle_content, get_active_subtitle
 
 log: structlog.BoundLogger = structlog.get_logger(__name__)
 
@@ -42,6 +43,113 @@ def process_unprocessed_subtitles(max_subtitles: int = 0) -> None:
         return
 
 
+@typed_job("subtitles", timeout=28800)
+def process_single_subtitle(tmdb_id: str) -> None:
+    """Background job to analyse and store the active subtitle of one movie"""
+    log.info(
+        "Starting subtitle processing job",
+        tmdb_id=tmdb_id,
+        function="process_single_subtitle",
+    )
+
+    subtitle: MovieSubtitle | None = None
+    try:
+        processor = SubtitleProcessor()
+        language_service = processor.language_service
+
+        # Claimed the way the bulk workers claim subtitles, so a second
+        # request for the same movie doesn't run the pipeline twice
+        claimed = processor.get_unprocessed_subtitles(
+            limit=1, ids=[get_active_subtitle(tmdb_id).id]
+        )
+        if not claimed:
+            log.info(
+                "Subtitle already claimed or out of attempts, skipping",
+                tmdb_id=tmdb_id,
+                function="process_single_subtitle",
+            )
+            return
+        subtitle = claimed[0]
+
+        # The same content analysed before gives the same analysis
+        linguistic_analysis = language_service.find_stored_analyses(
+            [subtitle.content_hash]
+        ).get(subtitle.content_hash)
+
+        if linguistic_analysis is None:
+            subtitle_text = fetch_subtitle_content(subtitle, processor.storage_service)
+
+            linguistic_analysis = language_service.process_text(
+                text=subtitle_text,
+                media_type="movie",
+                original_language=subtitle.language,
+            )
+        else:
+            log.info(
+                "Reusing stored analysis for subtitle content",
+                tmdb_id=tmdb_id,
+                content_hash=subtitle.content_hash,
+            )
+
+        # The analysis and the processed mark are written in one transaction
+        language_service.store_analysis_result(
+            movie=subtitle.movie,
+            subtitle=subtitle,
+            linguistic_analysis=linguistic_analysis,
+            mark_processed=True,
+        )
+
+        log.info(
+            "Successfully processed subtitle",
+            tmdb_id=tmdb_id,
+            subtitle_id=subtitle.id,
+            function="process_single_subtitle",
+        )
+
+    except Exception as e:
+        log.error(
+            "Subtitle processing job failed",
+            tmdb_id=tmdb_id,
+            error=str(e),
+            function="process_single_subtitle",
+            exc_info=True,
+        )
+        if subtitle is not None:
+            # Release the claim, the bulk workers retry it like any failure
+            MovieSubtitle.objects.filter(id=subtitle.id).update(
+                processing_status=MovieSubtitle.ProcessingStatus.FAILED,
+                processing_error=str(e),
+            )
+        raise
+
+
+@typed_job("subtitles", timeout=28800)
+def process_subtitle_chunk(subtitle_ids: list[int]) -> None:
+    """Background job to process a fixed set of subtitles"""
+    log.info(
+        "Starting subtitle chunk processing job",
+        subtitle_count=len(subtitle_ids),
+        function="process_subtitle_chunk",
+    )
+
+    processor = SubtitleProcessor()
+    # Subtitles already claimed by another worker or processed are skipped
+    batch = processor.get_unprocessed_subtitles(
+        limit=len(subtitle_ids), ids=subtitle_ids
+    )
+    results = processor.process_subtitles(batch) if batch else []
+    successful = sum(result["status"] == "success" for result in results)
+
+    log.info(
+        "Completed subtitle chunk",
+        requested=len(subtitle_ids),
+        claimed=len(batch),
+        successful=successful,
+        failed=len(results) - successful,
+        function="process_subtitle_chunk",
+    )
+
+
 def _process_unprocessed_subtitles(
     max_subtitles: int = 0,
     batch_size: int = 30,
@@ -67,8 +175,8 @@ def _process_unprocessed_subtitles(
 
     try:
         while True:
-            # Check if we've hit max batches
-            if stats["batches_processed"] >= max_batches:
+            # Check if we've hit max batches, 0 means no limit
+            if max_batches and stats["batches_processed"] >= max_batches:
                 log.info(
                     "Reached maximum batch limit",
                     max_batches=max_batches,
@@ -76,8 +184,21 @@ def _process_unprocessed_subtitles(
                 )
                 break
 
+            # Same for max subtitles, the last batch only takes what's left
+            limit = batch_size
+            if max_subtitles:
+                remaining = max_subtitles - int(stats["total_processed"])
+                if remaining <= 0:
+                    log.info(
+                        "Reached maximum subtitle limit",
+                        max_subtitles=max_subtitles,
+                        total_processed=stats["total_processed"],
+                    )
+                    break
+                limit = min(batch_size, remaining)
+
             batch: list[MovieSubtitle] = processor.get_unprocessed_subtitles(
-                limit=max_subtitles
+                limit=limit
             )
 
             # No more subtitles to process
@@ -88,9 +209,8 @@ def _process_unprocessed_subtitles(
                 )
                 break
 
-            # Process this batch
-            for subtitle in batch:
-                result = processor.process_subtitle(subtitle)
+            # Process this batch, its texts are analysed together
+            for result in processor.process_subtitles(batch):
                 stats["total_processed"] += 1
                 if result["status"] == "success":
                     stats["successful"] += 1
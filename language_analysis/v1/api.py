@@ -1,40 +1,46 @@
+import asyncio
+import logging
+from functools import lru_cache
 from http import HTTPStatus
 import django_rq
 import structlog
+from asgiref.sync import sync_to_async
 from django.http import HttpRequest
 from ninja import Router
+from rq import Queue
 
 from TMDB.models import Movie
 from language_analysis.analysis import (
     LanguageAnalysisService,
 )
 from language_analysis.models import MediaAnalysisResult
-from language_analysis.processor.schema import (
-    ConceptOccurrence,
-    ConceptProfile,
-    ConceptType,
-    LinguisticProfile,
-    NumberAndRatio,
-)
+from language_analysis.processor.schema import LinguisticProfile
 from language_analysis.schemas import (
     ProcessTextRequest,
     ProcessTextResponse,
     ErrorResponse,
+    JobResponse,
 )
-from language_analysis.tasks import process_unprocessed_subtitles
-from subtitles.models import MovieSubtitle
-from subtitles.utils import (
-    mark_subtitle_as_processed,
-    fetch_subtitle_content,
-    get_active_subtitle,
+from language_analysis.tasks import (
+    process_single_subtitle,
+    process_subtitle_chunk,
 )
+from subtitles.models import MovieSubtitle
 from media_index.errors import RESTError
-from subtitles.services.storage import SubtitleStorageService
 
 
 log: structlog.BoundLogger = structlog.get_logger(__name__)
 router = Router(tags=["Linguistic Processing"])
 
+# Subtitles per bulk processing job, one analysis batch each
+SUBTITLE_CHUNK_SIZE = 30
+
+
+# The service holds no per-request state, share one per process
+@lru_cache(maxsize=1)
+def _language_service() -> LanguageAnalysisService:
+    return LanguageAnalysisService()
+
 
 @router.post(
     "/process",
@@ -42,7 +48,7 @@ router = Router(tags=["Linguistic Processing"])
     summary="Process text and generate linguistic analysis",
     description="Analyze text content and return linguistic statistics",
 )
-def process_text(
+async def process_text(
     request: HttpRequest,
     payload: ProcessTextRequest,
 ) -> ProcessTextResponse:
@@ -61,63 +67,34 @@ def process_text(
 
     try:
 
-        language_service = LanguageAnalysisService()
+        language_service = _language_service()
 
-        analysis: LinguisticProfile = language_service.process_text(
+        # The NLP pipeline is CPU bound, keep the event loop serving requests
+        analysis: LinguisticProfile = await asyncio.to_thread(
+            language_service.process_text,
             text=payload.text,
             media_type=payload.type,
             original_language=payload.original_language,
         )
 
-        log.info(
-            "Analysis Results",
-            version=analysis.analysis_version,
-            concepts=analysis.concepts,
-            pos_stats=analysis.pos_stats,
-            sentences_count=analysis.sentences_count,
-            sentences_avg_length=analysis.sentences_avg_length,
-            difficulty=analysis.difficulty,
-        )
-
-        response_data = LinguisticProfile(
-            analysis_version=analysis.analysis_version,
-            concepts={
-                concept_type: [
-                    ConceptProfile(
-                        concept=profile.concept,
-                        num_occurrences=profile.num_occurrences,
-                        examples=[
-                            ConceptOccurrence(
-                                context=example.context,
-                                start_char=example.start_char,
-                                end_char=example.end_char,
-                                time=example.time,
-                            )
-                            for example in profile.examples
-                        ],
-                        difficulty=profile.difficulty,
-                    )
-                    for profile in profiles
-                ]
-                for concept_type, profiles in analysis.concepts.items()
-            },
-            pos_stats={
-                pos_type: NumberAndRatio(
-                    number=stats.number,
-                    ratio=stats.ratio,
-                )
-                for pos_type, stats in analysis.pos_stats.items()
-            },
-            sentences_count=analysis.sentences_count,
-            sentences_avg_length=analysis.sentences_avg_length,
-            duration=analysis.duration,
-            time_ranges=analysis.time_ranges,
-            difficulty=analysis.difficulty,
-        )
+        # The call itself would drop the event, but only after its arguments
+        # were built, so skip the concept counts unless DEBUG is enabled
+        if log.is_enabled_for(logging.DEBUG):
+            log.debug(
+                "Analysis Results",
+                version=analysis.analysis_version,
+                concepts_count={
+                    concept_type: len(profiles)
+                    for concept_type, profiles in analysis.concepts.items()
+                },
+                sentences_count=analysis.sentences_count,
+                sentences_avg_length=analysis.sentences_avg_length,
+                difficulty=analysis.difficulty,
+            )
 
         return ProcessTextResponse(
             status="success",
-            data=response_data,
+            data=analysis,
         )
 
     except Exception as e:
@@ -165,10 +142,9 @@ async def get_movie_linguistic_data(
     )
 
     try:
-        movie = await Movie.objects.aget(tmdb_id=movie_id)
-
+        # Filtering through the movie join saves a round trip for the Movie
         query = MediaAnalysisResult.objects.filter(
-            movie=movie,
+            movie__tmdb_id=movie_id,
             kind=MediaAnalysisResult.MediaType.MOVIE,
         )
 
@@ -177,9 +153,13 @@ async def get_movie_linguistic_data(
         else:
             query = query.filter(is_latest=True)
 
-        analysis = await query.afirst()
+        # Only the stored profile is returned, skip building the model
+        analysis = await query.values("id", "version", "lexical_analysis").afirst()
 
         if not analysis:
+            # Only a miss needs to tell an unknown movie from a missing analysis
+            if not await Movie.objects.filter(tmdb_id=movie_id).aexists():
+                raise Movie.DoesNotExist
             raise RESTError(
                 message=(
                     f"No linguistic analysis found for movie {movie_id}"
@@ -188,18 +168,16 @@ async def get_movie_linguistic_data(
                 status_code=HTTPStatus.NOT_FOUND,
             )
 
-        lexical_data = analysis.lexical_analysis
-
         log.info(
             "Successfully retrieved movie linguistic data",
             movie_id=movie_id,
-            analysis_id=analysis.id,
-            version=analysis.version,
+            analysis_id=analysis["id"],
+            version=analysis["version"],
         )
 
         return ProcessTextResponse(
             status="success",
-            data=lexical_data,
+            data=analysis["lexical_analysis"],
         )
 
     except Movie.DoesNotExist:
@@ -212,6 +190,9 @@ async def get_movie_linguistic_data(
             status_code=HTTPStatus.NOT_FOUND,
         )
 
+    except RESTError:
+        raise
+
     except Exception as e:
         log.error(
             "Failed to retrieve movie linguistic data",
@@ -228,60 +209,37 @@ async def get_movie_linguistic_data(
 
 @router.post(
     "/media/{tmdb_id}/process/subtitle",
+    response={200: JobResponse, 404: ErrorResponse},
     summary="Process and store movie subtitle",
-    description="Analyzes a given movie subtitle and stores the results",
+    description="Queues analysis of a movie's active subtitle and storage of the results",
 )
-def process_and_persist_subtitle_analysis(
+async def process_and_persist_subtitle_analysis(
     request: HttpRequest, tmdb_id: str
-) -> LinguisticProfile:
-    log.info("Enqueuing subtitle processing job for movie ID: %s", tmdb_id)
-
-    try:
-        language_service = LanguageAnalysisService()
-        storage_service = SubtitleStorageService()
-
-        movie = Movie.objects.get(tmdb_id=tmdb_id)
-
-        subtitle = get_active_subtitle(movie)
-
-        subtitle_text = fetch_subtitle_content(subtitle, storage_service)
-
-        """Analyze the subtitle text and generate a linguistic analysis."""
+) -> JobResponse:
+    log.info("Enqueuing subtitle processing job", tmdb_id=tmdb_id)
 
-        linguistic_analysis = language_service.process_text(
-            text=subtitle_text,
-            media_type="movie",
-            original_language=subtitle.language,
-        )
-
-        language_service.store_analysis_result(
-            movie=movie,
-            subtitle=subtitle,
-            linguistic_analysis=linguistic_analysis,
+    if not await Movie.objects.filter(tmdb_id=tmdb_id).aexists():
+        log.warning("Movie not found", tmdb_id=tmdb_id)
+        raise RESTError(
+            message=f"Movie with ID {tmdb_id} not found",
+            status_code=HTTPStatus.NOT_FOUND,
         )
 
-        is_processed = mark_subtitle_as_processed(subtitle)
+    # Analysis takes minutes per subtitle, the subtitles worker runs it
+    queue = django_rq.get_queue("subtitles", default_timeout=28800)
+    # The enqueue is a blocking Redis round trip, keep it off the event loop
+    job = await sync_to_async(queue.enqueue)(process_single_subtitle, tmdb_id)
 
-        if not is_processed:
-            log.info("Subtitle processing failed for movie ID: %s", tmdb_id)
+    log.info("Queued subtitle processing", tmdb_id=tmdb_id, job_id=job.id)
 
-        log.info("Successfully processed subtitle for movie ID: %s", tmdb_id)
-
-        return linguistic_analysis
-
-    except Movie.DoesNotExist:
-        log.warning("Movie not found with ID %s", tmdb_id)
-        raise
-    except Exception as e:
-        log.error("Error processing subtitle for movie ID %s: %s", tmdb_id, str(e))
-        raise
+    return JobResponse(status="queued", job_id=job.id)
 
 
 @router.post("/process/bulk")
 async def start_bulk_processing(
     request: HttpRequest, max_subtitles: int | None = None
-) -> dict[str, str | int]:
-    """Start bulk processing of unprocessed subtitles"""
+) -> dict[str, str | int | list[str]]:
+    """Start bulk processing of unprocessed subtitles, in parallel chunk jobs"""
     log.info(
         "Received batch processing request",
         max_subtitles=max_subtitles,
@@ -289,12 +247,16 @@ async def start_bulk_processing(
     )
 
     try:
-        # Get count of unprocessed subtitles
-        total_unprocessed = await MovieSubtitle.objects.filter(
-            is_active=True, subtitle_is_processed=False
-        ).acount()
-
-        if total_unprocessed == 0:
+        # Most popular first, the order the workers would pick them in
+        subtitle_ids = [
+            subtitle_id
+            async for subtitle_id in MovieSubtitle.objects.filter(is_active=True)
+            .exclude(processing_status=MovieSubtitle.ProcessingStatus.PROCESSED)
+            .order_by("-movie__vote_count", "processing_attempts", "created_at")
+            .values_list("id", flat=True)[: max_subtitles or None]
+        ]
+
+        if not subtitle_ids:
             log.info(
                 "No unprocessed subtitles found, skipping",
                 function="start_batch_processing",
@@ -303,33 +265,39 @@ async def start_bulk_processing(
 
         log.info(
             "Found unprocessed subtitles",
-            total_unprocessed=total_unprocessed,
+            total_unprocessed=len(subtitle_ids),
             max_subtitles=max_subtitles,
             function="start_batch_processing",
         )
 
+        # Every chunk is its own job, so workers share the load and a
+        # failure only retries its own chunk
         queue = django_rq.get_queue("subtitles", default_timeout=28800)
-        # Queue processing job
-        job = queue.enqueue(
-            process_unprocessed_subtitles,
-            kwargs={
-                "max_subtitles": max_subtitles,
-            },
+        jobs = await sync_to_async(queue.enqueue_many)(
+            [
+                Queue.prepare_data(
+                    process_subtitle_chunk,
+                    args=(subtitle_ids[start : start + SUBTITLE_CHUNK_SIZE],),
+                    timeout=28800,
+                )
+                for start in range(0, len(subtitle_ids), SUBTITLE_CHUNK_SIZE)
+            ]
         )
+        job_ids = [job.id for job in jobs]
 
         log.info(
             "Queued batch subtitle processing",
-            job_id=job.id,
-            total_unprocessed=total_unprocessed,
+            jobs_count=len(job_ids),
+            total_unprocessed=len(subtitle_ids),
             max_subtitles=max_subtitles,
             function="start_batch_processing",
         )
 
         return {
             "status": "queued",
-            "job_id": job.id,
-            "total_unprocessed": total_unprocessed,
-            "max_subtitles": max_subtitles or total_unprocessed,
+            "job_ids": job_ids,
+            "total_unprocessed": len(subtitle_ids),
+            "max_subtitles": max_subtitles or len(subtitle_ids),
         }
 
     except Exception as e:
@@ -0,0 +1,25 @@
+from typing import Any
+
+import structlog
+from rq import Worker
+
+from language_analysis.analysis import LinguisticProcessorSingleton
+
+log: structlog.BoundLogger = structlog.get_logger(__name__)
+
+SUBTITLES_QUEUE = "subtitles"
+
+
+class LinguisticWorker(Worker):
+    """
+    RQ worker that loads the linguistic processor once before taking jobs.
+
+    Each job runs in a work horse forked from this process, so the loaded
+    pipeline is inherited by every job instead of being rebuilt per job.
+    """
+
+    def work(self, *args: Any, **kwargs: Any) -> bool:
+        if SUBTITLES_QUEUE in self.queue_names():
+            log.info("Preloading LinguisticProcessor", worker=self.name)
+            LinguisticProcessorSingleton.get_instance()
+        return super().work(*args, **kwargs)
@@ -4,9 +4,10 @@ from django.http import HttpResponse, HttpRequest
 from language_analysis.v1.api import router as language_analysis_router
 from TMDB.v1.api import router as movie_router
 from media_index.errors import RESTError, FeatureDisabledError
+from media_index.renderers import ORJSONRenderer
 from subtitles.v1.api import router as subtitles_router
 
-api = NinjaExtraAPI()
+api = NinjaExtraAPI(renderer=ORJSONRenderer())
 
 api.add_router("/media/", movie_router)
 api.add_router("/subtitles/", subtitles_router)
@@ -20,7 +20,8 @@ class RESTError(Exception):
         message: str = "Bad request",
         status_code: HTTPStatus = HTTPStatus.BAD_REQUEST,
     ) -> None:
-        if len(message) > 200:
+        # A development check, skipped under python -O
+        if __debug__ and len(message) > 200:
             log.warning(
                 "RESTError message too long",
                 message=message,
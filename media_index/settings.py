@@ -13,6 +13,7 @@ https://docs.djangoproject.com/en/5.1/ref/settings/
 import django_stubs_ext
 
 
+import logging
 from pathlib import Path
 from typing import Any
 
@@ -51,6 +52,7 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
     "django_rq",
     "django_structlog",
     "language_analysis",
@@ -100,6 +102,10 @@ AWS_SECRET_ACCESS_KEY = env("AWS_SECRET_ACCESS_KEY")
 
 DATABASES = {"default": env.db("DATABASE_URL")}
 DATABASES["default"]["ATOMIC_REQUESTS"] = False
+# Keep connections between requests, so per-connection prepared search
+# statements are reused rather than prepared again on every request
+DATABASES["default"]["CONN_MAX_AGE"] = env.int("CONN_MAX_AGE", default=60)
+DATABASES["default"]["CONN_HEALTH_CHECKS"] = True
 
 REDIS_URL = env("REDIS_URL", default="redis://127.0.0.1:6379/0")
 # Password validation
@@ -284,6 +290,9 @@ SUBTITLE_SETTINGS = {
 # Add subtitle queue configuration to RQ settings
 RQ_QUEUES["subtitles"] = {"URL": REDIS_URL, "DEFAULT_TIMEOUT": 28800}
 
+# Workers for the subtitles queue load the NLP pipeline before their first job
+RQ = {"WORKER_CLASS": "language_analysis.workers.LinguisticWorker"}
+
 # TMDB sync settings
 TMDB_SYNC_TIMEOUT = 360  # seconds
 TMDB_CACHE_TTL = 30  # days
@@ -292,6 +301,8 @@ TMDB_MAX_RETRY_ATTEMPTS = 3
 
 
 structlog.configure(
+    # Drops calls below INFO before an event dict is even built
+    wrapper_class=structlog.make_filtering_bound_logger(logging.INFO),
     processors=[
         structlog.contextvars.merge_contextvars,
         structlog.stdlib.filter_by_level,
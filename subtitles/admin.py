@@ -1,9 +1,31 @@
 from django.contrib import admin
+from django.contrib.admin.views.main import ChangeList
 from django.db.models import QuerySet
 
 from subtitles.models import MovieSubtitle
 
 
+class MovieSubtitleChangeList(ChangeList):
+    def get_queryset(self, request, exclude_parameters=None):  # type: ignore
+        # The list only renders a few columns, leave the metadata, errors and
+        # file paths in the database. Movie.__str__ needs its language code.
+        return (
+            super()
+            .get_queryset(request, exclude_parameters)
+            .select_related("movie__language")
+            .only(
+                "id",
+                "movie__title",
+                "movie__tmdb_id",
+                "movie__language__code",
+                "subtitle_format",
+                "language",
+                "processing_status",
+                "is_active",
+            )
+        )
+
+
 @admin.register(MovieSubtitle)
 class MovieSubtitleAdmin(admin.ModelAdmin[MovieSubtitle]):
     list_display = [
@@ -19,8 +41,14 @@ class MovieSubtitleAdmin(admin.ModelAdmin[MovieSubtitle]):
     ordering = ["processing_status"]
     autocomplete_fields = ["movie"]
     search_fields = ["movie__title", "movie__tmdb_id"]
+    list_per_page = 50
+    # Skip the unfiltered COUNT(*) on every filtered page
+    show_full_result_count = False
 
     raw_id_fields = ("movie",)
 
     def get_queryset(self, request):  # type: ignore
         return super().get_queryset(request).select_related("movie")
+
+    def get_changelist(self, request, **kwargs):  # type: ignore
+        return MovieSubtitleChangeList
@@ -0,0 +1,39 @@
+from django.contrib.postgres.operations import (
+    AddIndexConcurrently,
+    RemoveIndexConcurrently,
+)
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("subtitles", "0005_alter_moviesubtitle_subtitle_is_processed"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="moviesubtitle",
+            index=models.Index(
+                fields=["processing_status", "is_active", "language"],
+                name="subtitle_status_idx",
+            ),
+        ),
+        RemoveIndexConcurrently(
+            model_name="moviesubtitle",
+            name="subtitles_m_movie_i_15603a_idx",
+        ),
+        RemoveIndexConcurrently(
+            model_name="moviesubtitle",
+            name="subtitles_m_content_c00bf6_idx",
+        ),
+        RemoveIndexConcurrently(
+            model_name="moviesubtitle",
+            name="subtitles_m_process_8207f8_idx",
+        ),
+        RemoveIndexConcurrently(
+            model_name="moviesubtitle",
+            name="subtitles_m_languag_cad6d8_idx",
+        ),
+    ]
@@ -0,0 +1,23 @@
+from django.db import migrations
+
+
+def copy_processed_flag(apps, schema_editor):  # type: ignore
+    MovieSubtitle = apps.get_model("subtitles", "MovieSubtitle")
+    MovieSubtitle.objects.filter(subtitle_is_processed=True).update(
+        processing_status="processed"
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("subtitles", "0006_compact_moviesubtitle_indexes"),
+    ]
+
+    operations = [
+        migrations.RunPython(copy_processed_flag, migrations.RunPython.noop),
+        migrations.RemoveField(
+            model_name="moviesubtitle",
+            name="subtitle_is_processed",
+        ),
+    ]
@@ -0,0 +1,19 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("subtitles", "0007_remove_moviesubtitle_subtitle_is_processed"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="moviesubtitle",
+            name="metadata",
+            field=models.JSONField(
+                db_default=models.Value({}, models.JSONField()),
+                default=dict,
+            ),
+        ),
+    ]
@@ -55,8 +55,10 @@ class MovieSubtitle(TimeStampedUUIDModel):
     quality_score = models.FloatField(
         null=True, help_text="Calculated quality score (0-1)"
     )
+    # db_default covers inserts made outside the ORM, e.g. bulk loads
     metadata = models.JSONField(
         default=dict,
+        db_default=models.Value({}, models.JSONField()),
     )
     is_active = models.BooleanField(
         default=True,
@@ -83,18 +85,17 @@ class MovieSubtitle(TimeStampedUUIDModel):
         blank=True,
         help_text="Timestamp when processing completed successfully",
     )
-    subtitle_is_processed = models.BooleanField(
-        default=False, help_text="Subtitle text as processed"
-    )
 
     class Meta:
+        # Movie and language lookups use the unique constraint's index
         indexes = [
-            models.Index(fields=["movie", "language", "is_active"]),
             models.Index(fields=["movie", "version"]),
-            models.Index(fields=["content_hash"]),
             models.Index(fields=["quality_score"]),
-            models.Index(fields=["processing_status"]),
-            models.Index(fields=["language", "processing_status", "is_active"]),
+            # Status leads so the processing queue query can use it too
+            models.Index(
+                fields=["processing_status", "is_active", "language"],
+                name="subtitle_status_idx",
+            ),
             models.Index(fields=["last_processing_attempt"]),
         ]
         unique_together = [("movie", "language", "content_hash")]
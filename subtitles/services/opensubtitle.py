@@ -1,8 +1,19 @@
 import asyncio
+import atexit
+import contextvars
+import functools
+import json
+import os
+import threading
+import time
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
-from io import BytesIO
+from tempfile import NamedTemporaryFile
+import requests
 import structlog
-from typing import Callable, Any
+from typing import IO, Callable, Any
 
 from django.conf import settings
 from opensubtitlescom import OpenSubtitles, OpenSubtitlesException
@@ -11,6 +22,7 @@ from opensubtitlescom.responses import DownloadResponse, Subtitle
 
 from TMDB.services.tmdb_service import RateLimiter
 from .subtitle_scoring import SubtitleQualityScorer
+from .token_cache import invalidate_token, load_token, store_token
 from ..models import MovieSubtitle
 from ..schemas import (
     FeatureDetails,
@@ -25,10 +37,122 @@ log: structlog.BoundLogger = structlog.get_logger(__name__)
 
 SUBTITLE_AUTH_SETTINGS = settings.SUBTITLE_SETTINGS["OPENSUBTITLES"]
 
+# Subtitle files are streamed to disk in chunks of this many bytes
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+# (connect, read) seconds, so a stalled file server can't hold a worker thread
+DOWNLOAD_TIMEOUT = (5, 30)
+
+# Blocking client calls run here rather than in the loop's default executor,
+# sized for the 5 requests/sec ceiling plus slow downloads
+_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="opensubs")
+atexit.register(_executor.shutdown, wait=False)
+
+
+async def _run_blocking(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """Run a blocking client call on the OpenSubtitles pool, like to_thread"""
+    # Carry the structlog context vars over, as asyncio.to_thread does
+    call = functools.partial(contextvars.copy_context().run, func, *args, **kwargs)
+    return await asyncio.get_running_loop().run_in_executor(_executor, call)
+
+
+def _header_seconds(headers: Mapping[str, str], name: str) -> float | None:
+    """A numeric header such as RateLimit-Remaining or Retry-After, if present."""
+    try:
+        return float(headers[name])
+    except (KeyError, ValueError):
+        # Missing, or Retry-After given as an HTTP date
+        return None
+
+
+class OpenSubtitlesHTTPError(OpenSubtitlesException):  # type: ignore
+    """An API error response, with what the retry logic needs from it"""
+
+    def __init__(
+        self, message: str, status_code: int, retry_after: float | None = None
+    ) -> None:
+        super().__init__(message)
+        self.status_code = status_code
+        self.retry_after = retry_after
+
+    def __str__(self) -> str:
+        return str(self.message)
+
+
+class OpenSubtitlesFetchError(OpenSubtitlesException):  # type: ignore
+    """
+    Fetching a subtitle file from its download link failed. Never retried:
+    the link has already used up quota, and a retry would request (and pay
+    for) a new one.
+    """
+
+
+def _is_retryable(error: Exception) -> bool:
+    """Rate limits, server errors and dropped connections are worth retrying"""
+    if isinstance(error, OpenSubtitlesFetchError):
+        return False
+    if isinstance(error, OpenSubtitlesHTTPError):
+        return error.status_code == 429 or error.status_code >= 500
+    cause = error.__cause__ or error
+    return isinstance(
+        cause, (requests.exceptions.ConnectionError, requests.exceptions.Timeout)
+    )
+
 
 class CustomOpenSubtitlesClient(OpenSubtitles):  # type: ignore
     """OVERIDE CLIENT DOWNLOAD METHOD TO RETURN RAW FILE LINK"""
 
+    # Receives the headers of every API response, e.g. to follow rate limits
+    on_response: Callable[[Mapping[str, str]], None] | None = None
+
+    def send_api(
+        self,
+        cmd: str,
+        body: dict[str, Any] | None = None,
+        method: str | None = None,
+    ) -> Any:
+        """
+        Send the API request. Same as the library's, but the response headers
+        are passed to on_response and errors keep their status code.
+        """
+        headers = {
+            "Accept": "application/json",
+            "Content-Type": "application/json",
+            "API-Key": self.api_key,
+            "User-Agent": self.user_agent,
+        }
+        if self.token:
+            headers["authorization"] = self.token
+        if not method:
+            method = "POST" if body else "GET"
+
+        try:
+            response = requests.request(
+                method,
+                f"{self.base_url}/{cmd}",
+                data=json.dumps(body) if method == "POST" else None,
+                headers=headers,
+            )
+        except requests.exceptions.RequestException as req_err:
+            raise OpenSubtitlesException(
+                f"Failed to send request: {req_err}"
+            ) from req_err
+
+        if self.on_response is not None:
+            self.on_response(response.headers)
+
+        if response.status_code >= 400:
+            raise OpenSubtitlesHTTPError(
+                f"API `{cmd}` failed with {response.status_code}: "
+                f"{response.content.decode('utf-8', errors='replace')}",
+                status_code=response.status_code,
+                retry_after=_header_seconds(response.headers, "Retry-After"),
+            )
+
+        try:
+            return response.json()
+        except ValueError as ex:
+            raise OpenSubtitlesException(f"Failed to parse JSON response: {ex}")
+
     def download(
         self,
         file_id: str | Subtitle,
@@ -38,9 +162,10 @@ class CustomOpenSubtitlesClient(OpenSubtitles):  # type: ignore
         out_fps: int | None = None,
         timeshift: int | None = None,
         force_download: bool | None = None,
-    ) -> tuple[bytes, DownloadResponse]:
+    ) -> tuple[IO[bytes], DownloadResponse]:
         """
-        Download a single subtitle file using the file_no.
+        Download a single subtitle file using the file_no, streamed into a
+        temporary file that is removed once closed.
 
         Docs: https://opensubtitles.stoplight.io/docs/opensubtitles-api/6be7f6ae2d918-download
         """
@@ -71,19 +196,44 @@ class CustomOpenSubtitlesClient(OpenSubtitles):  # type: ignore
         )
         self.user_downloads_remaining = search_response_data.remaining
 
-        return self.download_client.get(search_response_data.link), search_response_data
+        content = NamedTemporaryFile()
+        try:
+            with requests.get(
+                search_response_data.link, stream=True, timeout=DOWNLOAD_TIMEOUT
+            ) as response:
+                response.raise_for_status()
+                for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                    content.write(chunk)
+            content.seek(0)
+        except Exception as e:
+            content.close()
+            raise OpenSubtitlesFetchError(f"Failed to fetch subtitle file: {e}") from e
+
+        return content, search_response_data
 
 
+@dataclass
 class OpenSubtitlesRateLimiter(RateLimiter):
-    def __init__(self) -> None:
-        self.user_downloads_remaining: int | None = None
-        self.downloads_reset_time: datetime | None = None
-        self._lock = asyncio.Lock()
-        self.last_update = datetime.now()
-        self._consecutive_429s = 0
-
-        self.requests_per_second = 5
-        self.tokens = float(self.requests_per_second)
+    """
+    RateLimiter at the OpenSubtitles rate, which also tracks the account's
+    download quota. The rate adapts AIMD style: it grows by `alpha` per
+    success and is cut by `beta` when the server pushes back.
+    """
+
+    # OpenSubtitles allows 5 requests per second
+    max_rate: float = 5
+    min_rate: float = 1
+    alpha: float = 0.5
+    beta: float = 0.5
+    requests_per_second: float = max_rate
+
+    user_downloads_remaining: int | None = None
+    downloads_reset_time: datetime | None = None
+
+    # Pause when a response reports this little left of the current window
+    low_remaining: int = 2
+    low_remaining_ratio: float = 0.10
+    _paused_until: float | None = None
 
     def update_download_quota(self, login_response: dict[str, dict[str, str]]) -> None:
         self.user_downloads_remaining = int(login_response["user"]["allowed_downloads"])
@@ -91,39 +241,110 @@ class OpenSubtitlesRateLimiter(RateLimiter):
             "Updated download quota", remaining_downloads=self.user_downloads_remaining
         )
 
-    async def acquire(self, endpoint: str = "") -> None:
-        """Acquire rate limit token"""
-        async with self._lock:
-            # Check download quota first
-            # await self.check_download_quota(endpoint)
+    def handle_success(self) -> None:
+        super().handle_success()
+        self.requests_per_second = min(
+            self.max_rate, self.requests_per_second + self.alpha
+        )
 
-            now = datetime.now()
-            time_passed = (now - self.last_update).total_seconds()
+    def handle_429(self, retry_after: float | None = None) -> Any:
+        self.handle_overload()
+        return super().handle_429(retry_after)
 
-            self.tokens = min(
-                self.requests_per_second,
-                self.tokens + time_passed * self.requests_per_second,
+    def handle_overload(self) -> None:
+        """Back the rate off after a 429 or a server error"""
+        self.requests_per_second = max(
+            self.min_rate, self.requests_per_second * self.beta
+        )
+        log.info(
+            "Reduced OpenSubtitles rate",
+            requests_per_second=self.requests_per_second,
+        )
+
+    def observe_headers(self, headers: Mapping[str, str]) -> None:
+        """
+        Follow the server's RateLimit headers, pausing new requests until the
+        window resets once it is nearly used up. Runs in the client's thread.
+        """
+        remaining = _header_seconds(headers, "RateLimit-Remaining")
+        if remaining is None:
+            return
+
+        limit = _header_seconds(headers, "RateLimit-Limit")
+        if remaining > self.low_remaining and not (
+            limit and remaining / limit < self.low_remaining_ratio
+        ):
+            return
+
+        reset = _header_seconds(headers, "RateLimit-Reset") or 1.0
+        paused_until = time.monotonic() + reset
+        if self._paused_until is None or self._paused_until < paused_until:
+            self._paused_until = paused_until
+            log.info(
+                "OpenSubtitles rate limit nearly reached, pausing",
+                remaining=remaining,
+                limit=limit,
+                pause_seconds=reset,
             )
 
-            if self.tokens < 1:
-                wait_time = (1 - self.tokens) / self.requests_per_second
-                await asyncio.sleep(wait_time)
-                self.tokens = 1
+    def record_download(self, remaining: int | None) -> None:
+        """Take the download quota from a download response"""
+        self.user_downloads_remaining = remaining
+        log.info("Download quota updated", remaining_downloads=remaining)
 
-            self.tokens -= 1
-            self.last_update = now
+    async def acquire(self) -> None:
+        """Acquire rate limit token"""
+        if self._paused_until is not None:
+            pause = self._paused_until - time.monotonic()
+            if pause > 0:
+                await asyncio.sleep(pause)
 
-            if "/download" in endpoint and self.user_downloads_remaining is not None:
-                self.user_downloads_remaining -= 1
-                log.info(
-                    "Download quota updated",
-                    remaining_downloads=self.user_downloads_remaining,
-                )
+        # The bucket reserves the caller's slot before sleeping, so waiting
+        # callers don't hold up the ones that still have capacity
+        await super().acquire()
+
+
+@dataclass
+class _RetryBudget:
+    """
+    Retries shared by every request of a client. Successes earn a fraction of
+    a retry back, so a degraded API drains the budget and requests fail fast
+    instead of multiplying the load on it.
+    """
+
+    capacity: float = 10.0
+    refund: float = 0.1
+    tokens: float = capacity
+
+    def record_success(self) -> None:
+        self.tokens = min(self.capacity, self.tokens + self.refund)
+
+    def try_spend(self) -> bool:
+        """Take one retry, returning False when none are left."""
+        if self.tokens < 1.0:
+            return False
+        self.tokens -= 1.0
+        return True
 
 
 class OpenSubtitlesService:
     """Service for interacting with OpenSubtitles API"""
 
+    _instance: "OpenSubtitlesService | None" = None
+    _instance_lock = threading.Lock()
+
+    @classmethod
+    def get_instance(cls) -> "OpenSubtitlesService":
+        """
+        The process-wide service, so every download in a worker shares its
+        token, rate limiter and retry budget.
+        """
+        if not cls._instance:
+            with cls._instance_lock:
+                if not cls._instance:
+                    cls._instance = cls()
+        return cls._instance
+
     def __init__(self) -> None:
         self.client = CustomOpenSubtitlesClient(
             api_key=SUBTITLE_AUTH_SETTINGS["OPENSUBTITLES_API_KEY"],
@@ -131,74 +352,96 @@ class OpenSubtitlesService:
         )
 
         self.rate_limiter = OpenSubtitlesRateLimiter()
-        self.rate_limiter.update_download_quota(
-            self.client.login(
-                SUBTITLE_AUTH_SETTINGS["OPENSUBTITLES_USERNAME"],
-                SUBTITLE_AUTH_SETTINGS["OPENSUBTITLES_PASSWORD"],
-            )
-        )
-        self._token: str | None = None
+        self._retry_budget = _RetryBudget()
+        self.client.on_response = self.rate_limiter.observe_headers
+        # Logins run on the worker threads, so the first request's login is
+        # guarded with a thread lock rather than an event loop one
+        self._login_lock = threading.Lock()
         self.downloads_remaining: int | None = None
 
-    async def _get_user_token(self) -> str | None:
-        """Get user token if credentials are configured"""
-        log.debug("Getting user token")
-        if ("OPENSUBTITLES_USERNAME" in SUBTITLE_AUTH_SETTINGS) and (
-            "OPENSUBTITLES_PASSWORD" in SUBTITLE_AUTH_SETTINGS
-        ):
-            try:
-                login_result = await asyncio.to_thread(
-                    self.client.login,
-                    SUBTITLE_AUTH_SETTINGS.get("OPENSUBTITLES_USERNAME"),
-                    SUBTITLE_AUTH_SETTINGS.get("OPENSUBTITLES_PASSWORD"),
-                )
-                self._token = login_result["token"]
-                self.token = login_result["token"]
+    @staticmethod
+    def _credentials() -> tuple[str, str]:
+        return (
+            SUBTITLE_AUTH_SETTINGS["OPENSUBTITLES_USERNAME"],
+            SUBTITLE_AUTH_SETTINGS["OPENSUBTITLES_PASSWORD"],
+        )
 
-                # Update rate limiter with download quota
-                self.rate_limiter.handle_success()
-                return str(login_result["token"])
-            except Exception as e:
-                log.error("OpenSubtitles user login failed", error=str(e))
-                return None
-        return None
+    def _login(self) -> None:
+        """Use the account's cached token, logging in only without one"""
+        with self._login_lock:
+            if self.client.token:
+                return
+
+            username, password = self._credentials()
+            token = load_token(username, password)
+            if token is None:
+                log.debug("Logging in to OpenSubtitles")
+                login_response = self.client.login(username, password)
+                self.rate_limiter.update_download_quota(login_response)
+                token = login_response["token"]
+                store_token(username, password, token)
+
+            self.client.token = token
+
+    def _forget_token(self) -> None:
+        invalidate_token(*self._credentials())
+        self.client.token = None
+
+    async def ensure_authenticated(self) -> None:
+        """Log in on first use, sharing the token with other workers"""
+        if not self.client.token:
+            await _run_blocking(self._login)
 
     async def _make_request(
         self, func: Callable[..., Any], *args: Any, endpoint: str = "", **kwargs: Any
     ) -> Any:
         """Make rate-limited request to OpenSubtitles with auth"""
         # TODO: Rate limiting only applies for calls to /download and /infos/user endpoints
-        max_retries = 1
+        max_retries = 3
         attempt = 0
 
         log.debug(
             "Making OpenSubtitles request",
             function=func.__name__,
+            endpoint=endpoint,
             args=args,
             kwargs=kwargs,
         )
         while attempt < max_retries:
+            await self.ensure_authenticated()
             try:
-                await self.rate_limiter.acquire(endpoint=endpoint)
+                await self.rate_limiter.acquire()
 
-                result = await asyncio.to_thread(func, *args, **kwargs)
+                result = await _run_blocking(func, *args, **kwargs)
 
                 self.rate_limiter.handle_success()
+                self._retry_budget.record_success()
                 log.debug("OpenSubtitles request successful", function=func.__name__)
                 return result
 
             except Exception as e:
-                if getattr(e, "status_code", None) == 429:
-                    backoff = self.rate_limiter.handle_429()
-                    if attempt < max_retries - 1:
+                status_code = getattr(e, "status_code", None)
+                if status_code == 401 and attempt < max_retries - 1:
+                    # The cached token expired or was revoked, log in again
+                    log.warning("OpenSubtitles token rejected, logging in again")
+                    self._forget_token()
+                    attempt += 1
+                    continue
+                if status_code == 429:
+                    backoff = self.rate_limiter.handle_429(
+                        retry_after=getattr(e, "retry_after", None)
+                    )
+                    if attempt < max_retries - 1 and self._retry_budget.try_spend():
+                        # The next acquire() waits out the backoff
                         log.warning(
                             "Rate limit hit, backing off",
                             backoff_seconds=backoff,
                             attempt=attempt + 1,
                         )
-                        await asyncio.sleep(backoff)
                         attempt += 1
                         continue
+                elif status_code is not None and status_code >= 500:
+                    self.rate_limiter.handle_overload()
 
                 log.error(
                     "OpenSubtitles request failed",
@@ -209,7 +452,13 @@ class OpenSubtitlesService:
                     exc_info=True,
                 )
 
-                if attempt == max_retries - 1:
+                if attempt == max_retries - 1 or not _is_retryable(e):
+                    raise
+                if not self._retry_budget.try_spend():
+                    log.warning(
+                        "OpenSubtitles retry budget exhausted, not retrying",
+                        function=func.__name__,
+                    )
                     raise
 
                 attempt += 1
@@ -317,17 +566,18 @@ class OpenSubtitlesService:
 
             # return sorted(subtitle_infos, key=lambda x: x.quality_score, reverse=True)
 
-    async def download_subtitle(self, file_id: str) -> tuple[BytesIO, str]:
+    async def download_subtitle(self, file_id: str) -> tuple[IO[bytes], str]:
         """Download subtitle content with proper cleanup"""
         log.info("Downloading subtitle", file_id=file_id)
 
-        content = BytesIO()
+        content: IO[bytes] | None = None
         try:
-            raw_content, download_info = await self._make_request(
+            content, download_info = await self._make_request(
                 self.client.download, file_id, endpoint="/download"
             )
-            content.write(raw_content)
-            content.seek(0)
+            # Counted by the server, and a cached token skips the login
+            # that reports the quota
+            self.rate_limiter.record_download(download_info.remaining)
             format = download_info.file_name.split(".")[-1].lower()
             if format not in MovieSubtitle.SubtitleFormat.values:
                 format = "srt"  # Default to SRT if unknown
@@ -336,13 +586,14 @@ class OpenSubtitlesService:
                 "Subtitle download completed",
                 file_id=file_id,
                 format=format,
-                size=content.tell(),
+                size=os.fstat(content.fileno()).st_size,
             )
 
             return content, format
 
         except Exception as e:
-            content.close()  # Ensure content is closed on error
+            if content is not None:
+                content.close()  # Ensure content is closed on error
             log.error(
                 "Subtitle download failed", file_id=file_id, error=str(e), exc_info=True
             )
@@ -350,7 +601,7 @@ class OpenSubtitlesService:
 
     async def search_and_download(
         self, tmdb_id: int, language: str
-    ) -> tuple[BytesIO, str, SubtitleMetadata]:
+    ) -> tuple[IO[bytes], str, SubtitleMetadata]:
         """Search for best subtitle and download it"""
         log.info(
             "Searching and downloading subtitle", tmdb_id=tmdb_id, language=language
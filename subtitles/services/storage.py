@@ -1,10 +1,9 @@
 import hashlib
-import os
 from io import BytesIO
 import structlog
 from django.db import transaction
 from django.core.files import File
-from tempfile import NamedTemporaryFile
+from typing import IO
 
 from TMDB.models import Movie
 from ..models import MovieSubtitle
@@ -16,9 +15,12 @@ log: structlog.BoundLogger = structlog.get_logger(__name__)
 class SubtitleStorageService:
     """Service for storing and retrieving subtitle files"""
 
-    def _compute_hash(self, content: BytesIO) -> str:
+    def _compute_hash(self, content: IO[bytes]) -> str:
         """Compute SHA-256 hash of content"""
-        return hashlib.sha256(content.getvalue()).hexdigest()
+        # file_digest hashes a BytesIO's buffer in place and reads files
+        # straight into a preallocated buffer, without the GIL
+        content.seek(0)
+        return hashlib.file_digest(content, "sha256").hexdigest()
 
     def _generate_file_path(
         self,
@@ -34,7 +36,7 @@ class SubtitleStorageService:
     def store_subtitle(
         self,
         movie: Movie,
-        subtitle_content: BytesIO,
+        subtitle_content: IO[bytes],
         metadata: SubtitleMetadata,
         subtitle_format: str,
     ) -> MovieSubtitle:
@@ -74,22 +76,12 @@ class SubtitleStorageService:
                     quality_score=self._calculate_quality_score(metadata),
                 )
 
-                # Use context manager for temporary file
-                with NamedTemporaryFile(
-                    delete=False, suffix=f".{subtitle_format}"
-                ) as temp_file:
-                    # Write content to temporary file
-                    subtitle_content.seek(0)
-                    temp_file.write(subtitle_content.getvalue())
-                    temp_file.flush()
-
-                    # Save to S3 using Django's File
-                    with open(temp_file.name, "rb") as f:
-                        subtitle.subtitle_file.save(file_path, File(f), save=True)
-
-                # Clean up temporary file
-                if os.path.exists(temp_file.name):
-                    os.unlink(temp_file.name)
+                # Save to S3 using Django's File, straight from the
+                # downloaded file or upload buffer
+                subtitle_content.seek(0)
+                subtitle.subtitle_file.save(
+                    file_path, File(subtitle_content), save=True
+                )
 
                 log.info(
                     "Subtitle stored successfully",
@@ -1,6 +1,8 @@
+import asyncio
 import structlog
 
 from asgiref.sync import sync_to_async
+from collections.abc import Iterable
 from django.db.models import QuerySet, OuterRef, Exists
 from typing import Any
 
@@ -16,7 +18,7 @@ class SubtitleDownloadService:
     """Service for finding movies without subtitles and downloading them"""
 
     def __init__(self) -> None:
-        self.subtitle_service = OpenSubtitlesService()
+        self.subtitle_service = OpenSubtitlesService.get_instance()
         self.storage_service = SubtitleStorageService()
 
     def get_movies_without_subtitles(
@@ -102,3 +104,37 @@ class SubtitleDownloadService:
             )
 
             return {"status": "error", "movie_id": movie.id, "error": str(e)}
+
+    async def download_many(
+        self, movies: Iterable[Movie], language: str = "en", concurrency: int = 4
+    ) -> list[dict[str, Any]]:
+        """
+        Download and save subtitles for several movies concurrently.
+
+        Args:
+            movies: Movies to download subtitles for
+            language: Language code for subtitles
+            concurrency: Most movies in flight at once, API calls are still
+                paced by the OpenSubtitles rate limiter
+
+        Returns:
+            One download_and_save_subtitles result per movie, in input order
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def download(movie: Movie) -> dict[str, Any]:
+            async with semaphore:
+                return await self.download_and_save_subtitles(movie, language)
+
+        movies = list(movies)
+        results = await asyncio.gather(
+            *(download(movie) for movie in movies), return_exceptions=True
+        )
+        return [
+            (
+                {"status": "error", "movie_id": movie.id, "error": str(result)}
+                if isinstance(result, BaseException)
+                else result
+            )
+            for movie, result in zip(movies, results)
+        ]
@@ -9,6 +9,7 @@ from django.db import models
 
 from subtitles.models import MovieSubtitle
 from language_analysis.analysis import LanguageAnalysisService
+from language_analysis.processor.schema import LinguisticProfile
 from subtitles.services.storage import SubtitleStorageService
 from subtitles.utils import fetch_subtitle_content
 
@@ -17,6 +18,21 @@ log: structlog.BoundLogger = structlog.get_logger(__name__)
 MAX_PROCESSING_ATTEMPTS = 10
 PROCESSING_TIMEOUT = timedelta(hours=1)
 
+# Columns the processing steps read, the rest of the movie row (search
+# vectors, overview, ...) and the subtitle metadata stay in the database
+UNPROCESSED_SUBTITLE_FIELDS = (
+    "id",
+    "version",
+    "language",
+    "content_hash",
+    "processing_attempts",
+    "movie",
+    "movie__tmdb_id",
+    "movie__title",
+    "movie__difficulty",
+    "movie__updated_at",
+)
+
 
 class SubtitleProcessor:
     """Service for processing unprocessed subtitles"""
@@ -30,11 +46,13 @@ class SubtitleProcessor:
         self,
         limit: int | None = None,
         batch_size: int = 30,
+        ids: list[int] | None = None,
     ) -> list[MovieSubtitle]:
         """
         Get subtitles that need processing, with proper locking to prevent duplicate processing.
 
         Uses SELECT FOR UPDATE SKIP LOCKED to ensure only one worker processes each subtitle.
+        When ids is given only those subtitles are claimed, if they still need processing.
         """
         log.info("Fetching unprocessed subtitles", limit=limit)
 
@@ -49,7 +67,10 @@ class SubtitleProcessor:
 
                 queryset = (
                     MovieSubtitle.objects.select_related("movie")
-                    .select_for_update(skip_locked=True)
+                    # Lock only the subtitles, a movie being synced shouldn't
+                    # hide its subtitle from the workers
+                    .select_for_update(skip_locked=True, of=("self",))
+                    .only(*UNPROCESSED_SUBTITLE_FIELDS)
                     .filter(
                         Q(is_active=True),
                         Q(
@@ -72,6 +93,9 @@ class SubtitleProcessor:
                     .order_by("-movie__vote_count", "processing_attempts", "created_at")
                 )
 
+                if ids is not None:
+                    queryset = queryset.filter(id__in=ids)
+
                 if limit:
                     queryset = queryset[:limit]
                 else:
@@ -99,25 +123,7 @@ class SubtitleProcessor:
     def process_subtitle(self, subtitle: MovieSubtitle) -> dict[str, Any]:
         """Process a single subtitle with timing metrics and status tracking"""
         start_time = time.time()
-        log.info(
-            "Starting subtitle processing",
-            subtitle_id=subtitle.id,
-            movie_id=subtitle.movie.id,
-            movie_title=subtitle.movie.title,
-            language=subtitle.language,
-            attempt=subtitle.processing_attempts,
-        )
-
-        processing_metrics = {
-            "subtitle_id": subtitle.id,
-            "movie_id": subtitle.movie.id,
-            "movie_title": subtitle.movie.title,
-            "language": subtitle.language,
-            "started_at": datetime.now(),
-            "text_length": 0,
-            "processing_time": 0,
-            "status": "failed",
-        }
+        processing_metrics = self._start_metrics(subtitle)
 
         try:
             # Fetch and process subtitle
@@ -133,59 +139,223 @@ class SubtitleProcessor:
             process_end = time.time()
             processing_metrics["processing_time"] = process_end - process_start
 
-            # Store analysis results
-            self.language_service.store_analysis_result(
-                movie=subtitle.movie,
-                subtitle=subtitle,
-                linguistic_analysis=linguistic_analysis,
+            return self._store_result(
+                subtitle, linguistic_analysis, processing_metrics, start_time
             )
 
-            # Update subtitle status
-            self._mark_processed(subtitle)
+        except Exception as e:
+            return self._record_failure(subtitle, e, processing_metrics, start_time)
+
+    def process_subtitles(self, subtitles: list[MovieSubtitle]) -> list[dict[str, Any]]:
+        """
+        Process a batch of subtitles, analysing all of their texts in a single
+        pipeline call. Falls back to one text at a time if the batch fails so
+        a bad subtitle only fails itself. Content that was analysed before is
+        stored again without running the pipeline.
+        """
+        start_time = time.time()
+        results: list[dict[str, Any]] = []
+        fetched: list[tuple[MovieSubtitle, dict[str, Any], str]] = []
+        analysed: list[tuple[MovieSubtitle, dict[str, Any], LinguisticProfile]] = []
 
-            processing_metrics["status"] = "success"
-            processing_metrics["completed_at"] = datetime.now()
-            processing_metrics["total_time"] = time.time() - start_time
+        stored_analyses = self.language_service.find_stored_analyses(
+            [subtitle.content_hash for subtitle in subtitles]
+        )
 
-            log.info(
-                "Processed subtitle successfully",
-                subtitle_id=subtitle.id,
-                movie_id=subtitle.movie.id,
-                processing_metrics=processing_metrics,
-            )
+        for subtitle in subtitles:
+            processing_metrics = self._start_metrics(subtitle)
 
-            return processing_metrics
+            stored_analysis = stored_analyses.get(subtitle.content_hash)
+            if stored_analysis is not None:
+                processing_metrics["reused_analysis"] = True
+                analysed.append((subtitle, processing_metrics, stored_analysis))
+                continue
 
+            try:
+                subtitle_text = fetch_subtitle_content(subtitle, self.storage_service)
+            except Exception as e:
+                results.append(
+                    self._record_failure(subtitle, e, processing_metrics, start_time)
+                )
+                continue
+            processing_metrics["text_length"] = len(subtitle_text)
+            fetched.append((subtitle, processing_metrics, subtitle_text))
+
+        if fetched:
+            analysed.extend(self._analyse_fetched(fetched, results, start_time))
+
+        if not analysed:
+            return results
+
+        try:
+            self.language_service.store_analysis_results(
+                [
+                    (subtitle.movie, linguistic_analysis, subtitle)
+                    for subtitle, _, linguistic_analysis in analysed
+                ],
+                mark_processed=True,
+            )
         except Exception as e:
-            processing_metrics["error"] = str(e)
-            processing_metrics["completed_at"] = datetime.now()
-            processing_metrics["total_time"] = time.time() - start_time
+            log.warning(
+                "Batch store failed, storing subtitles one by one",
+                batch_size=len(analysed),
+                error=str(e),
+            )
+            for subtitle, processing_metrics, linguistic_analysis in analysed:
+                try:
+                    results.append(
+                        self._store_result(
+                            subtitle, linguistic_analysis, processing_metrics, start_time
+                        )
+                    )
+                except Exception as subtitle_error:
+                    results.append(
+                        self._record_failure(
+                            subtitle, subtitle_error, processing_metrics, start_time
+                        )
+                    )
+            return results
 
-            # Update failure status
-            self._mark_failed(subtitle, str(e))
+        results.extend(
+            self._record_success(subtitle, processing_metrics, start_time)
+            for subtitle, processing_metrics, _ in analysed
+        )
+        return results
 
-            log.error(
-                "Failed to process subtitle",
-                subtitle_id=subtitle.id,
-                movie_id=subtitle.movie.id,
+    def _analyse_fetched(
+        self,
+        fetched: list[tuple[MovieSubtitle, dict[str, Any], str]],
+        results: list[dict[str, Any]],
+        start_time: float,
+    ) -> list[tuple[MovieSubtitle, dict[str, Any], LinguisticProfile]]:
+        """
+        Analyse the fetched texts in one pipeline call, or one by one if that
+        fails. Subtitles that fail on their own are recorded in results.
+        """
+        try:
+            process_start = time.time()
+            analyses = self.language_service.process_texts(
+                [subtitle_text for _, _, subtitle_text in fetched],
+                media_type="movie",
+            )
+            processing_time = time.time() - process_start
+        except Exception as e:
+            log.warning(
+                "Batch analysis failed, processing subtitles one by one",
+                batch_size=len(fetched),
                 error=str(e),
-                processing_metrics=processing_metrics,
-                exc_info=True,
             )
-            return processing_metrics
+            analysed = []
+            for subtitle, processing_metrics, subtitle_text in fetched:
+                try:
+                    process_start = time.time()
+                    linguistic_analysis = self.language_service.process_text(
+                        text=subtitle_text,
+                        media_type="movie",
+                        original_language=subtitle.language,
+                    )
+                    processing_metrics["processing_time"] = time.time() - process_start
+                    analysed.append((subtitle, processing_metrics, linguistic_analysis))
+                except Exception as subtitle_error:
+                    results.append(
+                        self._record_failure(
+                            subtitle, subtitle_error, processing_metrics, start_time
+                        )
+                    )
+            return analysed
 
-    def _mark_processed(self, subtitle: MovieSubtitle) -> None:
-        """Mark subtitle as successfully processed"""
-        subtitle.refresh_from_db()
-        subtitle.processing_status = MovieSubtitle.ProcessingStatus.PROCESSED
-        subtitle.processed_at = timezone.now()
-        subtitle.save(update_fields=["processing_status", "processed_at"])
+        for _, processing_metrics, _ in fetched:
+            # The texts were analysed together, each shares the batch time
+            processing_metrics["processing_time"] = processing_time
+            processing_metrics["batch_size"] = len(fetched)
+
+        return [
+            (subtitle, processing_metrics, linguistic_analysis)
+            for (subtitle, processing_metrics, _), linguistic_analysis in zip(
+                fetched, analyses
+            )
+        ]
 
+    def _start_metrics(self, subtitle: MovieSubtitle) -> dict[str, Any]:
         log.info(
-            "Marked subtitle as processed",
+            "Starting subtitle processing",
             subtitle_id=subtitle.id,
-            processing_status=MovieSubtitle.ProcessingStatus.PROCESSED,
+            movie_id=subtitle.movie.id,
+            movie_title=subtitle.movie.title,
+            language=subtitle.language,
+            attempt=subtitle.processing_attempts,
+        )
+
+        return {
+            "subtitle_id": subtitle.id,
+            "movie_id": subtitle.movie.id,
+            "movie_title": subtitle.movie.title,
+            "language": subtitle.language,
+            "started_at": datetime.now(),
+            "text_length": 0,
+            "processing_time": 0,
+            "status": "failed",
+        }
+
+    def _store_result(
+        self,
+        subtitle: MovieSubtitle,
+        linguistic_analysis: LinguisticProfile,
+        processing_metrics: dict[str, Any],
+        start_time: float,
+    ) -> dict[str, Any]:
+        """Store the analysis and mark the subtitle processed"""
+        self.language_service.store_analysis_result(
+            movie=subtitle.movie,
+            subtitle=subtitle,
+            linguistic_analysis=linguistic_analysis,
+            mark_processed=True,
+        )
+        return self._record_success(subtitle, processing_metrics, start_time)
+
+    def _record_success(
+        self,
+        subtitle: MovieSubtitle,
+        processing_metrics: dict[str, Any],
+        start_time: float,
+    ) -> dict[str, Any]:
+        # The subtitle was marked processed along with its stored analysis
+        processing_metrics["status"] = "success"
+        processing_metrics["completed_at"] = datetime.now()
+        processing_metrics["total_time"] = time.time() - start_time
+
+        log.info(
+            "Processed subtitle successfully",
+            subtitle_id=subtitle.id,
+            movie_id=subtitle.movie.id,
+            processing_metrics=processing_metrics,
+        )
+
+        return processing_metrics
+
+    def _record_failure(
+        self,
+        subtitle: MovieSubtitle,
+        error: Exception,
+        processing_metrics: dict[str, Any],
+        start_time: float,
+    ) -> dict[str, Any]:
+        processing_metrics["error"] = str(error)
+        processing_metrics["completed_at"] = datetime.now()
+        processing_metrics["total_time"] = time.time() - start_time
+
+        # Update failure status
+        self._mark_failed(subtitle, str(error))
+
+        log.error(
+            "Failed to process subtitle",
+            subtitle_id=subtitle.id,
+            movie_id=subtitle.movie.id,
+            error=str(error),
+            processing_metrics=processing_metrics,
+            exc_info=True,
         )
+        return processing_metrics
 
     def _mark_failed(self, subtitle: MovieSubtitle, error: str) -> None:
         """Mark subtitle as failed with error message"""
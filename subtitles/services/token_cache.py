@@ -0,0 +1,26 @@
+import hashlib
+
+from django.core.cache import cache
+
+# OpenSubtitles login tokens last a day, stop using them a little before
+TOKEN_TTL = 23 * 60 * 60
+
+
+def _cache_key(username: str, password: str) -> str:
+    account = hashlib.sha256(f"{username}:{password}".encode()).hexdigest()[:16]
+    return f"opensubtitles:token:{account}"
+
+
+def load_token(username: str, password: str) -> str | None:
+    """The account's cached login token, if it hasn't expired"""
+    token: str | None = cache.get(_cache_key(username, password))
+    return token
+
+
+def store_token(username: str, password: str, token: str, ttl: int = TOKEN_TTL) -> None:
+    cache.set(_cache_key(username, password), token, ttl)
+
+
+def invalidate_token(username: str, password: str) -> None:
+    """Forget a token the API has rejected"""
+    cache.delete(_cache_key(username, password))
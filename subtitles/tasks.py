@@ -92,44 +92,24 @@ async def _download_missing_subtitles(
             target_downloads=max_downloads,
         )
 
-        # Continue until we hit our target successful downloads or run out of movies
-        for movie in movies:
-            if stats["successful"] is not None and stats["successful"] >= max_downloads:
-                log.info(
-                    "Reached target successful downloads",
-                    successful=stats["successful"],
-                    target=max_downloads,
-                )
-                break
+        # The movies are already capped at max_downloads, fetch them together
+        results = await service.download_many(movies, language=language)
 
+        for movie, result in zip(movies, results):
             stats["total_attempted"] += 1
 
-            try:
-                result = await service.download_and_save_subtitles(
-                    movie=movie, language=language
-                )
-
-                if result["status"] == "success":
-                    stats["successful"] += 1
-                    log.info(
-                        "Successful download",
-                        movie_id=movie.id,
-                        successful_count=stats["successful"],
-                        target=max_downloads,
-                    )
-                else:
-                    stats["failed"] += 1
-                    if "No subtitles found" in result.get("error", ""):
-                        stats["no_subtitles_found"] += 1
-
-            except Exception as e:
-                stats["failed"] += 1
-                log.error(
-                    "Failed to process movie",
+            if result["status"] == "success":
+                stats["successful"] += 1
+                log.info(
+                    "Successful download",
                     movie_id=movie.id,
-                    error=str(e),
-                    exc_info=True,
+                    successful_count=stats["successful"],
+                    target=max_downloads,
                 )
+            else:
+                stats["failed"] += 1
+                if "No subtitles found" in result.get("error", ""):
+                    stats["no_subtitles_found"] += 1
 
         stats["completed_at"] = datetime.now().timestamp()
         duration = datetime.fromtimestamp(stats["completed_at"] - stats["started_at"])
@@ -1,17 +1,22 @@
 from asgiref.sync import async_to_sync
 
-from TMDB.models import Movie
 from subtitles.models import MovieSubtitle
 from subtitles.services.storage import SubtitleStorageService
 
 
-def get_active_subtitle(movie: Movie) -> MovieSubtitle:
-    """Retrieve the active, unprocessed subtitle for the given movie."""
-    subtitle = MovieSubtitle.objects.filter(
-        movie=movie, is_active=True, subtitle_is_processed=False
-    ).first()
+def get_active_subtitle(tmdb_id: str) -> MovieSubtitle:
+    """
+    Retrieve the active, unprocessed subtitle for the given movie, with the
+    movie loaded in the same query.
+    """
+    subtitle = (
+        MovieSubtitle.objects.select_related("movie")
+        .filter(movie__tmdb_id=tmdb_id, is_active=True)
+        .exclude(processing_status=MovieSubtitle.ProcessingStatus.PROCESSED)
+        .first()
+    )
     if not subtitle:
-        raise ValueError(f"No active subtitles found for movie ID {movie.tmdb_id}")
+        raise ValueError(f"No active subtitles found for movie ID {tmdb_id}")
     return subtitle
 
 
@@ -20,11 +25,7 @@ def fetch_subtitle_content(
 ) -> str:
     """Fetch the raw subtitle content from storage."""
     subtitle_content = async_to_sync(storage_service.get_subtitle)(subtitle.id)
-    return subtitle_content.getvalue().decode("utf-8")
+    # Decode straight from the buffer instead of a bytes copy of it
+    with subtitle_content, subtitle_content.getbuffer() as content:
+        return str(content, "utf-8")
 
-
-def mark_subtitle_as_processed(subtitle: MovieSubtitle) -> bool:
-    """Mark the subtitle as processed."""
-    subtitle.subtitle_is_processed = True
-    subtitle.save()
-    return subtitle.subtitle_is_processed
@@ -54,7 +54,7 @@ def list_movies_needing_subtitles(
         processed_subtitles = MovieSubtitle.objects.filter(
             movie=OuterRef("pk"),
             language=language,
-            subtitle_is_processed=True,
+            processing_status=MovieSubtitle.ProcessingStatus.PROCESSED,
             is_active=True,
         )
 
@@ -219,7 +219,7 @@ async def sync_movie_subtitle_debug(
             language=language,
         )
 
-        client = OpenSubtitlesService()
+        client = OpenSubtitlesService.get_instance()
         storage = SubtitleStorageService()
 
         movie = await Movie.objects.aget(tmdb_id=movie_id)
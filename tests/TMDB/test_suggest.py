@@ -4,6 +4,19 @@ from tests.factories import MovieFactory
 from TMDB.models import Movie
 from ninja.testing import TestClient
 from TMDB.v1.api import router
+from TMDB.services.movie_search import (
+    SEARCH_POPULAR_STATEMENT,
+    SEARCH_STATEMENT,
+    HybridMovieSearch,
+    _search_cache,
+)
+from unittest.mock import patch
+
+
+@pytest.fixture(autouse=True)
+def clear_search_cache():
+    # Cached results would leak between tests that reuse a query
+    _search_cache.clear()
 
 
 @pytest.fixture
@@ -162,3 +175,62 @@ class TestMediaSuggestAPI:
         assert (
             len(data["media"]) >= min_expected
         ), f"Should find at least {min_expected} matches for '{query}'"
+
+
+def _search(query):
+    """Search titles and the prepared statements that ran, in order."""
+    with patch.object(
+        HybridMovieSearch,
+        "_execute_statement",
+        wraps=HybridMovieSearch._execute_statement,
+    ) as execute:
+        titles = [movie["title"] for movie in HybridMovieSearch.search(query)["media"]]
+    return titles, [call.args[1] for call in execute.call_args_list]
+
+
+@pytest.mark.django_db
+class TestHybridMovieSearch:
+    def test_short_query_matches_fuzzily_across_the_whole_table(self):
+        """Short queries rank by trigram similarity, so typos still match"""
+        MovieFactory(tmdb_id=1, with_title="Dog Run", vote_count=5)
+
+        titles, statements = _search("dog rnu")
+
+        assert titles == ["Dog Run"]
+        assert statements == [SEARCH_STATEMENT]
+
+    def test_long_query_needs_word_matches(self):
+        """Long queries don't match on a few shared trigrams"""
+        MovieFactory(tmdb_id=1, with_title="Dog Run", vote_count=5000)
+
+        titles, statements = _search("dogg runn")
+
+        assert titles == []
+        assert statements == [SEARCH_POPULAR_STATEMENT, SEARCH_STATEMENT]
+
+    def test_full_page_of_strong_popular_matches_skips_whole_table(self):
+        """No unpopular title could outrank the page, so it is returned as is"""
+        for part in range(HybridMovieSearch.MAX_RESULTS):
+            MovieFactory(
+                tmdb_id=part + 1,
+                with_title=f"Running Dogs Part {part + 1}",
+                vote_count=10000,
+            )
+
+        titles, statements = _search("running dogs")
+
+        assert len(titles) == HybridMovieSearch.MAX_RESULTS
+        assert statements == [SEARCH_POPULAR_STATEMENT]
+
+    def test_unpopular_exact_match_beats_weak_popular_matches(self):
+        """A full page of weak popular matches still falls back to the table"""
+        for part in range(HybridMovieSearch.MAX_RESULTS):
+            MovieFactory(
+                tmdb_id=part + 1, with_title=f"Dog Run {part + 1}", vote_count=50
+            )
+        MovieFactory(tmdb_id=100, with_title="Running Dogs", vote_count=20)
+
+        titles, statements = _search("running dogs")
+
+        assert titles[0] == "Running Dogs"
+        assert statements == [SEARCH_POPULAR_STATEMENT, SEARCH_STATEMENT]
@@ -0,0 +1,38 @@
+import pytest
+
+from tests.factories import MovieFactory
+from TMDB.models import Movie
+from TMDB.schema import TMDBMovieResponse
+from TMDB.tasks import copy_movies, upsert_movies
+
+
+def _movie_response(tmdb_id: int, title: str) -> TMDBMovieResponse:
+    return TMDBMovieResponse(
+        id=tmdb_id,
+        title=title,
+        original_title=title,
+        overview="",
+        vote_average=7.0,
+        vote_count=100,
+        original_language="en",
+    )
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("save_movies", [upsert_movies, copy_movies])
+def test_save_movies_updates_existing_and_keeps_last_duplicate(save_movies):
+    MovieFactory(tmdb_id=1, with_title="Old Title", vote_count=5)
+
+    save_movies(
+        [
+            _movie_response(1, "New Title"),
+            _movie_response(2, "First Page"),
+            _movie_response(2, "Second Page"),
+        ],
+        "en",
+    )
+
+    movies = dict(Movie.objects.values_list("tmdb_id", "title"))
+    assert movies == {1: "New Title", 2: "Second Page"}
+    assert Movie.objects.get(tmdb_id=1).vote_count == 100
+    assert Movie.objects.get(tmdb_id=2).difficulty == 0.0
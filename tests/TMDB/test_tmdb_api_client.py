@@ -5,9 +5,16 @@ from typing import Dict, Any
 from TMDB.services.tmdb_service import (
     TMDBService,
     TMDBRequestError,
+    _details_cache,
 )
 
 
+@pytest.fixture(autouse=True)  # type: ignore
+def clear_details_cache() -> None:
+    # Every test serves the same movie id
+    _details_cache.clear()
+
+
 @pytest.fixture  # type: ignore
 def api_key() -> str:
     return "Any_Key"
@@ -41,7 +48,7 @@ class TestTMDBClient:
     """Test suite for TMDBClient."""
 
     @pytest.mark.asyncio  # type: ignore
-    @patch("aiohttp.ClientSession.request")
+    @patch("aiohttp.ClientSession.request", new_callable=AsyncMock)
     async def test_get_movies_by_year(
         self,
         mock_request: AsyncMock,
@@ -53,7 +60,7 @@ class TestTMDBClient:
         mock_response = AsyncMock()
         mock_response.status = 200
         mock_response.json = AsyncMock(side_effect=[movie_list_response, movie_data])
-        mock_request.return_value.__aenter__.return_value = mock_response
+        mock_request.return_value = mock_response
 
         client = TMDBService(api_key=api_key)
         movies = []
@@ -65,7 +72,7 @@ class TestTMDBClient:
         assert movies[0].title == movie_data["title"]
 
     @pytest.mark.asyncio  # type: ignore
-    @patch("aiohttp.ClientSession.request")
+    @patch("aiohttp.ClientSession.request", new_callable=AsyncMock)
     async def test_empty_responses(self, mock_request: AsyncMock, api_key: str) -> None:
         """Test handling of empty response data."""
         mock_response = AsyncMock()
@@ -78,7 +85,7 @@ class TestTMDBClient:
                 "total_results": 0,
             }
         )
-        mock_request.return_value.__aenter__.return_value = mock_response
+        mock_request.return_value = mock_response
 
         client = TMDBService(api_key=api_key)
         movies = []
@@ -89,7 +96,7 @@ class TestTMDBClient:
         assert client.stats.processed_movies == 0
 
     @pytest.mark.asyncio  # type: ignore
-    @patch("aiohttp.ClientSession.request")
+    @patch("aiohttp.ClientSession.request", new_callable=AsyncMock)
     async def test_movie_details(
         self, mock_request: AsyncMock, api_key: str, movie_data: Dict[str, Any]
     ) -> None:
@@ -97,7 +104,7 @@ class TestTMDBClient:
         mock_response = AsyncMock()
         mock_response.status = 200
         mock_response.json = AsyncMock(return_value=movie_data)
-        mock_request.return_value.__aenter__.return_value = mock_response
+        mock_request.return_value = mock_response
 
         client = TMDBService(api_key=api_key)
         movie = await client.get_movie_details(550)
@@ -106,7 +113,7 @@ class TestTMDBClient:
         assert movie.title == movie_data["title"]
 
     @pytest.mark.asyncio  # type: ignore
-    @patch("aiohttp.ClientSession.request")
+    @patch("aiohttp.ClientSession.request", new_callable=AsyncMock)
     async def test_invalid_release_dates(
         self, mock_request: AsyncMock, api_key: str, movie_data: Dict[str, Any]
     ) -> None:
@@ -127,7 +134,7 @@ class TestTMDBClient:
                 invalid_data,
             ]
         )
-        mock_request.return_value.__aenter__.return_value = mock_response
+        mock_request.return_value = mock_response
 
         client = TMDBService(api_key=api_key)
         with pytest.raises(TMDBRequestError):
@@ -135,7 +142,7 @@ class TestTMDBClient:
                 pass
 
     @pytest.mark.asyncio  # type: ignore
-    @patch("aiohttp.ClientSession.request")
+    @patch("aiohttp.ClientSession.request", new_callable=AsyncMock)
     async def test_pagination(
         self, mock_request: AsyncMock, api_key: str, movie_data: Dict[str, Any]
     ) -> None:
@@ -161,7 +168,7 @@ class TestTMDBClient:
                 movie_data,
             ]
         )
-        mock_request.return_value.__aenter__.return_value = mock_response
+        mock_request.return_value = mock_response
 
         client = TMDBService(api_key=api_key)
         movies = []
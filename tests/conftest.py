@@ -7,18 +7,32 @@ from .factories import (
     MovieSubtitleFactory,
 )
 from django.core.files.uploadedfile import SimpleUploadedFile
-from django.db import connection
+from django.db import connections
+from django.db.models.signals import pre_migrate
 
 register(MediaAnalysisResultFactory)
 register(MovieFactory)
 register(MovieSubtitleFactory)
 
-@pytest.fixture(scope='session', autouse=True)
-def setup_test_database(django_db_blocker):
-    with django_db_blocker.unblock():
-        with connection.cursor() as cursor:
-            cursor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm;')
-            cursor.execute('CREATE EXTENSION IF NOT EXISTS unaccent;')
+def create_search_functions(using, **kwargs):
+    """
+    Create the extensions and function the Movie search columns and indexes
+    need. With --no-migrations the test tables are built straight from the
+    models, right after pre_migrate, so this runs on the test database
+    before they are.
+    """
+    with connections[using].cursor() as cursor:
+        cursor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm;')
+        cursor.execute('CREATE EXTENSION IF NOT EXISTS unaccent;')
+        # Mirrors TMDB migration 0024, Movie.title_norm depends on it
+        cursor.execute(
+            "CREATE OR REPLACE FUNCTION immutable_unaccent(text) RETURNS text "
+            "AS $$ SELECT public.unaccent('public.unaccent'::regdictionary, $1) $$ "
+            "LANGUAGE sql IMMUTABLE PARALLEL SAFE STRICT;"
+        )
+
+
+pre_migrate.connect(create_search_functions, dispatch_uid="tests.search_functions")
 
 @pytest.fixture
 def subtitle_file():
@@ -67,4 +81,9 @@ def media_analysis_result(db, media_analysis_result_factory):
 
 @pytest.fixture
 def language_analysis_service(mocker):
-    return mocker.patch("language_analysis.v1.api.LanguageAnalysisService")
\ No newline at end of file
+    from language_analysis.v1.api import _language_service
+
+    # The endpoints share one cached service, rebuild it from the mock
+    _language_service.cache_clear()
+    yield mocker.patch("language_analysis.v1.api.LanguageAnalysisService")
+    _language_service.cache_clear()
\ No newline at end of file
@@ -1,6 +1,6 @@
 import factory
 from django.utils import timezone
-from TMDB.models import Movie
+from TMDB.models import Language, Movie
 from subtitles.models import MovieSubtitle
 from language_analysis.models import MediaAnalysisResult
 from factory.django import DjangoModelFactory
@@ -18,6 +18,14 @@ class TimeStampedFactory(DjangoModelFactory):
     created_at = factory.LazyFunction(timezone.now)
     updated_at = factory.LazyFunction(timezone.now)
 
+class LanguageFactory(DjangoModelFactory):
+    class Meta:
+        model = Language
+        django_get_or_create = ("code",)
+
+    code = "en"
+
+
 # Factory for Movie
 class MovieFactory(TimeStampedFactory):
 
@@ -43,14 +51,14 @@ class MovieFactory(TimeStampedFactory):
     latest_analysis_id = factory.LazyAttribute(lambda x: random.randint(1, 100000))
     title = factory.Faker("sentence", nb_words=3)
     original_title = factory.Faker("sentence", nb_words=3)
-    language = factory.LazyAttribute(lambda x: "en")
-    original_language = factory.LazyAttribute(lambda x: "en")
+    language = factory.SubFactory(LanguageFactory)
+    original_language = factory.SubFactory(LanguageFactory)
     release_date = factory.LazyFunction(lambda: timezone.now().date())
     genres = factory.LazyFunction(lambda: GenreList([factory.Faker("word") for _ in range(3)]))
     runtime = factory.Faker("random_int", min=60, max=180)
     overview = factory.Faker("text", max_nb_chars=200)
-    poster_url = factory.Faker("url")
-    backdrop_url = factory.Faker("url")
+    poster_path = factory.Faker("file_path", depth=1, extension="jpg")
+    backdrop_path = factory.Faker("file_path", depth=1, extension="jpg")
     vote_average = factory.LazyAttribute(lambda x: round(random.uniform(0, 10), 1))
     vote_count = factory.Faker("random_int", min=0, max=1000)
     difficulty = factory.LazyAttribute(lambda x: round(random.uniform(0, 10), 1))
@@ -84,7 +92,6 @@ class MovieSubtitleFactory(TimeStampedFactory):
     processing_attempts = factory.Faker("random_int", min=0, max=10)  
     last_processing_attempt = factory.Faker("date_time_this_year", before_now=True)  
     processed_at = factory.Faker("date_time_this_year", after_now=True)  
-    subtitle_is_processed = factory.Faker("boolean", chance_of_getting_true=50) 
 
 
 
@@ -107,7 +114,6 @@ class MediaAnalysisResultFactory(TimeStampedFactory):
     processing_attempts = factory.Faker("random_int", min=0, max=10)
     last_processing_attempt = factory.Faker("date_time_this_year", before_now=True) 
     processed_at = factory.Faker("date_time_this_year", after_now=True)
-    subtitle_is_processed = factory.Faker("boolean", chance_of_getting_true=50) 
 
 # Factory for MediaAnalysisResult
 # class MediaAnalysisResultFactory(DjangoModelFactory):
@@ -3,6 +3,7 @@ from unittest.mock import patch
 from tqdm import asyncio
 from language_analysis.analysis import LanguageAnalysisService
 from language_analysis.models import MediaAnalysisResult
+from language_analysis.processor.processor import ANALYSIS_VERSION
 from language_analysis.processor.schema import (
     LinguisticProfile,
     ConceptOccurrence,
@@ -10,6 +11,7 @@ from language_analysis.processor.schema import (
     ConceptType,
     NumberAndRatio,
 )
+from subtitles.models import MovieSubtitle
 
 
 
@@ -134,4 +136,76 @@ class TestLanguageAnalysisService:
         assert false_result_1.is_latest is False
         assert result_2.is_latest is True
 
-  
\ No newline at end of file
+  
+
+    @pytest.mark.django_db
+    def test_store_analysis_results_bulk_marks_previous_as_not_latest(
+        self, linguistic_analysis_profile, movie, subtitle
+    ):
+        '''Batch store keeps only the newest result per movie as latest'''
+
+        # Arrange
+        service = LanguageAnalysisService()
+        previous = service.store_analysis_result(
+            movie, linguistic_analysis_profile, subtitle
+        )
+
+        # Act
+        results = service.store_analysis_results(
+            [
+                (movie, linguistic_analysis_profile, subtitle),
+                (movie, linguistic_analysis_profile, subtitle),
+            ]
+        )
+
+        # Assert
+        previous.refresh_from_db()
+        movie.refresh_from_db()
+        assert previous.is_latest is False
+        assert [result.is_latest for result in results] == [False, True]
+        assert MediaAnalysisResult.objects.filter(
+            movie=movie, is_latest=True
+        ).get() == results[-1]
+        assert movie.difficulty == linguistic_analysis_profile.difficulty
+
+    @pytest.mark.django_db
+    def test_store_analysis_results_marks_subtitles_processed(
+        self, linguistic_analysis_profile, movie, subtitle
+    ):
+        '''Batch store with mark_processed marks the subtitles with their results'''
+
+        # Arrange
+        service = LanguageAnalysisService()
+
+        # Act
+        service.store_analysis_results(
+            [(movie, linguistic_analysis_profile, subtitle)], mark_processed=True
+        )
+
+        # Assert
+        subtitle.refresh_from_db()
+        assert subtitle.processing_status == MovieSubtitle.ProcessingStatus.PROCESSED
+        assert subtitle.processed_at is not None
+
+
+    @pytest.mark.django_db
+    def test_find_stored_analyses_returns_current_version_by_content_hash(
+        self, linguistic_analysis_profile, movie, subtitle
+    ):
+        '''Stored analyses are found by subtitle content hash, for the current version only'''
+
+        # Arrange
+        service = LanguageAnalysisService()
+        service.store_analysis_result(movie, linguistic_analysis_profile, subtitle)
+        current_profile = linguistic_analysis_profile.model_copy(
+            update={"analysis_version": ANALYSIS_VERSION}
+        )
+
+        # Act
+        outdated = service.find_stored_analyses([subtitle.content_hash])
+        service.store_analysis_result(movie, current_profile, subtitle)
+        stored = service.find_stored_analyses([subtitle.content_hash])
+
+        # Assert
+        assert outdated == {}
+        assert stored == {subtitle.content_hash: current_profile}
@@ -1,6 +1,7 @@
+import asyncio
 import time
 import pytest
-from ninja.testing import TestClient
+from ninja.testing import TestAsyncClient
 from language_analysis.v1.api import router
 from language_analysis.schemas import ProcessTextRequest
 from language_analysis.processor.schema import (
@@ -18,9 +19,10 @@ class TestProcessLanguageEndpoint:
 
     @pytest.fixture
     def client(self):
-        return TestClient(router)
+        return TestAsyncClient(router)
     
-    def test_process_text_success(self, client: TestClient, language_analysis_service):
+    @pytest.mark.asyncio
+    async def test_process_text_success(self, client: TestAsyncClient, language_analysis_service):
         # Arrange
         mock_analysis = LinguisticProfile(
             analysis_version="1.0",
@@ -60,7 +62,7 @@ class TestProcessLanguageEndpoint:
         )
 
         # Act
-        response = client.post("/process", json=payload.dict())
+        response = await client.post("/process", json=payload.dict())
 
         # Assert
         assert response.status_code == 200
@@ -77,7 +79,8 @@ class TestProcessLanguageEndpoint:
         )
 
 
-    def test_process_text_empty_input(self, client: TestClient, language_analysis_service):
+    @pytest.mark.asyncio
+    async def test_process_text_empty_input(self, client: TestAsyncClient, language_analysis_service):
 
         # Act
         with pytest.raises(ValueError) as exc_info:
@@ -86,14 +89,15 @@ class TestProcessLanguageEndpoint:
             type="movie",
             original_language="en",
         )
-            client.post("/process", json=payload.dict())
+            await client.post("/process", json=payload.dict())
 
         # Assert
         language_analysis_service.return_value.process_text.assert_not_called()
 
 
 
-    def test_process_text_unsupported_media_type(self, client: TestClient, language_analysis_service):
+    @pytest.mark.asyncio
+    async def test_process_text_unsupported_media_type(self, client: TestAsyncClient, language_analysis_service):
         # Arrange
         language_analysis_service.return_value.process_text.side_effect = ValueError(
             "Unsupported media type"
@@ -107,7 +111,7 @@ class TestProcessLanguageEndpoint:
 
         # Act
         with pytest.raises(RESTError):
-            response = client.post("/process", json=payload.dict())
+            response = await client.post("/process", json=payload.dict())
 
             # Assert
             assert response.status_code == 500
@@ -120,7 +124,8 @@ class TestProcessLanguageEndpoint:
         )
 
 
-    def test_process_text_long_input(self, client: TestClient, language_analysis_service):
+    @pytest.mark.asyncio
+    async def test_process_text_long_input(self, client: TestAsyncClient, language_analysis_service):
         # Arrange
         long_text = "This is a very long text. " * 10000  # 250,000 characters
         linguistic_profile = LinguisticProfile(
@@ -143,7 +148,7 @@ class TestProcessLanguageEndpoint:
 
         # Act
         start_time = time.time()
-        response = client.post("/process", json=payload.dict())
+        response = await client.post("/process", json=payload.dict())
         end_time = time.time()
 
         # Assert
@@ -165,7 +170,8 @@ class TestProcessLanguageEndpoint:
         )
 
 
-    def test_process_text_multiple_languages(self, client: TestClient, language_analysis_service):
+    @pytest.mark.asyncio
+    async def test_process_text_multiple_languages(self, client: TestAsyncClient, language_analysis_service):
         # Arrange
         linguistic_profile = LinguisticProfile(
             analysis_version="1.1",
@@ -233,7 +239,7 @@ class TestProcessLanguageEndpoint:
         )
 
         # Act
-        response = client.post("/process", json=payload.dict())
+        response = await client.post("/process", json=payload.dict())
 
         # Assert
         assert response.status_code == 200
@@ -253,7 +259,8 @@ class TestProcessLanguageEndpoint:
         )
 
 
-    def test_process_text_special_characters(self, client: TestClient, language_analysis_service):
+    @pytest.mark.asyncio
+    async def test_process_text_special_characters(self, client: TestAsyncClient, language_analysis_service):
         # Arrange
         linguistic_profile = LinguisticProfile(
             analysis_version="1.0",
@@ -293,7 +300,7 @@ class TestProcessLanguageEndpoint:
         )
 
         # Act
-        response = client.post("/process", json=payload.dict())
+        response = await client.post("/process", json=payload.dict())
 
         # Assert
         assert response.status_code == 200
@@ -309,7 +316,8 @@ class TestProcessLanguageEndpoint:
         )
 
 
-    def test_process_text_consistency(self, client: TestClient, language_analysis_service):
+    @pytest.mark.asyncio
+    async def test_process_text_consistency(self, client: TestAsyncClient, language_analysis_service):
         # Arrange
         linguistic_profile = LinguisticProfile(
             analysis_version="1.0",
@@ -349,9 +357,9 @@ class TestProcessLanguageEndpoint:
         )
 
         # Act
-        response1 = client.post("/process", json=payload.dict())
-        response2 = client.post("/process", json=payload.dict())
-        response3 = client.post("/process", json=payload.dict())
+        response1 = await client.post("/process", json=payload.dict())
+        response2 = await client.post("/process", json=payload.dict())
+        response3 = await client.post("/process", json=payload.dict())
 
         # Assert
         assert response1.status_code == 200
@@ -372,7 +380,8 @@ class TestProcessLanguageEndpoint:
         )
 
 
-    def test_process_text_high_difficulty(self, client: TestClient, language_analysis_service):
+    @pytest.mark.asyncio
+    async def test_process_text_high_difficulty(self, client: TestAsyncClient, language_analysis_service):
         # Arrange
         linguistic_profile = LinguisticProfile(
             analysis_version="1.0",
@@ -412,7 +421,7 @@ class TestProcessLanguageEndpoint:
         )
 
         # Act
-        response = client.post("/process", json=payload.dict())
+        response = await client.post("/process", json=payload.dict())
 
         # Assert
         assert response.status_code == 200
@@ -431,7 +440,8 @@ class TestProcessLanguageEndpoint:
         )
 
 
-    def test_process_text_concurrent_requests(self,client: TestClient, language_analysis_service):
+    @pytest.mark.asyncio
+    async def test_process_text_concurrent_requests(self, client: TestAsyncClient, language_analysis_service):
         # Arrange
         num_requests = 10
         linguistic_profile = LinguisticProfile(
@@ -454,9 +464,9 @@ class TestProcessLanguageEndpoint:
 
         # Act
         start_time = time.time()
-        responses = [
-            client.post("/process", json=payload.dict()) for _ in range(num_requests)
-        ]
+        responses = await asyncio.gather(
+            *(client.post("/process", json=payload.dict()) for _ in range(num_requests))
+        )
         end_time = time.time()
 
         # Assert
@@ -16,7 +16,7 @@ from subtitles.schemas import (
     SubtitleDownloadRequest,
 )
 
-from TMDB.models import Movie
+from TMDB.models import Language, Movie
 
 import asyncio
 from datetime import datetime
@@ -38,14 +38,14 @@ class TestListMoviesNeedingSubtitles(TestCase):
             latest_analysis_id=None,
             title="The Matrix",
             original_title="The Matrix",
-            language="en",
-            original_language="en",
+            language_id=Language.get_id("en"),
+            original_language_id=Language.get_id("en"),
             release_date=date(1999, 3, 31),
             genres=["Action", "Sci-Fi"],
             runtime=136,
             overview="A computer hacker learns from mysterious rebels about the true nature of his reality and his role in the war against its controllers.",
-            poster_url="https://example.com/poster/matrix.jpg",
-            backdrop_url="https://example.com/backdrop/matrix.jpg",
+            poster_path="/poster/matrix.jpg",
+            backdrop_path="/backdrop/matrix.jpg",
             vote_average=8.7,
             vote_count=15000,
             difficulty=0.7,
@@ -57,14 +57,14 @@ class TestListMoviesNeedingSubtitles(TestCase):
             latest_analysis_id=None,
             title="Interstellar",
             original_title="Interstellar",
-            language="en",
-            original_language="en",
+            language_id=Language.get_id("en"),
+            original_language_id=Language.get_id("en"),
             release_date=date(2014, 11, 7),
             genres=["Adventure", "Drama", "Sci-Fi"],
             runtime=169,
             overview="A team of explorers travel through a wormhole in space in an attempt to ensure humanity's survival.",
-            poster_url="https://example.com/poster/interstellar.jpg",
-            backdrop_url="https://example.com/backdrop/interstellar.jpg",
+            poster_path="/poster/interstellar.jpg",
+            backdrop_path="/backdrop/interstellar.jpg",
             vote_average=8.6,
             vote_count=18000,
             difficulty=0.6,
@@ -73,7 +73,7 @@ class TestListMoviesNeedingSubtitles(TestCase):
 
         # Create a subtitle for one movie
         MovieSubtitle.objects.create(
-            movie=movie_1, language="en", subtitle_is_processed=True, is_active=True
+            movie=movie_1, language="en", processing_status=MovieSubtitle.ProcessingStatus.PROCESSED, is_active=True
         )
 
         # Make the request
@@ -97,14 +97,14 @@ class TestListMoviesNeedingSubtitles(TestCase):
             latest_analysis_id=None,
             title="Inception",
             original_title="Inception",
-            language="en",
-            original_language="en",
+            language_id=Language.get_id("en"),
+            original_language_id=Language.get_id("en"),
             release_date=date(2010, 7, 16),
             genres=["Action", "Sci-Fi", "Thriller"],
             runtime=148,
             overview="A thief who steals corporate secrets through the use of dream-sharing technology is given the inverse task of planting an idea into the mind of a CEO.",
-            poster_url="https://example.com/poster/inception.jpg",
-            backdrop_url="https://example.com/backdrop/inception.jpg",
+            poster_path="/poster/inception.jpg",
+            backdrop_path="/backdrop/inception.jpg",
             vote_average=8.8,
             vote_count=20000,
             difficulty=0.5,
@@ -116,14 +116,14 @@ class TestListMoviesNeedingSubtitles(TestCase):
             latest_analysis_id=None,
             title="The Matrix",
             original_title="The Matrix",
-            language="en",
-            original_language="en",
+            language_id=Language.get_id("en"),
+            original_language_id=Language.get_id("en"),
             release_date=date(1999, 3, 31),
             genres=["Action", "Sci-Fi"],
             runtime=136,
             overview="A computer hacker learns from mysterious rebels about the true nature of his reality and his role in the war against its controllers.",
-            poster_url="https://example.com/poster/matrix.jpg",
-            backdrop_url="https://example.com/backdrop/matrix.jpg",
+            poster_path="/poster/matrix.jpg",
+            backdrop_path="/backdrop/matrix.jpg",
             vote_average=8.7,
             vote_count=15000,
             difficulty=0.7,
@@ -135,14 +135,14 @@ class TestListMoviesNeedingSubtitles(TestCase):
             latest_analysis_id=None,
             title="Interstellar",
             original_title="Interstellar",
-            language="en",
-            original_language="en",
+            language_id=Language.get_id("en"),
+            original_language_id=Language.get_id("en"),
             release_date=date(2014, 11, 7),
             genres=["Adventure", "Drama", "Sci-Fi"],
             runtime=169,
             overview="A team of explorers travel through a wormhole in space in an attempt to ensure humanity's survival.",
-            poster_url="https://example.com/poster/interstellar.jpg",
-            backdrop_url="https://example.com/backdrop/interstellar.jpg",
+            poster_path="/poster/interstellar.jpg",
+            backdrop_path="/backdrop/interstellar.jpg",
             vote_average=8.6,
             vote_count=18000,
             difficulty=0.6,
@@ -151,13 +151,13 @@ class TestListMoviesNeedingSubtitles(TestCase):
 
         # Create processed subtitles for all movies
         MovieSubtitle.objects.create(
-            movie=movie_1, language="en", subtitle_is_processed=True, is_active=True
+            movie=movie_1, language="en", processing_status=MovieSubtitle.ProcessingStatus.PROCESSED, is_active=True
         )
         MovieSubtitle.objects.create(
-            movie=movie_2, language="en", subtitle_is_processed=True, is_active=True
+            movie=movie_2, language="en", processing_status=MovieSubtitle.ProcessingStatus.PROCESSED, is_active=True
         )
         MovieSubtitle.objects.create(
-            movie=movie_3, language="en", subtitle_is_processed=True, is_active=True
+            movie=movie_3, language="en", processing_status=MovieSubtitle.ProcessingStatus.PROCESSED, is_active=True
         )
 
         # Make the request
@@ -184,14 +184,14 @@ class TestListMoviesNeedingSubtitles(TestCase):
                 latest_analysis_id=None,
                 title="Interstellar",
                 original_title=f"Movie {i}",
-                language="en",
-                original_language="en",
+                language_id=Language.get_id("en"),
+                original_language_id=Language.get_id("en"),
                 release_date=f"2023-01-{i:02d}",
                 genres=["Adventure", "Drama", "Sci-Fi"],
                 runtime=150 + i,
                 overview="A team of explorers travel through a wormhole in space in an attempt to ensure humanity's survival.",
-                poster_url="https://example.com/poster/interstellar.jpg",
-                backdrop_url="https://example.com/backdrop/interstellar.jpg",
+                poster_path="/poster/interstellar.jpg",
+                backdrop_path="/backdrop/interstellar.jpg",
                 vote_average=8.6,
                 vote_count=18000,
                 difficulty=0.6,
@@ -201,7 +201,7 @@ class TestListMoviesNeedingSubtitles(TestCase):
         # Create subtitles for some movies
         for i in range(1, 6):
             MovieSubtitle.objects.create(
-                movie_id=i, language="en", subtitle_is_processed=True, is_active=True
+                movie_id=i, language="en", processing_status=MovieSubtitle.ProcessingStatus.PROCESSED, is_active=True
             )
 
         # Make the first page request
@@ -2,7 +2,7 @@ from datetime import date
 import pytest
 from unittest.mock import MagicMock, AsyncMock, patch
 from django.test import TestCase
-from TMDB.models import Movie
+from TMDB.models import Language, Movie
 from subtitles.models import MovieSubtitle
 
 
@@ -34,14 +34,14 @@ class TestSubtitleDownloadService(TestCase):
             latest_analysis_id=None,
             title="The Matrix",
             original_title="The Matrix",
-            language="en",
-            original_language="en",
+            language_id=Language.get_id("en"),
+            original_language_id=Language.get_id("en"),
             release_date=date(1999, 3, 31),
             genres=["Action", "Sci-Fi"],
             runtime=136,
             overview="A computer hacker learns from mysterious rebels about the true nature of his reality and his role in the war against its controllers.",
-            poster_url="https://example.com/poster/matrix.jpg",
-            backdrop_url="https://example.com/backdrop/matrix.jpg",
+            poster_path="/poster/matrix.jpg",
+            backdrop_path="/backdrop/matrix.jpg",
             vote_average=8.7,
             vote_count=15000,
             difficulty=0.7,
@@ -131,4 +131,29 @@ class TestSubtitleDownloadService(TestCase):
 
         # Assertions
         self.assertEqual(result["status"], "error")
-        self.assertEqual(result["movie_id"], movie.id)
\ No newline at end of file
+        self.assertEqual(result["movie_id"], movie.id)
+
+@pytest.mark.asyncio
+@patch("subtitles.services.subtitle_download.SubtitleStorageService")
+@patch("subtitles.services.subtitle_download.OpenSubtitlesService")
+async def test_download_many_keeps_movie_order(
+    MockOpenSubtitlesService, MockSubtitleStorageService
+):
+    """Should return one result per movie in input order, even when one raises"""
+    from subtitles.services.subtitle_download import SubtitleDownloadService
+
+    service = SubtitleDownloadService()
+    movies = [Movie(id=1), Movie(id=2), Movie(id=3)]
+
+    async def download(movie, language):
+        if movie.id == 2:
+            raise RuntimeError("Download failed")
+        return {"status": "success", "movie_id": movie.id, "subtitle_id": movie.id}
+
+    service.download_and_save_subtitles = AsyncMock(side_effect=download)
+
+    results = await service.download_many(movies, language="en", concurrency=2)
+
+    assert [result["movie_id"] for result in results] == [1, 2, 3]
+    assert [result["status"] for result in results] == ["success", "error", "success"]
+    assert results[1]["error"] == "Download failed"
@@ -1,13 +1,26 @@
 import logging
 import time
 import pytest
-from unittest.mock import AsyncMock, MagicMock, Mock
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 from io import BytesIO
 from datetime import datetime
 
-from subtitles.services.opensubtitle import OpenSubtitlesService
+import requests
+
+from subtitles.services.opensubtitle import (
+    DOWNLOAD_TIMEOUT,
+    OpenSubtitlesFetchError,
+    OpenSubtitlesHTTPError,
+    OpenSubtitlesRateLimiter,
+    OpenSubtitlesService,
+    _is_retryable,
+    _RetryBudget,
+)
 from subtitles.schemas import SubtitleFile, SubtitleSearchResponse, SubtitleMetadata, UploaderInfo, FeatureDetails
 from subtitles.services.subtitle_scoring import SubtitleQualityScorer
+from subtitles.services.token_cache import load_token, store_token
+
+LOCMEM_CACHE = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
 
 
 @pytest.fixture
@@ -15,6 +28,18 @@ def open_subtitles_service():
     return OpenSubtitlesService()
 
 
+@pytest.fixture
+def locmem_cache(settings):
+    """A local cache for the token, emptied around each test"""
+    from django.core.cache import cache
+
+    settings.CACHES = LOCMEM_CACHE
+    # LocMemCache entries are module-global, they outlive the settings swap
+    cache.clear()
+    yield cache
+    cache.clear()
+
+
 @pytest.mark.asyncio
 async def test_search_and_download(open_subtitles_service):
     '''Should successfully find and download the best subtitle for a valid TMDB ID and language'''
@@ -271,3 +296,177 @@ async def test_search_and_download_performance(open_subtitles_service):
     open_subtitles_service.search_subtitles.assert_called_once_with(1000, "en")
     open_subtitles_service.download_subtitle.assert_called_once_with("0")
     scorer.select_best_subtitle.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_ensure_authenticated_reuses_cached_token(open_subtitles_service, locmem_cache):
+    """Should use another worker's cached token instead of logging in"""
+    store_token(*open_subtitles_service._credentials(), "cached-token")
+    open_subtitles_service.client.login = Mock()
+
+    await open_subtitles_service.ensure_authenticated()
+
+    assert open_subtitles_service.client.token == "cached-token"
+    open_subtitles_service.client.login.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_ensure_authenticated_logs_in_and_caches_token(open_subtitles_service, locmem_cache):
+    """Should log in once when no token is cached and share the new token"""
+    open_subtitles_service.client.login = Mock(
+        return_value={"token": "new-token", "user": {"allowed_downloads": 20}}
+    )
+
+    await open_subtitles_service.ensure_authenticated()
+    await open_subtitles_service.ensure_authenticated()
+
+    assert open_subtitles_service.client.token == "new-token"
+    assert load_token(*open_subtitles_service._credentials()) == "new-token"
+    assert open_subtitles_service.rate_limiter.user_downloads_remaining == 20
+    open_subtitles_service.client.login.assert_called_once()
+
+
+def test_failed_file_fetch_is_not_retried(open_subtitles_service):
+    """A dropped connection to the download link must not request a new link"""
+    client = open_subtitles_service.client
+    client.send_api = Mock(return_value={"link": "https://dl.test/1.srt", "remaining": 5})
+
+    with patch(
+        "subtitles.services.opensubtitle.requests.get",
+        side_effect=requests.exceptions.ConnectionError("reset"),
+    ) as get:
+        with pytest.raises(OpenSubtitlesFetchError) as excinfo:
+            client.download("456")
+
+    assert get.call_args.kwargs["timeout"] == DOWNLOAD_TIMEOUT
+    assert isinstance(excinfo.value.__cause__, requests.exceptions.ConnectionError)
+    assert not _is_retryable(excinfo.value)
+
+
+def test_rate_limiter_halves_rate_on_pushback_down_to_min_rate():
+    """429s and server errors cut the rate by beta, never below min_rate"""
+    limiter = OpenSubtitlesRateLimiter()
+
+    limiter.handle_429()
+    assert limiter.requests_per_second == 2.5
+    limiter.handle_overload()
+    assert limiter.requests_per_second == 1.25
+    limiter.handle_overload()
+    limiter.handle_overload()
+    assert limiter.requests_per_second == limiter.min_rate
+
+
+def test_rate_limiter_grows_rate_additively_up_to_max_rate():
+    """Each success adds alpha to the rate, capped at max_rate"""
+    limiter = OpenSubtitlesRateLimiter(requests_per_second=1)
+
+    limiter.handle_success()
+    assert limiter.requests_per_second == 1.5
+    for _ in range(20):
+        limiter.handle_success()
+    assert limiter.requests_per_second == limiter.max_rate
+
+
+def test_rate_limiter_pauses_when_remaining_requests_run_low():
+    """A nearly used up window pauses requests until RateLimit-Reset"""
+    limiter = OpenSubtitlesRateLimiter()
+
+    before = time.monotonic()
+    limiter.observe_headers({"RateLimit-Remaining": "1", "RateLimit-Reset": "3"})
+
+    assert before + 3 <= limiter._paused_until <= time.monotonic() + 3
+
+
+def test_rate_limiter_pauses_below_remaining_ratio():
+    """A small share of a large limit also pauses, by a second without a reset"""
+    limiter = OpenSubtitlesRateLimiter()
+
+    before = time.monotonic()
+    limiter.observe_headers({"RateLimit-Remaining": "5", "RateLimit-Limit": "100"})
+
+    assert before + 1 <= limiter._paused_until <= time.monotonic() + 1
+
+
+def test_rate_limiter_ignores_headers_with_requests_to_spare():
+    limiter = OpenSubtitlesRateLimiter()
+
+    limiter.observe_headers({"RateLimit-Remaining": "30", "RateLimit-Limit": "40"})
+    limiter.observe_headers({})
+
+    assert limiter._paused_until is None
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_acquire_waits_out_the_pause():
+    limiter = OpenSubtitlesRateLimiter()
+    limiter.observe_headers({"RateLimit-Remaining": "0", "RateLimit-Reset": "3"})
+
+    with patch("asyncio.sleep", new_callable=AsyncMock) as sleep:
+        await limiter.acquire()
+
+    pause = sleep.await_args_list[0].args[0]
+    assert 2 < pause <= 3
+
+
+def test_retry_budget_drains_and_refunds_on_success():
+    budget = _RetryBudget(capacity=2, refund=0.5)
+
+    assert budget.try_spend()
+    assert budget.try_spend()
+    assert not budget.try_spend()
+
+    budget.record_success()
+    assert not budget.try_spend()
+    budget.record_success()
+    assert budget.try_spend()
+
+
+@pytest.mark.asyncio
+async def test_make_request_retries_server_errors_within_budget(open_subtitles_service):
+    open_subtitles_service.ensure_authenticated = AsyncMock()
+    request = Mock(
+        __name__="search",
+        side_effect=[OpenSubtitlesHTTPError("unavailable", status_code=503), "ok"],
+    )
+
+    with patch("asyncio.sleep", new_callable=AsyncMock):
+        assert await open_subtitles_service._make_request(request) == "ok"
+
+    assert request.call_count == 2
+    assert open_subtitles_service._retry_budget.tokens == 9.1
+
+
+@pytest.mark.asyncio
+async def test_make_request_fails_fast_once_budget_is_spent(open_subtitles_service):
+    open_subtitles_service.ensure_authenticated = AsyncMock()
+    open_subtitles_service._retry_budget.tokens = 0.5
+    request = Mock(
+        __name__="search",
+        side_effect=OpenSubtitlesHTTPError("unavailable", status_code=503),
+    )
+
+    with patch("asyncio.sleep", new_callable=AsyncMock):
+        with pytest.raises(OpenSubtitlesHTTPError):
+            await open_subtitles_service._make_request(request)
+
+    request.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_make_request_logs_in_once_again_after_401(open_subtitles_service, locmem_cache):
+    """A rejected cached token is dropped and replaced by exactly one login"""
+    store_token(*open_subtitles_service._credentials(), "stale-token")
+    open_subtitles_service.client.login = Mock(
+        return_value={"token": "new-token", "user": {"allowed_downloads": 20}}
+    )
+    request = Mock(
+        __name__="search",
+        side_effect=[OpenSubtitlesHTTPError("unauthorized", status_code=401), "ok"],
+    )
+
+    assert await open_subtitles_service._make_request(request) == "ok"
+
+    open_subtitles_service.client.login.assert_called_once()
+    assert open_subtitles_service.client.token == "new-token"
+    assert load_token(*open_subtitles_service._credentials()) == "new-token"
+    assert request.call_count == 2